@@ -38,9 +38,11 @@ import shutil
 from bs4 import BeautifulSoup
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional
-import difflib
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 import argparse
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import urllib3
 import logging
@@ -53,7 +55,18 @@ repo_root = Path(__file__).parent.parent
 if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
 from downloader_lib.fetch import fetch_section_page, fetch_game_page
-from downloader_lib.parse import parse_games_from_section, resolve_download_form, parse_game_details
+from downloader_lib import parse as bs4_parse, stream_parse
+from downloader_lib.matching import LocalMatchIndex, FuzzyScorer, duplicate_clusters, match_targets, new_match_stats
+from downloader_lib.local_index import LocalTreeScanner, CACHE_FILENAME as LOCAL_INDEX_CACHE
+from downloader_lib.manifest import DownloadManifest
+from downloader_lib import vector_matching
+from downloader_lib.rate_limit import SHARED_BUDGET_PATH, shared_limiter
+from downloader_lib.http_cache import HttpCache
+from downloader_lib.game_pages import parse_game_page, shared_game_pages
+from downloader_lib.catalog_sync import load_console_catalog
+from downloader_lib.resumable import IncompleteDownload, PartialDownload, full_length
+from downloader_lib.segmented import SegmentedDownload
+from downloader_lib.session import DOWNLOAD_POOL_SIZE, shared_session
 
 # Disable SSL warnings
 urllib3.disable_warnings()
@@ -149,13 +162,57 @@ SECTIONS = ['number', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L'
             'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z']
 
 from utils.constants import ROM_EXTENSIONS, ARCHIVE_EXTENSIONS, USER_AGENTS  # centralized constants
-from utils.filenames import clean_filename as util_clean_filename, normalize_for_match as util_normalize_for_match
+from utils.filenames import clean_filename as util_clean_filename, normalize_for_match as util_normalize_for_match, match_key as util_match_key
 
 # Timing configuration (in seconds)
 DELAY_BETWEEN_PAGE_REQUESTS = (1, 2)  # Random delay between list page requests
 DELAY_BETWEEN_DOWNLOADS = (1, 2)      # Random delay between actual downloads
 RETRY_DELAY = 5                      # Delay before retrying failed download
 MAX_RETRIES = 3                       # Maximum number of retry attempts
+REQUESTS_PER_SECOND = 1.0             # Global request budget (all threads); the starting rate when adaptive
+REQUEST_BURST = 3                     # Requests allowed back-to-back before the budget applies
+ADAPTIVE_MIN_RATE = 0.2               # Floor for the adaptive request rate (requests/second)
+ADAPTIVE_MAX_RATE = 4.0               # Ceiling the adaptive rate may climb to on success
+RATE_STATE_FILENAME = '.vimms_rate_state.json'  # Learned request rate, next to vimms_config.json
+FETCH_WORKERS = 4                     # Section lists fetched concurrently
+HTTP_CACHE_DIRNAME = '.vimms_http_cache'  # Vault page cache, next to vimms_config.json (not in the ROM folder)
+HTTP_CACHE_TTL = 3600                 # Seconds a cached page is used without revalidation
+GAME_PAGE_TTL = 300                   # Seconds a parsed game page is shared in memory
+PREFETCH_GAMES = 2                    # Upcoming games whose pages are resolved during a transfer
+DOWNLOAD_SEGMENTS = 4                 # Parallel range requests per .7z download (network.segmented_download)
+SEGMENT_MIN_SIZE_MB = 256             # Smaller files are streamed in one request
+# Remote catalog kept by the web UI (`--catalog`), and how old it may be before crawling live
+REMOTE_CATALOG_PATH = Path(__file__).resolve().parent.parent / 'src' / 'webui_remote_catalog.json'
+CATALOG_MAX_AGE_HOURS = 24
+
+
+def rate_limiter_from_config(net: dict, project_root: Path):
+    """The process-wide request limiter for a `network` config section.
+
+    Adaptive (AIMD) unless `network.adaptive_rate.enabled` is false; the learned
+    rate is kept in `RATE_STATE_FILENAME` under `project_root`. Unless
+    `network.shared_budget` is false the token balance is shared with every other
+    downloader process on the machine (`network.shared_budget_path`, default
+    `rate_limit.SHARED_BUDGET_PATH`).
+    """
+    adaptive_cfg = net.get('adaptive_rate', {}) or {}
+    adaptive = None
+    if adaptive_cfg.get('enabled', True):
+        adaptive = {
+            'min_rate': float(adaptive_cfg.get('min_requests_per_second', ADAPTIVE_MIN_RATE)),
+            'max_rate': float(adaptive_cfg.get('max_requests_per_second', ADAPTIVE_MAX_RATE)),
+        }
+    shared_path = None
+    if net.get('shared_budget', True):
+        shared_path = Path(net.get('shared_budget_path') or SHARED_BUDGET_PATH)
+    return shared_limiter(float(net.get('requests_per_second', REQUESTS_PER_SECOND)),
+                          float(net.get('request_burst', REQUEST_BURST)),
+                          adaptive=adaptive, state_path=Path(project_root) / RATE_STATE_FILENAME,
+                          shared_path=shared_path)
+
+
+# Page parser implementations (`network.html_parser`): BeautifulSoup or streaming stdlib HTMLParser
+HTML_PARSERS = {'bs4': bs4_parse, 'stdlib': stream_parse}
 
 
 class VimmsDownloader:
@@ -176,6 +233,8 @@ class VimmsDownloader:
         self.system = system
         self.progress_file = Path(download_dir) / progress_file
         self.progress = self._load_progress()
+        # Exact game_id -> file record for everything this tool downloads (see downloader_lib/manifest.py)
+        self.manifest = DownloadManifest(self.download_dir)
         # Whether to attempt to detect local copies of ROMs and skip downloads
         self.detect_existing = detect_existing
         # Whether to offer to delete duplicate local files (prompts per-game)
@@ -188,6 +247,10 @@ class VimmsDownloader:
         # Will be populated by `_build_local_index()` when pre_scan is enabled
         self.local_index = None  # type: Optional[Dict[str, List[Path]]]
         self._local_index_keys = None  # cached list of normalized keys
+        self._match_index = None  # type: Optional[LocalMatchIndex]
+        self._vector_index = None  # type: Optional[vector_matching.TrigramVectorIndex]
+        # How many fuzzy candidates each pruning stage rejected (see FuzzyScorer)
+        self.match_stats = new_match_stats()
         # Project root (useful when running scripts from a separate working directory)
         self.project_root = Path(project_root).resolve() if project_root else Path(__file__).parent
 
@@ -242,12 +305,48 @@ class VimmsDownloader:
         self.delay_between_downloads = tuple(net.get('delay_between_downloads', DELAY_BETWEEN_DOWNLOADS))
         self.retry_delay = net.get('retry_delay', RETRY_DELAY)
         self.max_retries = net.get('max_retries', MAX_RETRIES)
+        # Page fetches, metadata lookups and downloads from every thread (and every
+        # downloader in this process) share one token bucket, whose rate adapts to 429s
+        self.fetch_workers = max(1, int(net.get('fetch_workers', FETCH_WORKERS)))
+        self.rate_limiter = rate_limiter_from_config(net, self.project_root)
+        self.html_parser = HTML_PARSERS.get(str(net.get('html_parser', 'bs4')), bs4_parse)
+        # Parsed game pages shared in memory by every downloader in the process
+        self.game_pages = shared_game_pages(float(net.get('game_page_ttl', GAME_PAGE_TTL)))
+        # While a game downloads, resolve the next games' download URLs in the background
+        self.prefetch_games = max(0, int(net.get('prefetch_games', PREFETCH_GAMES)))
+        self._prefetched = set()
+        # Connections per download server; sizes the shared session's download pool
+        self.download_connections = max(1, int(net.get('download_connections', DOWNLOAD_POOL_SIZE)))
+        # Opt-in parallel range requests for large .7z disc images (0 streams every file in one),
+        # never more than the per-host connection budget
+        seg_cfg = net.get('segmented_download', {}) or {}
+        segments = int(seg_cfg.get('segments', DOWNLOAD_SEGMENTS)) if seg_cfg.get('enabled', False) else 0
+        self.download_segments = min(segments, self.download_connections)
+        self.segment_min_bytes = int(float(seg_cfg.get('min_size_mb', SEGMENT_MIN_SIZE_MB)) * 1024 * 1024)
+        # Section lists loaded from the remote catalog (`use_catalog`); None crawls live
+        self.catalog_lists = None  # type: Optional[Dict[str, List[Dict[str, str]]]]
+        # On-disk cache for section list and game pages (`network.http_cache`)
+        cache_cfg = net.get('http_cache', {}) or {}
+        self.http_cache = None
+        if cache_cfg.get('enabled', True):
+            self.http_cache = HttpCache(
+                Path(cache_cfg.get('directory') or self.project_root / HTTP_CACHE_DIRNAME),
+                ttl=float(cache_cfg.get('ttl_seconds', HTTP_CACHE_TTL)),
+                cache_only=bool(cache_cfg.get('cache_only', False)),
+            )
 
         limits = cfg.get('limits', {})
         self.index_max_files = int(limits.get('index_max_files', 20000))
         self.match_threshold = float(limits.get('match_threshold', 0.75))
-
-        self.session = requests.Session()
+        # 'index' (pure Python) or 'vector' (NumPy trigram cosine candidates for bulk matching)
+        self.match_backend = str(limits.get('match_backend', 'index'))
+        # Persist per-directory listings so later runs only rescan changed folders
+        self.persist_local_index = bool(limits.get('persist_local_index', True))
+        # Minimum difflib ratio between two local filenames to treat them as duplicates
+        self.duplicate_threshold = float(limits.get('duplicate_threshold', 0.9))
+
+        # One pooled, retrying session shared by every downloader in the process
+        self.session = shared_session(self.download_connections)
         # Optional override for section ordering (list of section codes, e.g., ['D','L','C'])
         self.section_priority_override = section_priority_override
         # Whether to allow interactive prompts inside the downloader (default False)
@@ -310,12 +409,13 @@ class VimmsDownloader:
         """Delegate to the canonical cleaning utility."""
         return util_clean_filename(filename)
     
-    def _extract_and_cleanup(self, archive_path: Path):
+    def _extract_and_cleanup(self, archive_path: Path, game_id: Optional[str] = None):
         """
         Extract archive contents to the same folder and clean up
         
         Args:
             archive_path: Path to the downloaded archive file
+            game_id: When given, the extracted ROMs replace the archive in the download manifest
         """
         try:
             print(f"  📦 Extracting archive...")
@@ -345,6 +445,13 @@ class VimmsDownloader:
                 return
             
             print(f"  Extracted {len(extracted_files)} file(s)")
+
+            # Record the extracted ROMs; the moves/renames below keep the manifest in step
+            if game_id:
+                extracted_roms = [self.download_dir / n for n in extracted_files
+                                  if Path(n).suffix.lower() in ROM_EXTENSIONS and (self.download_dir / n).is_file()]
+                if extracted_roms:
+                    self.manifest.record(game_id, extracted_roms, self.manifest.games.get(game_id, {}).get('name'))
             
             # Delete the archive
             archive_path.unlink()
@@ -377,6 +484,7 @@ class VimmsDownloader:
                             # Avoid overwriting if file already exists
                             if not dest.exists():
                                 shutil.move(str(rom_file), str(dest))
+                                self.manifest.move(rom_file, dest)
                                 if cleaned_name != rom_file.name:
                                     print(f"  📁 Moved & cleaned: {rom_file.name} → {cleaned_name}")
                                 else:
@@ -399,7 +507,10 @@ class VimmsDownloader:
                         new_path = self.download_dir / cleaned_name
                         if not new_path.exists():
                             item.rename(new_path)
+                            self.manifest.move(item, new_path)
                             print(f"  Cleaned filename: {item.name} -> {cleaned_name}")
+
+            self.manifest.save()
             
         except zipfile.BadZipFile:
             print(f"  WARNING: Archive appears corrupted, keeping file for manual inspection")
@@ -407,17 +518,42 @@ class VimmsDownloader:
             print(f"  WARNING: Extraction error: {e}")
             print(f"     Keeping archive for manual extraction")
     
-    def get_game_list_from_section(self, section: str) -> List[Dict[str, str]]:
+    def use_catalog(self, path: Optional[Path] = None, max_age_hours: float = CATALOG_MAX_AGE_HOURS) -> bool:
+        """List sections from the web UI's remote catalog instead of crawling them.
+
+        Used only when the catalog has lists for this system synced within
+        `max_age_hours`; otherwise sections are crawled live as usual. Sections
+        missing from the catalog are still crawled. Returns whether it is used.
+        """
+        path = Path(path) if path else REMOTE_CATALOG_PATH
+        lists, age = load_console_catalog(path, self.system, max_age_hours * 3600)
+        if lists is None:
+            reason = f"is {age / 3600:.1f}h old (max {max_age_hours:g}h)" if age is not None else f"has no {self.system} lists"
+            print(f"  Catalog {path} {reason}; crawling sections live")
+            return False
+        self.catalog_lists = lists
+        total = sum(len(games) for games in lists.values())
+        print(f"  Using catalog {path} ({total} games, synced {age / 3600:.1f}h ago)")
+        if getattr(self, 'logger', None):
+            self.logger.info(f"Using remote catalog {path}: {total} games, age {age:.0f}s")
+        return True
+
+    def get_game_list_from_section(self, section: str, stop_at: Optional[Callable[[str, List[Dict[str, str]]], bool]] = None) -> List[Dict[str, str]]:
         """
         Get list of games from a specific section (A-Z or number)
         Handles pagination automatically.
         
         Args:
             section: Section identifier (A, B, C, etc., or 'number')
+            stop_at: Optional `stop_at(section, games_on_page)`; returning True stops
+                pagination after that page (catalog delta sync)
             
         Returns:
             List of dictionaries with game info (name, page_url, game_id)
         """
+        if self.catalog_lists is not None and section in self.catalog_lists:
+            return list(self.catalog_lists[section])
+
         games = []
         page_num = 1
         
@@ -425,22 +561,24 @@ class VimmsDownloader:
         
         while True:
             try:
-                response = fetch_section_page(self.session, self.system, section, page_num)
-                games_on_page = parse_games_from_section(response.text, section)
+                response = fetch_section_page(self.session, self.system, section, page_num,
+                                              cache=self.http_cache, limiter=self.rate_limiter)
+                games_on_page, has_next = self.html_parser.parse_section_page(response.text, section)
                 
                 if not games_on_page:
                     break
                 
                 games.extend(games_on_page)
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                next_link = soup.find('a', text=re.compile(r'Next', re.IGNORECASE))
-                if not next_link:
+                if not has_next:
+                    break
+
+                if stop_at is not None and stop_at(section, games_on_page):
+                    print(f"  Page {page_num}: already up to date, stopping")
                     break
 
                 print(f"  Page {page_num}: Found {len(games_on_page)} games")
                 page_num += 1
-                self._random_delay(self.delay_between_page_requests)
                 
             except requests.exceptions.HTTPError as e:
                 # 404 on page 2+ is expected when section has only 1 page
@@ -456,16 +594,56 @@ class VimmsDownloader:
         
         return games
 
+    def iter_section_game_lists(self, sections: Iterable[str], stop_at: Optional[Callable[[str, List[Dict[str, str]]], bool]] = None) -> Iterator[Tuple[str, List[Dict[str, str]]]]:
+        """Yield `(section, games)` for each section, in order, fetching them concurrently.
+
+        Sections are listed by a pool of `network.fetch_workers` threads; every page
+        request still waits for the shared rate limiter, so this only overlaps
+        network latency and never exceeds `network.requests_per_second`. Pages
+        within a section stay sequential (the next page is only known from the
+        previous one). Results are yielded as soon as the next section in order is
+        done, so callers can process section A while later sections download.
+        `stop_at` is passed to `get_game_list_from_section`.
+        """
+        sections = list(sections)
+        list_section = self.get_game_list_from_section
+        if stop_at is not None:
+            list_section = functools.partial(list_section, stop_at=stop_at)
+        if self.fetch_workers <= 1 or len(sections) <= 1:
+            for section in sections:
+                yield section, list_section(section)
+            return
+
+        pool = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        futures = []
+        try:
+            futures = [pool.submit(list_section, section) for section in sections]
+            for section, future in zip(sections, futures):
+                yield section, future.result()
+        finally:
+            # Don't keep fetching if the caller stopped iterating early
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
+
     def _normalize_for_match(self, s: str) -> str:
         """Delegate normalization to shared utility for consistent behavior."""
         return util_normalize_for_match(s)
 
+    def _match_key(self, name: str) -> str:
+        """Comparison key for a title or filename (memoized `_normalize_for_match(_clean_filename(name))`)."""
+        return util_match_key(name)
+
     def _build_local_index(self):
         """Build an in-memory index of local ROM filenames to avoid repeated directory scans.
 
         The index maps a normalized filename (from `_normalize_for_match(_clean_filename(name))`)
         to a list of Path objects that have that normalized key. This is used by
         `find_all_matching_files` and `is_game_present` when present to speed up matching.
+        A `LocalMatchIndex` is built over the keys as well (suffix array for
+        containment, length window and cheap ratio bounds for fuzzy matches), giving
+        the same results as a linear scan with less work per lookup. Folder listings are
+        persisted via `LocalTreeScanner` (disable with `limits.persist_local_index`).
         """
         # Use centralized ROM_EXTENSIONS constant instead of hardcoded list
         from utils.constants import ROM_EXTENSIONS as rom_exts
@@ -477,33 +655,36 @@ class VimmsDownloader:
             # Walk the download directory recursively to capture files stored in
             # subfolders (common for large collections where users keep one folder
             # per game). Limit the total number of files inspected to avoid very
-            # long indexing on huge archives/folders.
+            # long indexing on huge archives/folders. Directory listings (and their
+            # match keys) are cached in `.vimms_local_index`, so only folders whose
+            # mtime changed since the last run are listed again.
             total_checked = 0
-            max_files = 20000
-
-            for root, dirs, files in os.walk(self.download_dir):
+            cache_path = self.download_dir / LOCAL_INDEX_CACHE if self.persist_local_index else None
+            scanner = LocalTreeScanner(
+                self.download_dir,
+                rom_extensions + ['.zip', '.7z'],
+                self._match_key,
+                cache_path=cache_path,
+            )
+
+            for root, dirs, files in scanner.walk():
                 # Index directories by name as well (helps detect per-title folders)
-                for d in dirs:
-                    p = Path(root) / d
-                    key = self._normalize_for_match(self._clean_filename(d))
-                    index.setdefault(key, []).append(p)
+                for d, key in dirs:
+                    index.setdefault(key, []).append(root / d)
 
-                for f in files:
-                    item = Path(root) / f
-                    ext = item.suffix.lower()
+                for f, key in files:
+                    ext = Path(f).suffix.lower()
 
                     # Include archives when we are keeping archives (i.e., not extracting files)
                     if ext in ('.zip', '.7z') and not self.extract_files:
-                        key = self._normalize_for_match(self._clean_filename(item.name))
-                        index.setdefault(key, []).append(item)
+                        index.setdefault(key, []).append(root / f)
                         total_checked += 1
                         if total_checked >= self.index_max_files:
                             break
                         continue
 
                     if ext in rom_extensions:
-                        key = self._normalize_for_match(self._clean_filename(item.name))
-                        index.setdefault(key, []).append(item)
+                        index.setdefault(key, []).append(root / f)
                         total_checked += 1
                         if total_checked >= self.index_max_files:
                             break
@@ -511,16 +692,43 @@ class VimmsDownloader:
                 if total_checked >= self.index_max_files:
                     break
 
+            scanner.save()
+            logger = getattr(self, 'logger', None)
+            if logger:
+                logger.info(f"Local index: {scanner.dirs_scanned} folder(s) scanned, "
+                            f"{scanner.dirs_reused} reused from cache, {total_checked} file(s) indexed")
+
         except Exception:
             # If anything goes wrong building the index, fall back to per-item checks
             self.local_index = None
             self._local_index_keys = None
+            self._match_index = None
             return
 
         self.local_index = index
         self._local_index_keys = list(index.keys())
+        self._match_index = LocalMatchIndex(self._local_index_keys, stats=self.match_stats)
 
 
+    def _get_match_index(self) -> LocalMatchIndex:
+        """Return the `LocalMatchIndex` for the current keys, rebuilding it if they changed."""
+        if self._match_index is None or self._match_index.keys is not self._local_index_keys:
+            self._match_index = LocalMatchIndex(self._local_index_keys, stats=self.match_stats)
+        return self._match_index
+
+    def _get_vector_index(self) -> Optional['vector_matching.TrigramVectorIndex']:
+        """Return the NumPy trigram index when the 'vector' backend is configured and usable."""
+        if self.match_backend != 'vector':
+            return None
+        if not vector_matching.available():
+            if getattr(self, 'logger', None):
+                self.logger.warning("match_backend 'vector' needs numpy; falling back to the built-in index")
+            self.match_backend = 'index'
+            return None
+        if self._vector_index is None or self._vector_index.keys is not self._local_index_keys:
+            self._vector_index = vector_matching.TrigramVectorIndex(self._local_index_keys)
+        return self._vector_index
+
     def is_game_present(self, game_name: str) -> Optional[Path]:
         """Check for a likely local match for `game_name`.
 
@@ -546,25 +754,21 @@ class VimmsDownloader:
             rom_extensions = rom_extensions + list(ARCHIVE_EXTENSIONS)
 
         # Use the cleaned, normalized title as the comparison target
-        target = self._normalize_for_match(self._clean_filename(game_name))
+        target = self._match_key(game_name)
 
         # If we built an index, use it (much faster). Otherwise, fall back to directory scan.
         if self.local_index is not None and self._local_index_keys is not None:
             # Check direct containment against keys first, then fuzzy match
-            for key in self._local_index_keys:
-                if target in key or key in target:
-                    # Return the first file found for this key
-                    return self.local_index[key][0]
-
-            for key in self._local_index_keys:
-                ratio = difflib.SequenceMatcher(None, target, key).ratio()
-                if ratio >= self.match_threshold:
-                    return self.local_index[key][0]
-
-            return None
+            # (containment via the suffix array, fuzzy only within the length window;
+            # first key in index order wins)
+            pos = self._get_match_index().first_match(target, self.match_threshold)
+            if pos is None:
+                return None
+            return self.local_index[self._local_index_keys[pos]][0]
 
         # Fallback: iterate directory (original behavior)
-        target = self._normalize_for_match(self._clean_filename(game_name))
+        target = self._match_key(game_name)
+        scorer = FuzzyScorer(target, self.match_threshold, self.match_stats)
 
         for item in self.download_dir.iterdir():
             if not item.is_file():
@@ -574,15 +778,14 @@ class VimmsDownloader:
                 # Skip non-ROM files (saves, images, etc.)
                 continue
 
-            cand = self._normalize_for_match(self._clean_filename(item.name))
+            cand = self._match_key(item.name)
 
             # Direct substring containment catches simple formatting differences
             if target in cand or cand in target:
                 return item
 
             # Fallback to a fuzzy ratio to handle small title differences
-            ratio = difflib.SequenceMatcher(None, target, cand).ratio()
-            if ratio >= self.match_threshold:
+            if scorer(cand):
                 return item
 
         return None
@@ -592,45 +795,82 @@ class VimmsDownloader:
 
         This uses the same normalization and fuzzy matching logic as
         `is_game_present` but collects all candidates rather than returning
-        the first match.
+        the first match. Use `match_titles` when checking many titles at once.
         """
-        rom_extensions = list(ROM_EXTENSIONS)
-        if not self.extract_files:
-            rom_extensions = rom_extensions + list(ARCHIVE_EXTENSIONS)
+        return self.match_titles([game_name])[game_name]
+
+    def match_titles(self, names: Iterable[str]) -> Dict[str, List[Path]]:
+        """Return local matches for many titles at once, keyed by title.
+
+        Each title is normalized once and identical titles (or titles that
+        normalize to the same target) are resolved only once. With a local index
+        every distinct target is looked up in the `LocalMatchIndex` (containment
+        through its suffix array, `difflib` only for keys whose length can reach
+        the threshold, behind `FuzzyScorer`'s cheap bounds); without one the
+        download directory is listed and normalized a single time for the whole
+        batch instead of once per title. With `limits.match_backend = 'vector'`
+        (and NumPy installed) the fuzzy candidates for all targets come from one
+        vectorized trigram-cosine pass (see `downloader_lib/vector_matching.py`).
+        """
+        targets: Dict[str, str] = {}
+        for name in names:
+            if name not in targets:
+                targets[name] = self._match_key(name)
+        unique_targets = list(dict.fromkeys(targets.values()))
 
-        target = self._normalize_for_match(self._clean_filename(game_name))
-        matches: List[Path] = []
+        resolved: Dict[str, List[Path]] = {}
 
         # If we have a local index, use it to gather candidates
         if self.local_index is not None and self._local_index_keys is not None:
-            for key in self._local_index_keys:
-                if target in key or key in target:
-                    matches.extend(self.local_index[key])
-                    continue
-
-            for key in self._local_index_keys:
-                ratio = difflib.SequenceMatcher(None, target, key).ratio()
-                if ratio >= self.match_threshold:
-                    matches.extend(self.local_index[key])
-
-            return matches
-
-        # Fallback to directory scan (original behavior)
-        for item in self.download_dir.iterdir():
-            if not item.is_file() or item.suffix.lower() not in rom_extensions:
-                continue
+            # With the vector backend, fuzzy candidates for the whole batch come from one pass
+            vi = self._get_vector_index()
+            batch_candidates = None
+            if vi is not None:
+                batch_candidates = vi.candidates(unique_targets, vector_matching.cutoff_for(self.match_threshold))
+            positions = match_targets(self._get_match_index(), unique_targets, self.match_threshold, batch_candidates)
+            for target, found in zip(unique_targets, positions):
+                matches: List[Path] = []
+                for pos in found:
+                    matches.extend(self.local_index[self._local_index_keys[pos]])
+                resolved[target] = matches
+        else:
+            # Fallback to directory scan (original behavior), listing the folder once
+            rom_extensions = list(ROM_EXTENSIONS)
+            if not self.extract_files:
+                rom_extensions = rom_extensions + list(ARCHIVE_EXTENSIONS)
+
+            local_files = []
+            if unique_targets:
+                for item in self.download_dir.iterdir():
+                    if not item.is_file() or item.suffix.lower() not in rom_extensions:
+                        continue
+                    local_files.append((item, self._match_key(item.name)))
+
+            for target in unique_targets:
+                matches = []
+                scorer = FuzzyScorer(target, self.match_threshold, self.match_stats)
+                for item, cand in local_files:
+                    if target in cand or cand in target:
+                        matches.append(item)
+                        continue
 
-            cand = self._normalize_for_match(self._clean_filename(item.name))
+                    if scorer(cand):
+                        matches.append(item)
+                resolved[target] = matches
 
-            if target in cand or cand in target:
-                matches.append(item)
-                continue
+        return {name: list(resolved[target]) for name, target in targets.items()}
 
-            ratio = difflib.SequenceMatcher(None, target, cand).ratio()
-            if ratio >= self.match_threshold:
-                matches.append(item)
+    def match_games(self, games: Iterable[Dict]) -> List[List[Path]]:
+        """Return local files for each game dict, in input order.
 
-        return matches
+        Games this tool downloaded itself are answered exactly from the download
+        manifest by id (`game_id`, or `id` for catalog entries); only the rest
+        are resolved by fuzzy title matching via `match_titles`.
+        """
+        games = list(games)
+        exact = [self.manifest.files(g.get('game_id') or g.get('id') or '') for g in games]
+        fuzzy = self.match_titles(g['name'] for g, files in zip(games, exact) if not files)
+        return [files or fuzzy[g['name']] for g, files in zip(games, exact)]
 
     def _choose_preferred_file(self, files: List[Path], game_name: str) -> Path:
         """Pick the preferred file to keep from `files` for `game_name`.
@@ -640,10 +880,10 @@ class VimmsDownloader:
         - no parentheses/brackets in filename (+2)
         - shorter filename (+1)
         """
-        target = self._normalize_for_match(self._clean_filename(game_name))
+        target = self._match_key(game_name)
 
         def score(p: Path) -> int:
-            s = self._normalize_for_match(self._clean_filename(p.name))
+            s = self._match_key(p.name)
             sc = 0
             if s == target:
                 sc += 3
@@ -657,6 +897,74 @@ class VimmsDownloader:
     def _confirm_and_remove_duplicates(self, keep: Path, extras: List[Path]):
         """Prompt to remove `extras`, moving them to a backup folder if confirmed."""
 
+    def find_duplicate_clusters(self, threshold: Optional[float] = None) -> List[Dict]:
+        """Group the whole local index into clusters of near-identical files.
+
+        Unlike the per-title check in `download_all_games`, this covers every
+        indexed file in one pass: files sharing a match key are grouped directly,
+        and keys whose `difflib` ratio reaches `threshold` (default
+        `limits.duplicate_threshold`) are merged via union-find over the candidate
+        pairs of a trigram blocking step (see `duplicate_clusters`). Folders in
+        the index are ignored.
+
+        Returns one dict per cluster, largest `reclaimable_bytes` first:
+        `{'keep': Path, 'extras': [Path, ...], 'reclaimable_bytes': int}` where
+        `keep` is picked by `_choose_preferred_file`.
+        """
+        if self.local_index is None:
+            self._build_local_index()
+        if self.local_index is None or self._local_index_keys is None:
+            return []
+        if threshold is None:
+            threshold = self.duplicate_threshold
+
+        keys = self._local_index_keys
+        groups = duplicate_clusters(self._get_match_index(), threshold)
+        grouped = {pos for group in groups for pos in group}
+        # A single key holding several files (e.g. 'Game.nds' and 'Game (USA).zip') is a cluster too
+        groups.extend([pos] for pos in range(len(keys)) if pos not in grouped and len(self.local_index[keys[pos]]) > 1)
+
+        clusters = []
+        for group in groups:
+            files = [p for pos in group for p in self.local_index[keys[pos]] if p.is_file()]
+            if len(files) < 2:
+                continue
+            # Name the cluster after its most common key (shortest on ties)
+            counts: Dict[str, int] = {}
+            for p in files:
+                k = self._match_key(p.name)
+                counts[k] = counts.get(k, 0) + 1
+            name = min(counts, key=lambda k: (-counts[k], len(k), k))
+            keep = self._choose_preferred_file(files, name)
+            extras = [p for p in files if p != keep]
+            reclaimable = 0
+            for p in extras:
+                try:
+                    reclaimable += p.stat().st_size
+                except OSError:
+                    pass
+            clusters.append({'keep': keep, 'extras': extras, 'reclaimable_bytes': reclaimable})
+
+        clusters.sort(key=lambda c: -c['reclaimable_bytes'])
+        return clusters
+
+    def print_duplicate_report(self, threshold: Optional[float] = None) -> List[Dict]:
+        """Print the clusters from `find_duplicate_clusters` and the total reclaimable space."""
+        clusters = self.find_duplicate_clusters(threshold)
+        if not clusters:
+            print(f"No duplicate files found in {self.download_dir}")
+            return clusters
+
+        total = sum(c['reclaimable_bytes'] for c in clusters)
+        print(f"Duplicate clusters in {self.download_dir}: {len(clusters)} "
+              f"({sum(len(c['extras']) for c in clusters)} redundant file(s), {total / (1024 * 1024):.1f} MB reclaimable)")
+        for c in clusters:
+            print(f"\n  KEEP   {c['keep'].relative_to(self.download_dir)}")
+            for p in c['extras']:
+                print(f"  EXTRA  {p.relative_to(self.download_dir)}")
+            print(f"  ({c['reclaimable_bytes'] / (1024 * 1024):.1f} MB reclaimable)")
+        return clusters
+
     def _categorize_downloaded_file(self, filepath: Path, game_id: str) -> None:
         """Categorize a downloaded file into a star bucket folder based on Vimm popularity.
 
@@ -669,7 +977,7 @@ class VimmsDownloader:
             from metadata import get_game_popularity, score_to_stars
 
         url = f"https://vimm.net/vault/{game_id}"
-        pop = get_game_popularity(url, session=self.session, cache_path=self.download_dir / 'metadata_cache.json', logger=getattr(self, 'logger', None))
+        pop = get_game_popularity(url, session=self.session, cache_path=self.download_dir / 'metadata_cache.json', logger=getattr(self, 'logger', None), limiter=self.rate_limiter, pages=self.game_page)
         if not pop:
             if getattr(self, 'logger', None):
                 self.logger.info(f"No popularity data for {game_id}; skipping categorization")
@@ -689,6 +997,8 @@ class VimmsDownloader:
         target = dst / filepath.name
         try:
             shutil.move(str(filepath), str(target))
+            if self.manifest.move(filepath, target):
+                self.manifest.save()
             if getattr(self, 'logger', None):
                 self.logger.info(f"Categorized {filepath} -> {target} (score={score}, votes={votes})")
             else:
@@ -732,7 +1042,7 @@ class VimmsDownloader:
             final_score = float(score)
         elif get_game_popularity and game_id:
             url = f"https://vimm.net/vault/{game_id}"
-            pop = get_game_popularity(url, session=self.session, cache_path=self.download_dir / 'metadata_cache.json', logger=getattr(self, 'logger', None))
+            pop = get_game_popularity(url, session=self.session, cache_path=self.download_dir / 'metadata_cache.json', logger=getattr(self, 'logger', None), limiter=self.rate_limiter, pages=self.game_page)
             if pop:
                 final_score = float(pop[0])
 
@@ -756,6 +1066,8 @@ class VimmsDownloader:
             if filepath.resolve() == target.resolve():
                 return
             shutil.move(str(filepath), str(target))
+            if self.manifest.move(filepath, target):
+                self.manifest.save()
             if getattr(self, 'logger', None):
                 self.logger.info(f"Categorized by rating {filepath} -> {target} (rating={final_score})")
             else:
@@ -801,7 +1113,7 @@ class VimmsDownloader:
                         name = e.get('name')
                         rating = e.get('rating')
                         if name and rating is not None:
-                            key = self._normalize_for_match(self._clean_filename(name))
+                            key = self._match_key(name)
                             title_to_rating[key] = float(rating)
 
         # Walk local files and categorize based on webui index mapping or metadata cache
@@ -811,7 +1123,7 @@ class VimmsDownloader:
                 if path.suffix.lower() not in ROM_EXTENSIONS + ARCHIVE_EXTENSIONS:
                     continue
                 # Try matching by normalized name first against webui_index mapping
-                norm = self._normalize_for_match(self._clean_filename(fname))
+                norm = self._match_key(fname)
                 score = title_to_rating.get(norm)
                 if score is None:
                     # Attempt to find by scanning the index of known games using find_all_matching_files
@@ -833,6 +1145,89 @@ class VimmsDownloader:
                             self.logger.exception(f"Failed to categorize existing file {path}")
         return moved
     
+    def game_page(self, game_page_url: str, keep: bool = False) -> Dict:
+        """Parsed record for a game page (title, details, download_url; see `downloader_lib.game_pages`).
+
+        Shared by every downloader and the web UI for `network.game_page_ttl`
+        seconds; concurrent callers for the same game share one request.
+        Records are only loaded by real requests (`fetch_game_page` always
+        revalidates the disk cache) through the process-wide session, so a
+        record in memory means this session visited the page and holds the
+        cookies `download_game` needs. `keep` holds the record until a regular
+        lookup uses it (see `GamePageCache.get`).
+        """
+        game_id = game_page_url.rstrip('/').split('/')[-1]
+
+        def load():
+            response = fetch_game_page(self.session, game_page_url, cache=self.http_cache, limiter=self.rate_limiter)
+            # Some test stubs may return objects without a .text property; prefer .text but fall back to decoding .content if needed
+            page_text = getattr(response, 'text', None)
+            if page_text is None and getattr(response, 'content', None) is not None:
+                try:
+                    page_text = response.content.decode('utf-8', errors='replace')
+                except Exception:
+                    page_text = str(response.content)
+            return parse_game_page(page_text, self.html_parser, game_id, game_page_url, getattr(self, 'logger', None))
+
+        return self.game_pages.get(game_id, load, keep=keep)
+
+    def _list_section_in_background(self, section: str) -> Future:
+        """`get_game_list_from_section(section)` in a daemon thread; the list arrives in the future.
+
+        Daemon so an interrupted run doesn't wait for the crawl; its requests go
+        through the shared rate limiter like any other.
+        """
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self.get_game_list_from_section(section))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _upcoming_downloads(self, games: List[Dict[str, str]], start: int, section_matches) -> List[Dict[str, str]]:
+        """Up to `prefetch_games` games after index `start` that will actually be downloaded.
+
+        Without batch matches (`section_matches`) presence is only known per title
+        at download time, so nothing is prefetched when detection is on.
+        """
+        if self.detect_existing and section_matches is None:
+            return []
+        upcoming = []
+        for i in range(start, len(games)):
+            if len(upcoming) >= self.prefetch_games:
+                break
+            if games[i]['game_id'] in self.progress['completed'] or (section_matches is not None and section_matches[i]):
+                continue
+            upcoming.append(games[i])
+        return upcoming
+
+    def prefetch_game_pages(self, games: Iterable[Dict[str, str]]) -> None:
+        """Start loading the pages of `games` (download URL, size) in background threads.
+
+        The records land in `self.game_pages`, so `get_download_url` for these
+        games is served from memory, or joins the fetch if it is still running.
+        They are kept until `get_download_url` uses them, however long the
+        transfers before them take. Each page is prefetched once per downloader;
+        errors are left for the download itself to report.
+        """
+        for game in games:
+            url = game.get('page_url')
+            if not url or url in self._prefetched:
+                continue
+            self._prefetched.add(url)
+            threading.Thread(target=self._prefetch_game_page, args=(url,), daemon=True).start()
+
+    def _prefetch_game_page(self, url: str) -> None:
+        try:
+            self.game_page(url, keep=True)
+        except Exception as e:
+            if getattr(self, 'logger', None):
+                self.logger.debug(f"Prefetch of {url} failed: {e}")
+
     def get_download_url(self, game_page_url: str, game_id: str) -> Optional[str]:
         """
         Extract the download URL from a game's page
@@ -845,15 +1240,7 @@ class VimmsDownloader:
             Download URL or None if not found
         """
         try:
-            response = fetch_game_page(self.session, game_page_url)
-            # Some test stubs may return objects without a .text property; prefer .text but fall back to decoding .content if needed
-            page_text = getattr(response, 'text', None)
-            if page_text is None and getattr(response, 'content', None) is not None:
-                try:
-                    page_text = response.content.decode('utf-8', errors='replace')
-                except Exception:
-                    page_text = str(response.content)
-            return resolve_download_form(page_text, self.session, game_page_url, game_id, getattr(self, 'logger', None))
+            return self.game_page(game_page_url)['download_url']
             
         except Exception as e:
             msg = f"Error getting download URL: {e}"
@@ -893,6 +1280,40 @@ class VimmsDownloader:
             if getattr(self, 'logger', None):
                 self.logger.exception(f"Could not save failed response for {game_id}: {e}")
     
+    def _probe_ranges(self) -> bool:
+        """Whether downloads start with a `Range: bytes=0-0` probe for segmented fetching.
+
+        Only for systems whose downloads are .7z disc images, when segmented
+        downloads are enabled.
+        """
+        return self.download_segments >= 2 and SYSTEM_DEFAULT_ARCHIVE_EXT.get(self.system) == '.7z'
+
+    def _download_segments(self, length: int) -> int:
+        """Parallel range requests for a file of `length` bytes (one below `segment_min_bytes`).
+
+        The count comes from `network.segmented_download.segments`, capped at the
+        per-host connection budget (`network.download_connections`); each request
+        still draws from the shared request budget.
+        """
+        return self.download_segments if length >= self.segment_min_bytes else 1
+
+    def _print_download_progress(self, downloaded: int, total_size: int) -> None:
+        """Redraw the progress bar (or a spinner when the size is unknown)."""
+        downloaded_mb = downloaded / (1024 * 1024)
+        if total_size > 0:
+            total_mb = total_size / (1024 * 1024)
+            percent = (downloaded / total_size) * 100
+            # Create progress bar
+            bar_length = 40
+            filled = int(bar_length * downloaded / total_size)
+            bar = '█' * filled + '░' * (bar_length - filled)
+            print(f"\r    [{bar}] {percent:.1f}% ({downloaded_mb:.2f}/{total_mb:.2f} MB)", end='', flush=True)
+        else:
+            # Unknown size, just show downloaded amount with spinner
+            spinner = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+            spin_char = spinner[int(time.time() * 10) % len(spinner)]
+            print(f"\r    {spin_char} Downloaded: {downloaded_mb:.2f} MB", end='', flush=True)
+
     def download_game(self, game: Dict[str, str]) -> bool:
         """
         Download a single game
@@ -908,7 +1329,7 @@ class VimmsDownloader:
         
         # Check if already recorded as downloaded; verify presence to catch manual deletions
         if game_id in self.progress['completed']:
-            matches = self.find_all_matching_files(game_name)
+            matches = self.manifest.files(game_id) or self.find_all_matching_files(game_name)
             if matches:
                 print(f"  SKIP: Skipping '{game_name}' (already downloaded)")
                 return True  # Return True but mark as "skipped" so we don't delay
@@ -938,22 +1359,37 @@ class VimmsDownloader:
             self._save_progress()
             return False
         
+        # Bytes received by earlier attempts or runs live in <game_id>.part (see downloader_lib/resumable.py)
+        part = PartialDownload(self.download_dir, game_id)
+        probe = self._probe_ranges()
+
         # Attempt download with retries
         for attempt in range(1, self.max_retries + 1):
             try:
                 headers = {
                     'User-Agent': self._get_random_user_agent(),
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
+                    # Archives don't compress further, and byte ranges must index the file itself
+                    'Accept-Encoding': 'identity',
                     'Connection': 'keep-alive',
                     # Use the actual game page as Referer to match site behavior
                     'Referer': game.get('page_url') or f"{BASE_URL}/vault/{game_id}",
                     'Sec-Fetch-Dest': 'document',
                     'Sec-Fetch-Mode': 'navigate'
                 }
+                resume = part.request_headers(download_url)
+                headers.update(resume)
+                # One byte tells whether the server takes ranges and how large the file is
+                probing = probe and not resume
+                if probing:
+                    headers['Range'] = 'bytes=0-0'
                 
                 print(f"  Downloading (attempt {attempt}/{self.max_retries})...")
+                if resume:
+                    print(f"    Resuming after {part.received / (1024 * 1024):.2f} MB")
                 
+                # Waits out any Retry-After pause as well as the shared request budget
+                self.rate_limiter.acquire()
                 response = self.session.get(
                     download_url,
                     headers=headers,
@@ -961,8 +1397,10 @@ class VimmsDownloader:
                     allow_redirects=True,
                     stream=True
                 )
+                # Feed the adaptive rate (429/5xx lower it, Retry-After pauses every request)
+                retry_after = self.rate_limiter.record(response.status_code, getattr(response, 'headers', None))
                 
-                if response.status_code != 200:
+                if response.status_code not in (200, 206):
                     print(f"    WARNING: HTTP {response.status_code}")
                     print(f"    Response headers: {dict(response.headers)}")
                     if getattr(self, 'logger', None):
@@ -972,46 +1410,23 @@ class VimmsDownloader:
 
                     # Handle explicit rate limiting politely
                     if response.status_code == 429:
-                        # Respect Retry-After header if present (seconds or HTTP date)
-                        wait_seconds = None
-                        ra = response.headers.get('Retry-After')
-                        if ra:
-                            try:
-                                # If integer seconds
-                                wait_seconds = int(ra)
-                            except Exception:
-                                # Try HTTP-date format
-                                try:
-                                    from email.utils import parsedate_to_datetime
-                                    retry_dt = parsedate_to_datetime(ra)
-                                    now = datetime.utcnow().replace(tzinfo=retry_dt.tzinfo)
-                                    delta = (retry_dt - now).total_seconds()
-                                    if delta > 0:
-                                        wait_seconds = int(delta)
-                                except Exception:
-                                    wait_seconds = None
-                        # Fallback/backoff: exponential based on attempt
-                        if wait_seconds is None:
+                        # Without Retry-After, back off exponentially based on attempt
+                        wait_seconds = retry_after
+                        if not wait_seconds:
                             base = max(5, int(self.retry_delay))
                             wait_seconds = min(300, base * (2 ** (attempt - 1)))
+                            self.rate_limiter.pause(wait_seconds)
 
-                        print(f"    ⏳ Rate limited (429). Waiting {wait_seconds}s before retry...")
+                        print(f"    ⏳ Rate limited (429). Waiting {wait_seconds:.0f}s before retry...")
                         if getattr(self, 'logger', None):
-                            self.logger.info(f"Rate limited for {game_name} ({game_id}); sleeping {wait_seconds}s before retry")
-
-                        time.sleep(wait_seconds)
-
-                        # Nudge future pacing upwards to reduce further 429s
-                        try:
-                            lo, hi = self.delay_between_downloads
-                            lo = min(60, max(lo, 5) * 1.5)
-                            hi = min(180, max(hi, lo + 1) * 1.5)
-                            self.delay_between_downloads = (lo, hi)
-                            if getattr(self, 'logger', None):
-                                self.logger.info(f"Adjusted delay_between_downloads to {self.delay_between_downloads} after 429")
-                        except Exception:
-                            pass
+                            self.logger.info(f"Rate limited for {game_name} ({game_id}); pausing requests {wait_seconds:.0f}s, "
+                                             f"rate now {self.rate_limiter.rate:.2f}/s")
+                        continue
 
+                    # The part no longer fits the file on the server; start over
+                    if response.status_code == 416:
+                        part.discard()
+                        probe = False
                         continue
 
                     # Treat 404 as permanent (non-retriable) — save response snippet for debugging
@@ -1047,6 +1462,8 @@ class VimmsDownloader:
                 
                 if filename_match:
                     filename = filename_match[0]
+                elif response.status_code == 206 and part.meta.get('filename'):
+                    filename = part.meta['filename']
                 else:
                     # Fallback filename: choose extension per system default
                     default_ext = SYSTEM_DEFAULT_ARCHIVE_EXT.get(self.system, '.zip')
@@ -1063,41 +1480,53 @@ class VimmsDownloader:
 
                 filepath = self.download_dir / filename
                 
-                # Get file size for progress tracking
-                total_size = int(response.headers.get('content-length', 0))
-                
-                # Download with progress tracking
-                downloaded = 0
-                chunk_size = 8192
-                last_print_time = time.time()
-                
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            # Update progress display (throttle to once per second)
-                            current_time = time.time()
-                            if current_time - last_print_time >= 0.5 or downloaded == total_size:
-                                last_print_time = current_time
-                                downloaded_mb = downloaded / (1024 * 1024)
-                                
-                                if total_size > 0:
-                                    total_mb = total_size / (1024 * 1024)
-                                    percent = (downloaded / total_size) * 100
-                                    # Create progress bar
-                                    bar_length = 40
-                                    filled = int(bar_length * downloaded / total_size)
-                                    bar = '█' * filled + '░' * (bar_length - filled)
-                                    print(f"\r    [{bar}] {percent:.1f}% ({downloaded_mb:.2f}/{total_mb:.2f} MB)", end='', flush=True)
-                                else:
-                                    # Unknown size, just show downloaded amount with spinner
-                                    spinner = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-                                    spin_char = spinner[int(current_time * 10) % len(spinner)]
-                                    print(f"\r    {spin_char} Downloaded: {downloaded_mb:.2f} MB", end='', flush=True)
+                # A 206 to the probe: fetch the file in ranges. A 200 means the server
+                # ignores ranges, so that response is the whole file
+                segments = 0
+                if probing and response.status_code == 206:
+                    length = full_length(response)
+                    if not length:
+                        # Stream the next attempt in one request instead
+                        response.close()
+                        probe = False
+                        raise IncompleteDownload(f"Unexpected reply to the range probe "
+                                                 f"({response.headers.get('Content-Range')!r})")
+                    segments = self._download_segments(length)
+
+                # Continue the part after a 206, or start it over; the full size drives progress
+                offset = part.begin(response, download_url, filename, segmented=bool(segments))
+                total_size = part.meta.get('length') or 0
+
+                if segments:
+                    response.close()
+                    if segments > 1:
+                        print(f"    Fetching in {segments} parallel segments...")
+                    range_headers = {k: v for k, v in headers.items() if k not in ('Range', 'If-Range')}
+                    SegmentedDownload(self.session, download_url, part, headers=range_headers, workers=segments,
+                                      limiter=self.rate_limiter, progress=self._print_download_progress,
+                                      verify=False).run()
+                else:
+                    # Download with progress tracking
+                    downloaded = offset
+                    chunk_size = 8192
+                    last_print_time = time.time()
+
+                    with part.open(offset) as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            if chunk:
+                                f.write(chunk)
+                                downloaded += len(chunk)
+
+                                # Update progress display (throttle to twice per second)
+                                current_time = time.time()
+                                if current_time - last_print_time >= 0.5 or downloaded == total_size:
+                                    last_print_time = current_time
+                                    self._print_download_progress(downloaded, total_size)
                 
                 print()  # New line after progress
+
+                # Only a part holding the full length is renamed into place
+                part.finish(filepath)
                 
                 # Verify file was actually written
                 if not filepath.exists() or filepath.stat().st_size == 0:
@@ -1105,6 +1534,10 @@ class VimmsDownloader:
                 
                 file_size_mb = filepath.stat().st_size / (1024 * 1024)
                 print(f"  Downloaded successfully: {filename} ({file_size_mb:.2f} MB)")
+
+                # Record exactly what we wrote so later presence checks need no fuzzy matching
+                self.manifest.record(game_id, [filepath], game_name)
+                self.manifest.save()
                 
                 # Either extract & cleanup, or keep the archive for systems that support
                 # playing zipped ROMs (e.g., GBA). When keeping archives we do not
@@ -1118,7 +1551,7 @@ class VimmsDownloader:
                         print(f"  Saved archive: {filename}")
                 else:
                     # Extract the archive (original behavior)
-                    self._extract_and_cleanup(filepath)
+                    self._extract_and_cleanup(filepath, game_id=game_id)
                 
                 # Update progress
                 self.progress['completed'].append(game_id)
@@ -1251,14 +1684,23 @@ class VimmsDownloader:
             except ValueError:
                 pass
 
-        # Process each section
+        # Process each section. The next section's list is fetched in the background
+        # while this one downloads, so moving on to it doesn't wait for its crawl.
+        next_list = None
         for section_idx, section in enumerate(ordered_sections[start_section_idx:], start=start_section_idx):
             print(f"\n{'='*80}")
             print(f"SECTION: {section} ({section_idx + 1}/{len(ordered_sections)}) | Console: {self.system}")
             print(f"{'='*80}")
             
-            # Get list of games in this section
-            games = self.get_game_list_from_section(section)
+            # Get list of games in this section (prefetched during the previous one)
+            if next_list is not None and next_list[0] == section:
+                games = next_list[1].result()
+            else:
+                games = self.get_game_list_from_section(section)
+            next_list = None
+            if section_idx + 1 < len(ordered_sections):
+                upcoming = ordered_sections[section_idx + 1]
+                next_list = (upcoming, self._list_section_in_background(upcoming))
             total_games_estimate += len(games) if games else 0
             
             if not games:
@@ -1269,10 +1711,14 @@ class VimmsDownloader:
             # in-memory index to find the first missing title and start from there.
             # This avoids iterating and checking thousands of earlier titles one-by-one.
             section_start_idx = 0
+            # Resolve local matches for the whole section in one batch when the
+            # index is static (pre-scan); per-directory checks stay per title.
+            section_matches = None
             if self.detect_existing and self.pre_scan and self.local_index is not None:
+                section_matches = self.match_games(games)
                 # Walk titles until we find the first that does NOT match any local file
                 for i, g in enumerate(games):
-                    matches = self.find_all_matching_files(g['name'])
+                    matches = section_matches[i]
                     if matches:
                         # Mark as completed (skip) if not already recorded
                         if g['game_id'] not in self.progress['completed']:
@@ -1301,7 +1747,10 @@ class VimmsDownloader:
                 
                 # Attempt to detect a local copy (fuzzy name match) before calling download_game
                 if self.detect_existing:
-                    matches = self.find_all_matching_files(game['name'])
+                    if section_matches is not None:
+                        matches = section_matches[game_idx - 1]
+                    else:
+                        matches = self.manifest.files(game['game_id']) or self.find_all_matching_files(game['name'])
                     if matches:
                         # If multiple matches, pick a preferred and optionally offer to remove extras
                         if len(matches) > 1 and self.delete_duplicates:
@@ -1320,6 +1769,10 @@ class VimmsDownloader:
                             self._save_progress()
                         continue
 
+                # Resolve the next games' download URLs while this one transfers
+                if self.prefetch_games:
+                    self.prefetch_game_pages(self._upcoming_downloads(games, game_idx, section_matches))
+
                 # Check if already downloaded before calling download_game
                 was_already_downloaded = game['game_id'] in self.progress['completed']
                 
@@ -1361,6 +1814,14 @@ class VimmsDownloader:
         print(f"Time elapsed: {duration}")
         print(f"\nFiles saved to: {self.download_dir}")
         print(f"Progress saved to: {self.progress_file}")
+        if getattr(self, 'logger', None) and self.match_stats['scored']:
+            self.logger.info(f"Fuzzy match pruning: {self.match_stats}")
+        if getattr(self, 'logger', None) and self.http_cache is not None:
+            self.logger.info(f"Page cache: {self.http_cache.stats}")
+        if hasattr(self.rate_limiter, 'save'):
+            self.rate_limiter.save()
+            if getattr(self, 'logger', None):
+                self.logger.info(f"Request rate: {self.rate_limiter.rate:.2f}/s {self.rate_limiter.stats}")
         
         if self.progress['failed']:
             print(f"\nWARNING: {len(self.progress['failed'])} games failed to download.")
@@ -1406,7 +1867,12 @@ def main():
     parser.add_argument('--categorize-by-popularity-mode', choices=['stars','score'], default='stars', help='Categorization mode: stars (default) or score (integer)')
     parser.add_argument('--categorize-by-rating', action='store_true', help='Organize downloaded files into rating/<n> buckets based on Vimm overall rating (integer part)')
     parser.add_argument('--categorize-existing', action='store_true', help='Scan existing files in the target folder and organize them into rating buckets using local index/metadata')
+    parser.add_argument('--report-duplicates', action='store_true', help='List clusters of near-identical local files and the space removing the extras would reclaim, then exit')
     parser.add_argument('--src', help='Path to the project/src root where `vimms_config.json` and scripts live (useful when running from a different CWD)')
+    parser.add_argument('--catalog', nargs='?', const=str(REMOTE_CATALOG_PATH), metavar='PATH',
+                        help='Take section lists from the web UI\'s remote catalog (default: src/webui_remote_catalog.json) instead of crawling, when fresh enough')
+    parser.add_argument('--catalog-max-age', type=float, default=CATALOG_MAX_AGE_HOURS, metavar='HOURS',
+                        help=f'With --catalog, crawl live if the catalog is older than this (default: {CATALOG_MAX_AGE_HOURS}h)')
     args = parser.parse_args()
 
     # Parse optional section-priority override passed from runner
@@ -1483,12 +1949,20 @@ def main():
         categorize_by_rating=args.categorize_by_rating,
     )
 
+    if getattr(args, 'catalog', None):
+        downloader.use_catalog(args.catalog, args.catalog_max_age)
+
     # If user requested organizing existing files, perform that and exit
     if getattr(args, 'categorize_existing', False):
         moved = downloader.categorize_existing_files()
         print(f"Organized {moved} existing file(s) into rating/ buckets.")
         return
 
+    # Duplicate report only: cluster the whole local library and exit without downloading
+    if getattr(args, 'report_duplicates', False):
+        downloader.print_duplicate_report()
+        return
+
     # Start downloading
     try:
         # If interactive prompts are allowed, run normally (prompts will be emitted).
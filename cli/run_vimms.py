@@ -129,7 +129,12 @@ def main(argv=None):
     parser.add_argument('--report', action='store_true', help='Generate a progress report per console instead of running downloads')
     parser.add_argument('--report-format', choices=['json', 'csv'], default='json', help='Report file format (default: json)')
     parser.add_argument('--report-aggregate', action='store_true', help='Also write an overall summary under reports/overall_progress.json')
+    parser.add_argument('--async-crawl', action='store_true', help='With --report, crawl all consoles\' game lists at once on one asyncio event loop')
     parser.add_argument('--categorize-by-rating', action='store_true', help='Forward --categorize-by-rating to the downloader (organize by Vimm rating)')
+    parser.add_argument('--catalog', nargs='?', const='', metavar='PATH',
+                        help='Take game lists from the web UI\'s remote catalog (default: src/webui_remote_catalog.json) when fresh enough, instead of crawling (forwarded to the downloader; also used by --report)')
+    parser.add_argument('--catalog-max-age', type=float, metavar='HOURS',
+                        help='With --catalog, crawl live if the catalog is older than this (default: 24h)')
     parser.add_argument('--src', help='Path to the project/src root where the downloader script and config live (useful when running the runner from a different CWD)')
 
     args = parser.parse_args(argv)
@@ -357,6 +362,11 @@ def main(argv=None):
     global_forward['yes_delete'] = args.yes_delete
     # Forward rating categorization flag to downloader
     global_forward['categorize_by_rating'] = bool(args.categorize_by_rating)
+    # Forward the cached-catalog options (an empty path means the downloader's default)
+    if args.catalog is not None:
+        global_forward['catalog'] = ['--catalog'] + ([args.catalog] if args.catalog else [])
+        if args.catalog_max_age is not None:
+            global_forward['catalog'] += ['--catalog-max-age', str(args.catalog_max_age)]
 
     # Dry-run when --dry-run is passed; otherwise invoke downloads by default
     if args.dry_run:
@@ -403,7 +413,7 @@ def main(argv=None):
     if args.report:
         try:
             # Local import to avoid importing when running as pure subprocess runner
-            from download_vimms import VimmsDownloader, SECTIONS, detect_console_from_folder
+            from download_vimms import VimmsDownloader, SECTIONS, CATALOG_MAX_AGE_HOURS, detect_console_from_folder
         except Exception as e:
             print('Error importing downloader for reporting:', e)
             raise SystemExit(1)
@@ -413,6 +423,20 @@ def main(argv=None):
         reports_dir = ROOT / 'reports'
         reports_dir.mkdir(parents=True, exist_ok=True)
 
+        # Optionally crawl every console's game lists up front, concurrently
+        crawled = None
+        if args.async_crawl and run_list:
+            from download_vimms import HTML_PARSERS, rate_limiter_from_config
+            from downloader_lib.async_fetch import crawl_catalog_sync
+            net = cfg.get('network', {}) if isinstance(cfg, dict) else {}
+            limiter = rate_limiter_from_config(net, ROOT)
+            systems = {}
+            for t in run_list:
+                console = detect_console_from_folder(t) or t.name
+                systems[console] = console
+            print(f"\nCrawling game lists for {len(systems)} console(s) concurrently...")
+            crawled = crawl_catalog_sync(systems, SECTIONS, limiter, parser=HTML_PARSERS.get(str(net.get('html_parser', 'bs4')), HTML_PARSERS['bs4']))
+
         for idx, t in enumerate(run_list, start=1):
             console = detect_console_from_folder(t) or t.name
             roms_dir = t / 'ROMs'
@@ -426,13 +450,21 @@ def main(argv=None):
             dl = VimmsDownloader(str(roms_dir), system=console, detect_existing=True, pre_scan=True, extract_files=False)
             # Build local index for presence detection
             dl._build_local_index()
+            if args.catalog is not None and crawled is None:
+                max_age = args.catalog_max_age if args.catalog_max_age is not None else CATALOG_MAX_AGE_HOURS
+                dl.use_catalog(args.catalog or None, max_age)
 
             # Fetch all available games across sections
             all_games = []
             print('\n' + '=' * 80)
             print(f"Collecting game list for {console} ({idx}/{len(run_list)})...")
-            for s in SECTIONS:
-                games = dl.get_game_list_from_section(s)
+            if crawled is not None:
+                # Sections the crawl could not list are fetched again here
+                section_lists = ((s, crawled[console][s] if s in crawled[console] else dl.get_game_list_from_section(s))
+                                 for s in SECTIONS)
+            else:
+                section_lists = dl.iter_section_game_lists(SECTIONS)
+            for s, games in section_lists:
                 if games:
                     all_games.extend(games)
 
@@ -458,6 +490,11 @@ def main(argv=None):
 
             rows = []
             present_local = 0
+            # Resolve local matches for every title not already tracked in one batch
+            local_matches = dl.match_titles(
+                g.get('name') for g in all_games
+                if g.get('game_id') not in completed_ids and g.get('game_id') not in failed_ids
+            )
             for g in all_games:
                 gid = g.get('game_id')
                 name = g.get('name')
@@ -467,7 +504,7 @@ def main(argv=None):
                     status = 'failed'
                 else:
                     # Detect local presence with fuzzy matching
-                    matches = dl.find_all_matching_files(name)
+                    matches = local_matches.get(name)
                     if matches:
                         status = 'present_local'
                         present_local += 1
@@ -636,6 +673,8 @@ def main(argv=None):
         elif per_cfg.get('categorize_by_rating'):
             flags.append('--categorize-by-rating')
 
+        flags.extend(global_forward.get('catalog', []))
+
         # Pre-run summary (what's already done)
         pre = _read_progress_summary(t)
         overall_before_completed += pre.get('completed', 0)
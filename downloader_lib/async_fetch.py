@@ -0,0 +1,157 @@
+"""asyncio crawler for section game lists (catalog builds and reports).
+
+`VimmsDownloader.iter_section_game_lists` overlaps requests with a small thread
+pool per console. For crawling every console at once this module drives all
+section crawls on one event loop instead: each (console, section) pair is a
+task, pages within a section are still fetched in order, and the only limits
+are a per-host connection cap and the shared request budget
+(`rate_limit.shared_limiter`), so a full crawl is bounded by the rate budget
+rather than by thread count or round-trip time.
+
+Requests use the same URLs and headers as `fetch.py` and pages are parsed with
+`downloader_lib.parse`. `aiohttp` is used when installed; otherwise the blocking
+`requests` calls run in worker threads (`asyncio.to_thread`), capped by the same
+per-host limit.
+
+A page answered with 429 or 5xx is reported to the limiter with its headers (so
+`Retry-After` pauses every request) and tried again, up to `PAGE_ATTEMPTS`
+times. A section that still fails is left out of the result rather than stored
+as an empty list, so callers keep what they already had for it.
+"""
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from downloader_lib.fetch import PAGE_ATTEMPTS, RETRY_BACKOFF, request_headers, section_page_url
+from downloader_lib import parse as bs4_parse
+from downloader_lib.rate_limit import TokenBucket
+from downloader_lib.session import shared_session
+
+try:
+    import aiohttp  # type: ignore
+except Exception:  # optional dependency
+    aiohttp = None
+
+# Concurrent connections per host (the rate budget is the real limit)
+PER_HOST_CONNECTIONS = 8
+
+
+class _RequestsClient:
+    """Fallback client: blocking `requests` calls run in threads, `per_host` at a time per host."""
+
+    def __init__(self, per_host: int):
+        self.per_host = per_host
+        # Reuses the process-wide pool; not closed when the crawl ends
+        self.session = shared_session()
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    async def get(self, url: str, headers: Dict[str, str]):
+        host = urlparse(url).netloc
+        sem = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with sem:
+            response = await asyncio.to_thread(self.session.get, url, headers=headers, verify=False)
+        return response.status_code, response.headers, response.text
+
+    async def close(self):
+        pass
+
+
+class _AiohttpClient:
+    """aiohttp client with a per-host connection limit."""
+
+    def __init__(self, per_host: int):
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0, limit_per_host=per_host, ssl=False))
+
+    async def get(self, url: str, headers: Dict[str, str]):
+        async with self.session.get(url, headers=headers) as response:
+            return response.status, response.headers, await response.text()
+
+    async def close(self):
+        await self.session.close()
+
+
+def _make_client(per_host: int):
+    return _AiohttpClient(per_host) if aiohttp is not None else _RequestsClient(per_host)
+
+
+async def _get_page(client, limiter: TokenBucket, url: str):
+    """`(status, text)` for one page, retrying 429/5xx up to `PAGE_ATTEMPTS` times."""
+    for attempt in range(1, PAGE_ATTEMPTS + 1):
+        await asyncio.sleep(limiter.reserve())
+        status, headers, text = await client.get(url, request_headers())
+        retry_after = limiter.record(status, headers)
+        if not (status == 429 or status >= 500) or attempt == PAGE_ATTEMPTS:
+            return status, text
+        # A Retry-After already paused the limiter; otherwise back off before the next try
+        if not retry_after:
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+
+
+async def crawl_section(client, limiter: TokenBucket, system: str, section: str, parser=bs4_parse) -> List[Dict[str, str]]:
+    """All games in one section, following 'Next' links (same rules as `get_game_list_from_section`).
+
+    `parser` is the page parser module (`parse` or `stream_parse`).
+    """
+    games: List[Dict[str, str]] = []
+    page_num = 1
+    while True:
+        status, text = await _get_page(client, limiter, section_page_url(system, section, page_num))
+        if status >= 400:
+            # 404 on page 2+ just means the section has a single page
+            if not (page_num > 1 and status == 404):
+                raise requests.exceptions.HTTPError(f"{status} for section '{section}' page {page_num}")
+            break
+        games_on_page, has_next = parser.parse_section_page(text, section)
+        if not games_on_page:
+            break
+        games.extend(games_on_page)
+        if not has_next:
+            break
+        page_num += 1
+    return games
+
+
+async def crawl_catalog(systems: Dict[str, str], sections: Iterable[str], limiter: TokenBucket,
+                        per_host: int = PER_HOST_CONNECTIONS,
+                        on_section: Optional[Callable[[str, str, List[Dict[str, str]], Optional[Exception]], None]] = None,
+                        parser=bs4_parse) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """Crawl every section of every console concurrently.
+
+    `systems` maps a console name to its Vimm system code. Returns
+    `{console: {section: [game, ...]}}` with sections in the given order; a
+    section that failed is missing from its console's mapping (it is not an
+    empty section). `on_section(console, section, games, error)` is called as
+    each section finishes (from the event loop thread).
+    """
+    sections = list(sections)
+    client = _make_client(per_host)
+
+    async def one(console: str, system: str, section: str):
+        error = None
+        try:
+            games = await crawl_section(client, limiter, system, section, parser)
+        except Exception as e:
+            games, error = [], e
+        if on_section is not None:
+            on_section(console, section, games, error)
+        return console, section, games, error
+
+    try:
+        results = await asyncio.gather(*(one(c, s, sec) for c, s in systems.items() for sec in sections))
+    finally:
+        await client.close()
+
+    catalog: Dict[str, Dict[str, List[Dict[str, str]]]] = {c: {} for c in systems}
+    for console, section, games, error in results:
+        if error is None:
+            catalog[console][section] = games
+    return catalog
+
+
+def crawl_catalog_sync(systems: Dict[str, str], sections: Iterable[str], limiter: TokenBucket,
+                       per_host: int = PER_HOST_CONNECTIONS, on_section=None,
+                       parser=bs4_parse) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """Run `crawl_catalog` on a fresh event loop (for threads and scripts without one)."""
+    return asyncio.run(crawl_catalog(systems, sections, limiter, per_host, on_section, parser))
@@ -0,0 +1,145 @@
+"""Delta sync of the remote catalog (`webui_remote_catalog.json`).
+
+A full catalog build lists every page of every section of every console. Most
+of those pages are unchanged since the last build, so a delta sync compares
+each fetched page against the cached rows (by game id) and stops paginating a
+section at the first page that is already known *in place*: every id on it is
+cached, in the same order, as one contiguous run of the cached list. Rows
+before that page come from the site (picking up additions and removals there),
+the rest of the section is taken from the cache.
+
+This relies on the list order being stable, so changes behind the stop page
+are only picked up once the section is listed in full again: consoles whose
+last full listing is older than `full_sync_days` are always listed in full.
+
+`load_console_catalog` reads one console's lists back as section-parser game
+dicts, so the CLI can download from a fresh catalog without crawling
+(`download_vimms.py --catalog`).
+"""
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def catalog_rows(games: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Game dicts from the section parser as catalog rows (`id`, `name`, `url`)."""
+    return [
+        {'id': g.get('game_id', ''), 'name': g.get('name', ''), 'url': g.get('page_url', '')}
+        for g in games
+    ]
+
+
+def catalog_games(rows: Iterable[Dict[str, str]], section: str) -> List[Dict[str, str]]:
+    """Catalog rows back as game dicts (`name`, `page_url`, `game_id`, `section`)."""
+    return [
+        {'name': r.get('name', ''), 'page_url': r.get('url', ''), 'game_id': r.get('id', ''), 'section': section}
+        for r in rows if r.get('id')
+    ]
+
+
+def load_console_catalog(path: Path, system: str, max_age_seconds: float,
+                         now: Optional[datetime] = None) -> Tuple[Optional[Dict[str, List[Dict[str, str]]]], Optional[float]]:
+    """`({section: games}, age_seconds)` for `system` from a catalog file.
+
+    The lists are None when the file is missing or unreadable, has no lists for
+    the system, or was synced more than `max_age_seconds` ago (age is then still
+    returned when known). Consoles are matched on their Vimm system code; when
+    several folder names share one, the most recently synced is used.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    candidates = [c for c in (catalog.get('consoles') or {}).values()
+                  if isinstance(c, dict) and c.get('system') == system and c.get('sections')]
+    if not candidates:
+        return None, None
+    console = max(candidates, key=lambda c: c.get('last_synced') or catalog.get('timestamp') or '')
+    synced = _parse_time(console.get('last_synced') or catalog.get('timestamp'))
+    if synced is None:
+        return None, None
+    age = ((now or datetime.utcnow()) - synced).total_seconds()
+    if age > max_age_seconds:
+        return None, age
+    return {section: catalog_games(rows, section) for section, rows in console['sections'].items()}, age
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.rstrip('Z'))
+    except ValueError:
+        return None
+
+
+def needs_full_sync(cached_console: Optional[Dict], full_sync_days: float, now: Optional[datetime] = None) -> bool:
+    """Whether a console must be listed in full (never synced, or last full listing too old)."""
+    if not cached_console or not cached_console.get('sections'):
+        return True
+    last_full = _parse_time(cached_console.get('last_full_sync') or cached_console.get('last_synced'))
+    if last_full is None:
+        return True
+    return (now or datetime.utcnow()) - last_full >= timedelta(days=full_sync_days)
+
+
+class SectionDelta:
+    """Early-stop rule and merge for one section against its cached rows."""
+
+    def __init__(self, cached_rows: List[Dict[str, str]]):
+        self.cached = list(cached_rows)
+        self._position = {row.get('id'): i for i, row in enumerate(self.cached)}
+        # Index into `cached` where the reused tail starts (set when pagination stops early)
+        self.resume_at: Optional[int] = None
+
+    def stop_at(self, page_games: List[Dict[str, str]]) -> bool:
+        """True when a fetched page is a contiguous, in-order run of the cached rows."""
+        ids = [g.get('game_id') for g in page_games]
+        if not ids or not self.cached:
+            return False
+        start = self._position.get(ids[0])
+        if start is None or start + len(ids) > len(self.cached):
+            return False
+        if any(self.cached[start + k].get('id') != game_id for k, game_id in enumerate(ids)):
+            return False
+        self.resume_at = start + len(ids)
+        return True
+
+    def merge(self, fetched_rows: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[str], List[str]]:
+        """Rows for the section after this sync, plus the added and removed ids.
+
+        An empty fetch for a section that had rows is treated as a failed listing
+        and the cached rows are kept.
+        """
+        if not fetched_rows and self.cached:
+            return list(self.cached), [], []
+        if self.resume_at is not None:
+            tail = self.cached[self.resume_at:]
+            seen = self.cached[:self.resume_at]
+        else:
+            tail, seen = [], self.cached
+        fetched_ids = {row.get('id') for row in fetched_rows}
+        added = [row.get('id') for row in fetched_rows if row.get('id') not in self._position]
+        removed = [row.get('id') for row in seen if row.get('id') not in fetched_ids]
+        return list(fetched_rows) + tail, added, removed
+
+
+class ConsoleDelta:
+    """`SectionDelta` for every section of one cached console."""
+
+    def __init__(self, cached_console: Dict):
+        sections = cached_console.get('sections') or {}
+        self.sections = {section: SectionDelta(rows) for section, rows in sections.items()}
+
+    def stop_at(self, section: str, page_games: List[Dict[str, str]]) -> bool:
+        """Pagination hook for `VimmsDownloader.get_game_list_from_section`."""
+        delta = self.sections.get(section)
+        return delta is not None and delta.stop_at(page_games)
+
+    def merge(self, section: str, fetched_rows: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[str], List[str]]:
+        delta = self.sections.get(section)
+        if delta is None:
+            return list(fetched_rows), [row.get('id') for row in fetched_rows], []
+        return delta.merge(fetched_rows)
@@ -2,32 +2,75 @@
 import requests
 from utils.constants import USER_AGENTS
 import random
+import time
+from typing import Dict, Optional
+
+from downloader_lib.rate_limit import retry_after_seconds
 
 BASE_URL = "https://vimm.net"
 VAULT_BASE = f"{BASE_URL}/vault"
+PAGE_ATTEMPTS = 3      # Tries per page on 429/5xx (the session itself never replays statuses)
+RETRY_BACKOFF = 2.0    # Seconds before a retry without Retry-After (doubles each time)
 
 def _get_random_user_agent() -> str:
     """Return a random user agent."""
     return random.choice(USER_AGENTS)
 
-def fetch_section_page(session: requests.Session, system: str, section: str, page_num: int):
-    """Fetch a single page of games from a section."""
-    section_url = f"{VAULT_BASE}/?p=list&action=filters&system={system}&section={section}&page={page_num}"
+def request_headers(referer: Optional[str] = None) -> Dict[str, str]:
+    """Headers sent with every page request (rotating user agent)."""
     headers = {
         'User-Agent': _get_random_user_agent(),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
     }
-    response = session.get(section_url, headers=headers, verify=False)
-    response.raise_for_status()
-    return response
+    if referer:
+        headers['Referer'] = referer
+    return headers
 
-def fetch_game_page(session: requests.Session, game_page_url: str):
-    """Fetch the detail page for a single game."""
-    headers = {
-        'User-Agent': _get_random_user_agent(),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Referer': VAULT_BASE
-    }
-    response = session.get(game_page_url, headers=headers, verify=False)
+def section_page_url(system: str, section: str, page_num: int) -> str:
+    """URL of one page of a section's game list."""
+    return f"{VAULT_BASE}/?p=list&action=filters&system={system}&section={section}&page={page_num}"
+
+def _get(session: requests.Session, url: str, headers: Dict[str, str], cache=None, limiter=None,
+         revalidate: bool = False, **kwargs):
+    """GET through the optional `HttpCache`, taking a `limiter` token only for real requests.
+
+    Each response status is reported back to the limiter (`TokenBucket.record`).
+    `revalidate` makes the cache send a (conditional) request even for fresh pages.
+    429/5xx are tried again up to `PAGE_ATTEMPTS` times, each attempt taking its
+    own token; a `Retry-After` has already paused the limiter, otherwise the
+    retry backs off first.
+    """
+    for attempt in range(1, PAGE_ATTEMPTS + 1):
+        try:
+            return _get_once(session, url, headers, cache, limiter, revalidate, **kwargs)
+        except requests.exceptions.HTTPError as e:
+            status = getattr(e.response, 'status_code', None) or 0
+            if not (status == 429 or status >= 500) or attempt == PAGE_ATTEMPTS:
+                raise
+            retry_after = retry_after_seconds(getattr(e.response, 'headers', None))
+            if limiter is None or not retry_after:
+                time.sleep(retry_after or RETRY_BACKOFF * 2 ** (attempt - 1))
+
+
+def _get_once(session: requests.Session, url: str, headers: Dict[str, str], cache, limiter, revalidate: bool, **kwargs):
+    if cache is not None:
+        return cache.get(session, url, headers, limiter=limiter, revalidate=revalidate, **kwargs)
+    if limiter is not None:
+        limiter.acquire()
+    response = session.get(url, headers=headers, verify=False, **kwargs)
+    if limiter is not None:
+        limiter.record(response.status_code, getattr(response, 'headers', None))
     response.raise_for_status()
     return response
+
+def fetch_section_page(session: requests.Session, system: str, section: str, page_num: int, cache=None, limiter=None):
+    """Fetch a single page of games from a section (see `http_cache.HttpCache` for `cache`)."""
+    return _get(session, section_page_url(system, section, page_num), request_headers(), cache, limiter)
+
+def fetch_game_page(session: requests.Session, game_page_url: str, cache=None, limiter=None, **kwargs):
+    """Fetch the detail page for a single game (see `http_cache.HttpCache` for `cache`).
+
+    Never served from the cache without a request: the visit sets the cookies
+    the download servers check, so the cache only saves the body (`304`).
+    """
+    return _get(session, game_page_url, request_headers(referer=VAULT_BASE), cache, limiter, revalidate=True, **kwargs)
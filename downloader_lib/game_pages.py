@@ -0,0 +1,129 @@
+"""Short-lived, single-flight cache of parsed game pages.
+
+Showing one game in the web UI used to download its vault page several times
+(title, rating via `get_game_popularity`, download form), and queueing it
+fetched the page again in `get_download_url`. `GamePageCache` keeps one parsed
+record per game id for `ttl` seconds:
+
+- `title` (the page `<title>`), `details` (`parse_game_details`: size,
+  extension, rating) and `download_url` (`resolve_download_form`)
+- concurrent callers asking for the same game while it is being fetched wait
+  for that one request instead of sending their own (single flight)
+- failed fetches are not cached; every waiting caller gets the error
+- records loaded with `keep=True` (download prefetches) don't expire until a
+  regular lookup reads them, since the transfer before them can take far
+  longer than `ttl`; from then on the usual `ttl` applies
+
+The record is built by a caller-supplied loader (see
+`VimmsDownloader.game_page`), so fetching still goes through the downloader's
+session, page cache and rate limiter. Loading always requests the page (the
+disk cache only saves the body), so a cached record also stands for a visit
+that set the session's download cookies.
+"""
+import html
+import re
+import threading
+import math
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+def page_title(html_content: str) -> str:
+    """Text of the page's `<title>` element ('' when there is none)."""
+    m = _TITLE_RE.search(html_content or '')
+    return html.unescape(m.group(1)).strip() if m else ''
+
+
+def parse_game_page(html_content: str, parser, game_id: str, url: str, logger=None) -> Dict:
+    """Parse a game page once into the cached record, with `parser` (`parse` or `stream_parse`)."""
+    return {
+        'game_id': game_id,
+        'url': url,
+        'title': page_title(html_content),
+        'details': parser.parse_game_details(html_content),
+        'download_url': parser.resolve_download_form(html_content, None, url, game_id, logger),
+    }
+
+
+class GamePageCache:
+    """Thread-safe TTL cache of game page records with single-flight loading."""
+
+    def __init__(self, ttl: float = 300):
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, Dict]] = {}
+        self._inflight: Dict[str, Future] = {}
+        # Instrumentation: served from memory, joined an in-flight fetch, loaded
+        self.stats = {'hits': 0, 'shared': 0, 'loaded': 0}
+
+    def get(self, game_id: str, load: Callable[[], Dict], keep: bool = False) -> Dict:
+        """The record for `game_id`, calling `load()` only if no fresh or in-flight one exists.
+
+        With `keep` the record is held until a lookup without `keep` uses it.
+        """
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self.stats['hits'] += 1
+                self._mark(game_id, keep)
+                return entry[1]
+            future = self._inflight.get(game_id)
+            leader = future is None
+            if leader:
+                future = self._inflight[game_id] = Future()
+            else:
+                self.stats['shared'] += 1
+        if not leader:
+            record = future.result()
+            with self._lock:
+                if game_id in self._entries:
+                    self._mark(game_id, keep)
+            return record
+
+        try:
+            record = load()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[game_id]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._entries[game_id] = (math.inf if keep else time.monotonic() + self.ttl, record)
+            del self._inflight[game_id]
+            self.stats['loaded'] += 1
+        future.set_result(record)
+        return record
+
+    def _mark(self, game_id: str, keep: bool) -> None:
+        # Called with the lock held: pin a kept record, or start the TTL of a used one
+        expires, record = self._entries[game_id]
+        if keep:
+            self._entries[game_id] = (math.inf, record)
+        elif expires == math.inf:
+            self._entries[game_id] = (time.monotonic() + self.ttl, record)
+
+    def invalidate(self, game_id: Optional[str] = None) -> None:
+        """Drop one record (or all of them)."""
+        with self._lock:
+            if game_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(game_id, None)
+
+
+_SHARED: Optional[GamePageCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_game_pages(ttl: float = 300) -> GamePageCache:
+    """Return the process-wide cache (every downloader and the web UI share it), set to `ttl`."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = GamePageCache(ttl)
+        else:
+            _SHARED.ttl = float(ttl)
+        return _SHARED
@@ -0,0 +1,157 @@
+"""On-disk cache for vault pages (section lists and game pages).
+
+The same section list and game pages are downloaded again on every CLI run,
+section fallback and game lookup. `HttpCache` keeps each page body on disk,
+keyed by URL:
+
+- within `ttl` seconds of being fetched (or revalidated) a page is served from
+  disk with no request at all, unless the caller asks for `revalidate`
+- after that (or with `revalidate`) it is revalidated with a conditional request (`If-None-Match` /
+  `If-Modified-Since` from the stored `ETag` / `Last-Modified`); a `304 Not
+  Modified` refreshes the entry without downloading the body again
+- in `cache_only` mode the network is never used and a missing page raises
+  `CacheMiss` (offline benchmarks and tests)
+
+Game pages are always fetched with `revalidate`: the download servers expect
+the cookies set while visiting the game page, so the page read just before a
+download must be a real request (a `304` still sets them). Section lists use
+the TTL.
+
+Only `200` responses are stored. Each entry is `<sha1(url)>.json` (metadata)
+plus `<sha1(url)>.body` (raw bytes) under the cache directory (by default
+`.vimms_http_cache` in the project root, next to the learned rate state; not
+in the download folder, which the local index scans).
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+
+# Bump when the entry format changes
+CACHE_VERSION = 1
+
+
+class CacheMiss(requests.exceptions.RequestException):
+    """Raised in cache-only mode when a URL has no cached entry."""
+
+
+class CachedResponse:
+    """The subset of `requests.Response` callers use, for pages served from disk."""
+
+    from_cache = True
+
+    def __init__(self, url: str, content: bytes, encoding: Optional[str], headers: Dict[str, str]):
+        self.url = url
+        self.status_code = 200
+        self.content = content
+        self.encoding = encoding
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class HttpCache:
+    """URL-keyed page cache with TTL and ETag/Last-Modified revalidation."""
+
+    def __init__(self, directory: Path, ttl: float = 3600, cache_only: bool = False):
+        self.directory = Path(directory)
+        self.ttl = float(ttl)
+        self.cache_only = bool(cache_only)
+        # Instrumentation: served from disk, revalidated with a 304, downloaded
+        self.stats = {'hits': 0, 'revalidated': 0, 'fetched': 0}
+
+    def _paths(self, url: str):
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{digest}.json', self.directory / f'{digest}.body'
+
+    def _load(self, url: str):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != CACHE_VERSION or meta.get('url') != url:
+                return None, None
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError):
+            return None, None
+
+    def _write(self, path: Path, data: bytes) -> None:
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _store(self, url: str, meta: dict, body: Optional[bytes]) -> None:
+        """Write an entry (body only when it changed). Errors are ignored; the cache is only an accelerator."""
+        meta_path, body_path = self._paths(url)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if body is not None:
+                self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError:
+            pass
+
+    def get(self, session: requests.Session, url: str, headers: Optional[Dict[str, str]] = None, limiter=None,
+            revalidate: bool = False, **kwargs):
+        """GET `url` through the cache. Returns a `requests.Response` or `CachedResponse`.
+
+        With `revalidate` a fresh entry is not served as is: a conditional request
+        is always sent (except in `cache_only` mode).
+
+        `limiter` (a `rate_limit.TokenBucket`) is only acquired when a request is
+        actually sent (and told the response status), so pages served from disk
+        don't use the request budget.
+        Extra keyword arguments are passed to `session.get`.
+        """
+        meta, body = self._load(url)
+        if meta is not None and (self.cache_only or (not revalidate and time.time() - meta.get('fetched_at', 0) < self.ttl)):
+            self.stats['hits'] += 1
+            return CachedResponse(url, body, meta.get('encoding'), meta.get('headers', {}))
+        if self.cache_only:
+            raise CacheMiss(f"not in cache (cache-only mode): {url}")
+
+        request_headers = dict(headers or {})
+        if meta is not None:
+            validators = meta.get('headers', {})
+            if validators.get('ETag'):
+                request_headers['If-None-Match'] = validators['ETag']
+            if validators.get('Last-Modified'):
+                request_headers['If-Modified-Since'] = validators['Last-Modified']
+
+        if limiter is not None:
+            limiter.acquire()
+        kwargs.setdefault('verify', False)
+        response = session.get(url, headers=request_headers, **kwargs)
+        if limiter is not None:
+            limiter.record(response.status_code, getattr(response, 'headers', None))
+
+        if response.status_code == 304 and meta is not None:
+            meta['fetched_at'] = time.time()
+            self._store(url, meta, None)
+            self.stats['revalidated'] += 1
+            return CachedResponse(url, body, meta.get('encoding'), meta.get('headers', {}))
+
+        response.raise_for_status()
+        if response.status_code == 200:
+            resp_headers = getattr(response, 'headers', None) or {}
+            kept = {k: resp_headers[k] for k in ('ETag', 'Last-Modified', 'Content-Type') if resp_headers.get(k)}
+            self._store(url, {
+                'version': CACHE_VERSION,
+                'url': url,
+                'fetched_at': time.time(),
+                # The encoding `response.text` decodes with, so cached text is identical
+                'encoding': getattr(response, 'encoding', None) or getattr(response, 'apparent_encoding', None),
+                'headers': kept,
+            }, response.content)
+        self.stats['fetched'] += 1
+        return response
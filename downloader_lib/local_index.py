@@ -0,0 +1,121 @@
+"""Persistent, incremental directory listing for the local ROM index.
+
+`VimmsDownloader._build_local_index` needs every ROM/archive filename under a
+download folder. Walking a large tree with `os.walk` on every run is slow on
+network shares, so `LocalTreeScanner` stores each directory's listing (with the
+normalized match keys) in a cache file next to the ROMs, keyed by the
+directory's mtime. A directory's mtime changes whenever an entry is added,
+removed or renamed inside it, so on the next run only directories whose mtime
+changed are listed again (with `os.scandir`); the others are served from the
+cache after a single `stat`.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+CACHE_FILENAME = '.vimms_local_index'
+# Bump when the cached entry format or the match key normalization changes.
+CACHE_VERSION = 1
+
+# Directory mtimes this close to "now" may still change within the same
+# timestamp tick (FAT/SMB have 2s resolution), so they are not trusted.
+_RACY_MTIME_SECONDS = 2.0
+
+
+class LocalTreeScanner:
+    """`os.walk`-compatible tree walker backed by a per-directory mtime cache.
+
+    Yields `(dirpath, dirs, files)` in the same top-down order as `os.walk`, where
+    `dirs` and `files` are lists of `(name, key)` pairs and `files` only contains
+    names whose suffix is in `extensions`.
+    """
+
+    def __init__(self, root: Path, extensions: Iterable[str], key_func: Callable[[str], str],
+                 cache_path: Optional[Path] = None):
+        self.root = Path(root)
+        self.extensions = {e.lower() for e in extensions}
+        self.key_func = key_func
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._old: Dict[str, dict] = self._load() if self.cache_path else {}
+        self._new: Dict[str, dict] = {}
+        self._complete = False
+        # Instrumentation: how many directories were listed vs served from cache
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CACHE_VERSION or data.get('extensions') != sorted(self.extensions):
+                return {}
+            return data.get('dirs', {})
+        except Exception:
+            return {}
+
+    def save(self) -> None:
+        """Write the cache (no-op without a cache path). Errors are ignored."""
+        if not self.cache_path:
+            return
+        dirs = dict(self._new)
+        if not self._complete:
+            # The walk was cut short (e.g. index_max_files); keep unvisited entries.
+            for rel, entry in self._old.items():
+                dirs.setdefault(rel, entry)
+        try:
+            # Overwrite in place: creating/renaming a file would bump the parent
+            # directory's mtime and force a rescan of it on the next run.
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'extensions': sorted(self.extensions), 'dirs': dirs}, f)
+        except Exception:
+            pass
+
+    def _scan(self, dirpath: Path) -> Optional[dict]:
+        dirs: List[Tuple[str, str, bool]] = []
+        files: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk(followlinks=False): list symlinked dirs, don't descend
+                        dirs.append((entry.name, self.key_func(entry.name), not entry.is_symlink()))
+                    elif Path(entry.name).suffix.lower() in self.extensions:
+                        files.append((entry.name, self.key_func(entry.name)))
+        except OSError:
+            return None
+        return {'dirs': dirs, 'files': files}
+
+    def walk(self) -> Iterator[Tuple[Path, List[Tuple[str, str]], List[Tuple[str, str]]]]:
+        """Walk the tree, listing only directories whose mtime changed."""
+        yield from self._walk(self.root, '.')
+        self._complete = True
+
+    def _walk(self, dirpath: Path, rel: str):
+        try:
+            mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return
+
+        entry = self._old.get(rel)
+        if entry is None or entry.get('mtime') is None or entry['mtime'] != mtime:
+            entry = self._scan(dirpath)
+            if entry is None:
+                return
+            racy = time.time() - mtime / 1e9 < _RACY_MTIME_SECONDS
+            entry['mtime'] = None if racy else mtime
+            self.dirs_scanned += 1
+        else:
+            self.dirs_reused += 1
+        self._new[rel] = entry
+
+        yield dirpath, [(d[0], d[1]) for d in entry['dirs']], [(f[0], f[1]) for f in entry['files']]
+
+        for name, _key, descend in entry['dirs']:
+            if descend:
+                yield from self._walk(dirpath / name, name if rel == '.' else f"{rel}/{name}")
@@ -0,0 +1,100 @@
+"""Per-folder record of the files this tool downloaded, keyed by Vimm game id.
+
+`download_game` knows exactly which `game_id` produced which file, so instead of
+fuzzy-matching titles against filenames again on every run, the downloader keeps
+`download_manifest.json` next to the ROMs:
+
+    {"version": 1, "games": {"<game_id>": {"name": "...", "files": [
+        {"path": "stars/4/Game.nds", "size": 123, "mtime": 1700000000000000000}]}}}
+
+Paths are relative to the folder so the whole collection can be moved. A file
+only counts as present when it still exists with the recorded size and mtime;
+anything else falls back to fuzzy matching.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+MANIFEST_FILENAME = 'download_manifest.json'
+MANIFEST_VERSION = 1
+
+
+class DownloadManifest:
+    """game_id -> downloaded files (with size/mtime) for a single download folder."""
+
+    def __init__(self, folder: Path, filename: str = MANIFEST_FILENAME):
+        self.folder = Path(folder)
+        self.path = self.folder / filename
+        self.games: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    return data.get('games', {})
+        except Exception:
+            pass
+        return {}
+
+    def save(self) -> None:
+        """Write the manifest to disk. Errors are ignored (the manifest is only an accelerator)."""
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'games': self.games}, f, indent=2, ensure_ascii=False)
+        except Exception:
+            pass
+
+    def _rel(self, path: Path) -> str:
+        path = Path(path)
+        try:
+            return path.relative_to(self.folder).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _file_entry(self, path: Path) -> Optional[dict]:
+        try:
+            st = Path(path).stat()
+        except OSError:
+            return None
+        return {'path': self._rel(path), 'size': st.st_size, 'mtime': st.st_mtime_ns}
+
+    def record(self, game_id: str, paths: Iterable[Path], name: Optional[str] = None) -> None:
+        """Replace the files recorded for `game_id` with `paths` (missing paths are skipped)."""
+        if not game_id:
+            return
+        files = [e for e in (self._file_entry(p) for p in paths) if e]
+        if files:
+            self.games[game_id] = {'name': name or self.games.get(game_id, {}).get('name'), 'files': files}
+        else:
+            self.games.pop(game_id, None)
+
+    def move(self, old: Path, new: Path) -> bool:
+        """Point any entry that recorded `old` at `new` (after a rename/move). Returns True if one changed."""
+        old_rel = self._rel(old)
+        changed = False
+        for entry in self.games.values():
+            for i, f in enumerate(entry.get('files', [])):
+                if f.get('path') == old_rel:
+                    updated = self._file_entry(new)
+                    if updated:
+                        entry['files'][i] = updated
+                        changed = True
+        return changed
+
+    def files(self, game_id: str) -> List[Path]:
+        """Recorded files for `game_id` that still exist unchanged (empty when unknown or stale)."""
+        entry = self.games.get(game_id) if game_id else None
+        if not entry:
+            return []
+        out: List[Path] = []
+        for f in entry.get('files', []):
+            p = self.folder / f.get('path', '')
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            if st.st_size == f.get('size') and st.st_mtime_ns == f.get('mtime'):
+                out.append(p)
+        return out
@@ -0,0 +1,361 @@
+"""Candidate lookup structures for local ROM matching.
+
+`VimmsDownloader` compares a normalized remote title against every normalized
+local filename key. Doing that with `difflib` for every key is O(catalog x
+library) per console, so this module keeps lookup structures over the keys:
+
+- exact helpers for the "target in key / key in target" containment check: a
+  hash probe of the target's substrings (key in target) and a suffix array over
+  all keys (target in key)
+- keys sorted by length, so the fuzzy stage only visits keys whose length can
+  still reach the threshold
+
+- `FuzzyScorer`, which rejects candidates with cheap upper bounds on the
+  `difflib` ratio before paying for the full `ratio()`
+
+For title matching every shortcut is an upper bound on the ratio, never a
+guess: the index only narrows *which* keys are compared, and finds exactly what
+a linear scan with (substring containment, `SequenceMatcher.ratio() >=
+threshold`) finds. The duplicate report (`duplicate_clusters`) compares every
+key with every other one, so it uses trigram prefix blocking instead, which
+may miss pairs that share no rare trigram.
+"""
+import difflib
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Counters kept by `FuzzyScorer`: keys scored, how many each stage rejected, matches.
+MATCH_STAT_FIELDS = ('scored', 'rejected_length', 'rejected_quick_ratio', 'rejected_ratio', 'matched')
+
+
+def new_match_stats() -> Dict[str, int]:
+    """Return a zeroed instrumentation dict for `FuzzyScorer`."""
+    return {f: 0 for f in MATCH_STAT_FIELDS}
+
+
+def trigrams(s: str) -> Set[str]:
+    """Return the set of 3-character substrings of `s` (empty for short strings)."""
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+class KeySuffixArray:
+    """Suffix array over a list of keys, answering "which keys contain `s`".
+
+    All keys are joined with NUL separators and every suffix start is sorted, so
+    the suffixes beginning with `s` form one contiguous range found by binary
+    search: a lookup costs O(len(s) * log(total chars)) plus the number of hits,
+    independent of how many keys there are. Suffixes are sorted on their first
+    `PREFIX` characters only (to bound memory while building); longer queries
+    are verified against the text.
+    """
+
+    PREFIX = 32
+    SEP = '\x00'
+
+    def __init__(self, keys: List[str]):
+        self.text = self.SEP.join(keys) + self.SEP
+        self._key_starts = array('l')
+        pos = 0
+        for k in keys:
+            self._key_starts.append(pos)
+            pos += len(k) + 1
+
+        # Sort bucket by bucket (first two characters) so only one bucket's
+        # prefix slices exist at a time.
+        text, width = self.text, self.PREFIX
+        buckets: Dict[str, List[int]] = {}
+        for i, ch in enumerate(text):
+            if ch != self.SEP:
+                buckets.setdefault(text[i:i + 2], []).append(i)
+        self._sa = array('l')
+        for head in sorted(buckets):
+            starts = buckets.pop(head)
+            starts.sort(key=lambda i: text[i:i + width])
+            self._sa.extend(starts)
+
+    def _bound(self, probe: str, upper: bool) -> int:
+        """First suffix index whose prefix is >= probe (or > probe when `upper`)."""
+        text, sa, n = self.text, self._sa, len(probe)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            head = text[sa[mid]:sa[mid] + n]
+            if head < probe or (upper and head == probe):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def containing(self, s: str) -> Set[int]:
+        """Positions of keys that contain the non-empty string `s`."""
+        if not s or self.SEP in s:
+            return set()
+        probe = s[:self.PREFIX]
+        lo, hi = self._bound(probe, False), self._bound(probe, True)
+        text, sa, key_starts = self.text, self._sa, self._key_starts
+        verify = len(s) > len(probe)
+        found: Set[int] = set()
+        for idx in range(lo, hi):
+            i = sa[idx]
+            if verify and not text.startswith(s, i):
+                continue
+            found.add(bisect_right(key_starts, i) - 1)
+        return found
+
+
+class FuzzyScorer:
+    """Decide `SequenceMatcher(None, target, key).ratio() >= threshold` for many keys.
+
+    Stages, cheapest first; each is an upper bound on the ratio, so a rejection
+    never drops a real match:
+
+    1. length bound: ratio <= 2*min(len)/(len+len) (what `real_quick_ratio()` computes)
+    2. `quick_ratio()`: character multiset overlap, using a matcher whose seq2 is
+       the target so its character counts are built once per target (`set_seq2`)
+    3. the full `ratio()`, computed with the original (target, key) argument order
+       because `ratio()` is not symmetric
+
+    Pass a dict from `new_match_stats()` as `stats` to count rejections per stage.
+    """
+
+    def __init__(self, target: str, threshold: float, stats: Optional[Dict[str, int]] = None):
+        self.target = target
+        self.threshold = threshold
+        self.stats = stats
+        self._bound = difflib.SequenceMatcher(None)
+        self._bound.set_seq2(target)
+
+    def _count(self, field: str) -> None:
+        if self.stats is not None:
+            self.stats[field] += 1
+
+    def __call__(self, key: str) -> bool:
+        self._count('scored')
+        # Same float expression difflib uses, so the bound is never below ratio()
+        m, n = len(key), len(self.target)
+        if m + n and 2.0 * min(m, n) / (m + n) < self.threshold:
+            self._count('rejected_length')
+            return False
+        self._bound.set_seq1(key)
+        if self._bound.quick_ratio() < self.threshold:
+            self._count('rejected_quick_ratio')
+            return False
+        if difflib.SequenceMatcher(None, self.target, key).ratio() < self.threshold:
+            self._count('rejected_ratio')
+            return False
+        self._count('matched')
+        return True
+
+
+def length_window(n: int, threshold: float) -> Tuple[int, float]:
+    """Inclusive `(lo, hi)` key lengths that can reach `threshold` against a length-`n` target.
+
+    From the length bound `ratio <= 2*min(m, n)/(m + n)`, padded by one so float
+    rounding can only let extra keys through (`FuzzyScorer` applies the exact bound).
+    """
+    if threshold <= 0:
+        return 0, math.inf
+    lo = math.floor(threshold * n / (2.0 - threshold)) - 1
+    hi = math.ceil(n * (2.0 - threshold) / threshold) + 1
+    return max(0, lo), hi
+
+
+class LocalMatchIndex:
+    """Containment and length indexes over normalized local filename keys.
+
+    Keys are referenced by their position in the list passed to the constructor,
+    and every lookup returns positions in ascending order so callers can keep the
+    same "first key wins" ordering as a plain linear scan.
+    """
+
+    def __init__(self, keys: Iterable[str], stats: Optional[Dict[str, int]] = None):
+        # Keep a reference (not a copy) to a list of keys so owners can cheaply tell
+        # whether the index still describes their current key list.
+        self.keys: List[str] = keys if isinstance(keys, list) else list(keys)
+        # Fuzzy-stage instrumentation (see `FuzzyScorer`); may be shared by the owner
+        self.stats: Dict[str, int] = stats if stats is not None else new_match_stats()
+        self._positions: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+        self._max_key_len = max((len(k) for k in self.keys), default=0)
+        self._suffixes = KeySuffixArray(self.keys)
+        # Positions ordered by key length, with the lengths alongside for bisecting
+        self._key_lengths: List[int] = [len(k) for k in self.keys]
+        self._by_length: List[int] = sorted(range(len(self.keys)), key=self._key_lengths.__getitem__)
+        self._lengths: List[int] = [self._key_lengths[i] for i in self._by_length]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def containment_matches(self, target: str) -> List[int]:
+        """Positions of keys where `target in key or key in target`, ascending."""
+        found: Set[int] = set()
+
+        # key in target: every such key is a substring of target, so look up each
+        # distinct substring of target (no longer than the longest key) directly.
+        # This costs O(len(target) * longest key) hash probes whatever the library
+        # size, which keeps it cheaper than walking an automaton over all keys.
+        n = len(target)
+        for i in range(n + 1):
+            for j in range(i, min(n, i + self._max_key_len) + 1):
+                pos = self._positions.get(target[i:j])
+                if pos is not None:
+                    found.add(pos)
+
+        # target in key: one range of the suffix array holds every occurrence.
+        if target:
+            found.update(self._suffixes.containing(target))
+        else:
+            found.update(range(len(self.keys)))
+
+        return sorted(found)
+
+    def fuzzy_candidates(self, target: str, threshold: float) -> List[int]:
+        """Positions of keys whose length can still reach `threshold` against `target`, ascending.
+
+        Lossless: every key a linear `difflib` scan would match is included (only
+        keys failing the ratio's length bound are skipped). Sharing no word or
+        trigram is no such bound ('v i p' vs 'vip' scores 0.75), so candidates
+        are not filtered on shared text; at low thresholds the window is most
+        of the library and `FuzzyScorer`'s bounds do the pruning.
+        """
+        lo, hi = length_window(len(target), threshold)
+        start = bisect_left(self._lengths, lo)
+        end = len(self._lengths) if hi == math.inf else bisect_right(self._lengths, hi)
+        if start == 0 and end == len(self._lengths):
+            return list(range(len(self.keys)))
+        if 4 * (end - start) < len(self._lengths):
+            return sorted(self._by_length[start:end])
+        # A wide window: filtering in position order beats sorting it
+        lo, hi = self._lengths[start], self._lengths[end - 1]
+        return [i for i, n in enumerate(self._key_lengths) if lo <= n <= hi]
+
+    def fuzzy_matches(self, target: str, threshold: float, first_only: bool = False,
+                      candidates: Optional[List[int]] = None) -> List[int]:
+        """Positions of candidate keys whose `difflib` ratio to `target` reaches `threshold`.
+
+        `candidates` (ascending positions) overrides `fuzzy_candidates`, e.g. with
+        the output of the vector backend.
+        """
+        out: List[int] = []
+        scorer = FuzzyScorer(target, threshold, self.stats)
+        for i in (self.fuzzy_candidates(target, threshold) if candidates is None else candidates):
+            if scorer(self.keys[i]):
+                out.append(i)
+                if first_only:
+                    break
+        return out
+
+    def first_match(self, target: str, threshold: float) -> Optional[int]:
+        """Position of the key `is_game_present` would pick, or None."""
+        contained = self.containment_matches(target)
+        if contained:
+            return contained[0]
+        fuzzy = self.fuzzy_matches(target, threshold, first_only=True)
+        return fuzzy[0] if fuzzy else None
+
+
+def match_targets(index: LocalMatchIndex, targets: List[str], threshold: float,
+                  candidates: Optional[List[List[int]]] = None) -> List[List[int]]:
+    """Matching key positions per normalized target: containment hits, then fuzzy hits.
+
+    This is the order `VimmsDownloader.find_all_matching_files` reports files in.
+    `candidates` optionally supplies the fuzzy candidate positions per target.
+    """
+    out: List[List[int]] = []
+    for n, target in enumerate(targets):
+        positions = index.containment_matches(target)
+        positions += index.fuzzy_matches(target, threshold, candidates=None if candidates is None else candidates[n])
+        out.append(positions)
+    return out
+
+
+def match_targets_for_keys(keys: List[str], targets: List[str], threshold: float,
+                           backend: str = 'index') -> List[List[int]]:
+    """Build an index over `keys` and match `targets` against it.
+
+    Takes and returns only plain lists so it can run in a worker process
+    (`concurrent.futures.ProcessPoolExecutor`); the keys are shipped once per call.
+    """
+    index = LocalMatchIndex(keys)
+    candidates = None
+    if backend == 'vector':
+        from downloader_lib import vector_matching
+        if vector_matching.available():
+            candidates = vector_matching.TrigramVectorIndex(index.keys).candidates(
+                targets, vector_matching.cutoff_for(threshold))
+    return match_targets(index, targets, threshold, candidates)
+
+
+def _padded_trigrams(key: str) -> Set[str]:
+    # Padding gives short keys trigrams and weights their first and last characters
+    return trigrams(f'  {key}  ')
+
+
+def duplicate_pairs(keys: List[str], threshold: float) -> Iterable[Tuple[int, int]]:
+    """Candidate `(i, j)` pairs (`i < j`) for `duplicate_clusters`, from trigram prefix blocking.
+
+    Two keys with ratio >= `threshold` have at most a `1 - threshold` share of
+    unmatched characters, and each one breaks at most three trigrams, so they
+    are expected to share at least `overlap = 1 - 3 * (1 - threshold)` of their
+    trigrams. With trigrams ordered rarest first, two sets sharing that share
+    must share one of the first `len - ceil(overlap * len) + 1` trigrams of each
+    (prefix filtering), so only those prefixes are posted and probed. Common
+    trigrams ('the', ' of') end up outside most prefixes, which keeps the
+    postings short.
+
+    Unlike `fuzzy_candidates` this is a heuristic: pairs whose matching blocks
+    are too short to share trigrams ('v i p' vs 'vip') are not proposed.
+    """
+    grams = [_padded_trigrams(k) for k in keys]
+    freq: Dict[str, int] = {}
+    for gs in grams:
+        for g in gs:
+            freq[g] = freq.get(g, 0) + 1
+    overlap = max(0.0, 1.0 - 3.0 * (1.0 - threshold))
+    postings: Dict[str, List[int]] = {}
+    for j, gs in enumerate(grams):
+        ordered = sorted(gs, key=lambda g: (freq[g], g))
+        prefix = ordered[:len(ordered) - math.ceil(overlap * len(ordered)) + 1]
+        earlier: Set[int] = set()
+        for g in prefix:
+            posted = postings.setdefault(g, [])
+            earlier.update(posted)
+            posted.append(j)
+        for i in sorted(earlier):
+            yield i, j
+
+
+def duplicate_clusters(index: LocalMatchIndex, threshold: float) -> List[List[int]]:
+    """Group keys into clusters of near-identical keys in one pass (union-find).
+
+    Candidate pairs come from trigram prefix blocking (`duplicate_pairs`), and
+    every pair whose `difflib` ratio reaches `threshold` (behind `FuzzyScorer`'s
+    bounds) is merged. Clustering is transitive, so a chain of close keys ends
+    up in one cluster. Returns the clusters with more than one key (positions
+    ascending, clusters ordered by their first position).
+    """
+    keys = index.keys
+    parent = list(range(len(keys)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    scorer = None
+    for i, j in duplicate_pairs(keys, threshold):
+        ri, rj = find(i), find(j)
+        if ri == rj:
+            continue
+        # Pairs arrive grouped by their later key, which is scored against the earlier ones
+        if scorer is None or scorer.target is not keys[j]:
+            scorer = FuzzyScorer(keys[j], threshold, index.stats)
+        if scorer(keys[i]):
+            parent[max(ri, rj)] = min(ri, rj)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(keys)):
+        clusters.setdefault(find(i), []).append(i)
+    return [c for c in clusters.values() if len(c) > 1]
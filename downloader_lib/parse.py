@@ -1,7 +1,7 @@
 """HTML parsing helpers for Vimm's Lair downloader."""
 import re
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 import requests
 
@@ -11,6 +11,25 @@ DOWNLOAD_BASE = "https://dl2.vimm.net"
 def parse_game_details(html_content: str) -> Dict[str, any]:
     """Parse game details (size, format, rating) from game page HTML."""
     soup = BeautifulSoup(html_content, 'html.parser')
+    details = _size_and_extension(html_content)
+    
+    # Find rating (star icons or score)
+    rating_container = soup.find('div', class_=_RATING_CLASS_RE)
+    if rating_container:
+        stars = len(rating_container.find_all('img', src=_STAR_SRC_RE))
+        if stars > 0:
+            details['rating'] = stars
+    else:
+        _add_text_rating(details, html_content)
+    
+    return details
+
+# Rating container and star icons on game pages
+_RATING_CLASS_RE = re.compile(r'rating|score', re.I)
+_STAR_SRC_RE = re.compile(r'star', re.I)
+
+def _size_and_extension(html_content: str) -> Dict[str, any]:
+    """Size and format of a game page, found in the raw HTML (no tree needed)."""
     details = {}
     
     # Find size and format in the download form or nearby text
@@ -28,31 +47,45 @@ def parse_game_details(html_content: str) -> Dict[str, any]:
     if format_match:
         details['extension'] = format_match.group(1).lower()
     
-    # Find rating (star icons or score)
-    rating_container = soup.find('div', class_=re.compile(r'rating|score', re.I))
-    if rating_container:
-        stars = len(rating_container.find_all('img', src=re.compile(r'star', re.I)))
-        if stars > 0:
-            details['rating'] = stars
-    else:
-        # Look for text-based rating
-        rating_text = re.search(r'(\d+(\.\d+)?)\s*(?:out of|/)\s*\d+', html_content)
-        if rating_text:
-            details['rating'] = float(rating_text.group(1))
-    
     return details
 
+def _add_text_rating(details: Dict[str, any], html_content: str) -> None:
+    """Look for a text-based rating ('8.5 out of 10', '8/10') when there is no rating container."""
+    rating_text = re.search(r'(\d+(\.\d+)?)\s*(?:out of|/)\s*\d+', html_content)
+    if rating_text:
+        details['rating'] = float(rating_text.group(1))
+
+# Class of the results table on section pages
+RESULTS_TABLE_CLASS = 'rounded centered cellpadding1 hovertable striped'
+# Section pages are only parsed for the results table and links (rows + pager)
+_SECTION_STRAINER = SoupStrainer(['table', 'a'])
+_NEXT_RE = re.compile(r'Next', re.IGNORECASE)
+
+def parse_section_page(html_content: str, section: str) -> Tuple[List[Dict[str, str]], bool]:
+    """Parse a section page once: `(games, has_next)`.
+
+    Only tables and links are built into the tree (`SoupStrainer`), which is all
+    the game rows and the "Next" pager link need.
+    """
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=_SECTION_STRAINER)
+    table = soup.find('table', {'class': RESULTS_TABLE_CLASS})
+    games = _parse_game_rows(table, section) if table else []
+    has_next = soup.find('a', string=_NEXT_RE) is not None
+    return games, has_next
+
 def parse_games_from_section(html_content: str, section: str) -> List[Dict[str, str]]:
     """Parse a list of games from the HTML of a section page.
     
     Extracts: name, game_id, page_url, section, and rating (if available in table).
     """
-    games = []
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table', {'class': 'rounded centered cellpadding1 hovertable striped'})
-    if not table:
-        return []
+    return parse_section_page(html_content, section)[0]
+
+def has_next_page(html_content: str) -> bool:
+    """Whether a section page links to a following page ('Next')."""
+    return parse_section_page(html_content, '')[1]
 
+def _parse_game_rows(table, section: str) -> List[Dict[str, str]]:
+    games = []
     rows = table.find_all('tr')
     for row in rows:
         cells = row.find_all('td')
@@ -72,56 +105,84 @@ def parse_games_from_section(html_content: str, section: str) -> List[Dict[str,
         if isinstance(href, (list, tuple)):
             href = href[0]
         href = str(href)
-        game_id = href.split('/')[-1]
-        page_url = BASE_URL + href
         
         # Extract rating from the Rating column (usually last or second-to-last cell)
         # Vimm's section pages have columns: Title, Region, Version, Languages, Rating
-        rating = None
-        if len(cells) >= 5:  # Has rating column
-            rating_cell = cells[4]  # Rating is typically the 5th column (index 4)
-            rating_text = rating_cell.text.strip()
-            # Rating can be a number like "8.4" or "none"
-            if rating_text and rating_text.lower() not in ['none', '-', '—', '']:
-                try:
-                    rating = float(rating_text)
-                except (ValueError, TypeError):
-                    pass  # Invalid rating, leave as None
+        rating_text = cells[4].text if len(cells) >= 5 else None  # Rating is typically the 5th column (index 4)
+        games.append(_game_row(name, href, section, rating_text))
         
-        game_dict = {
-            'name': name,
-            'page_url': page_url,
-            'game_id': game_id,
-            'section': section
-        }
-        
-        if rating is not None:
-            game_dict['rating'] = rating
-            
-        games.append(game_dict)
-        
-    return games
     return games
 
+def _game_row(name: str, href: str, section: str, rating_text: Optional[str]) -> Dict[str, str]:
+    """Build a game dict from a results-table row's link and (optional) rating cell text."""
+    game_id = href.split('/')[-1]
+    page_url = BASE_URL + href
+    
+    rating = None
+    if rating_text is not None:  # Has rating column
+        rating_text = rating_text.strip()
+        # Rating can be a number like "8.4" or "none"
+        if rating_text and rating_text.lower() not in ['none', '-', '—', '']:
+            try:
+                rating = float(rating_text)
+            except (ValueError, TypeError):
+                pass  # Invalid rating, leave as None
+    
+    game_dict = {
+        'name': name,
+        'page_url': page_url,
+        'game_id': game_id,
+        'section': section
+    }
+    
+    if rating is not None:
+        game_dict['rating'] = rating
+        
+    return game_dict
+
+# Download form/link detection on game pages
+_MEDIA_ID_NAME_RE = re.compile(r'^mediaId$', re.I)
+_MEDIA_ID_HREF_RE = re.compile(r'mediaId=', re.IGNORECASE)
+
 def resolve_download_form(html_content: str, session: requests.Session, game_page_url: str, game_id: str, logger) -> Optional[str]:
     """Find the download form and resolve the final download URL, handling POSTs."""
     soup = BeautifulSoup(html_content, 'html.parser')
     dl_form = soup.find(id='dl_form') or soup.find('form', attrs={'id': 'dl_form'})
 
-    media_id = None
+    form = None
     if dl_form:
-        media_input = dl_form.find('input', attrs={'name': 'mediaId'}) or dl_form.find('input', attrs={'name': re.compile(r'^mediaId$', re.I)})
-        if media_input:
-            media_id = media_input.get('value')
+        media_input = dl_form.find('input', attrs={'name': 'mediaId'}) or dl_form.find('input', attrs={'name': _MEDIA_ID_NAME_RE})
+        form = {
+            'action': dl_form.get('action'),
+            'method': dl_form.get('method'),
+            'inputs': [(inp.get('name'), inp.get('value')) for inp in dl_form.find_all('input')],
+            'media_id': media_input.get('value') if media_input else None,
+        }
+
+    a = soup.find('a', href=_MEDIA_ID_HREF_RE)
+    alt = soup.find('input', attrs={'name': _MEDIA_ID_NAME_RE})
+    return _resolve_download_url(form, a.get('href') if a else None, alt.get('value') if alt else None, game_id, logger)
+
+def _resolve_download_url(form: Optional[Dict], anchor_href: Optional[str], page_media_id: Optional[str], game_id: str, logger) -> Optional[str]:
+    """Resolve the download URL from what a parser found on a game page.
+
+    `form` describes the `dl_form` element (`action`, `method`, `inputs` as
+    `(name, value)` pairs, `media_id`), `anchor_href` is the first link with
+    `mediaId=` in it and `page_media_id` the value of the first `mediaId` input
+    anywhere on the page.
+    """
+    media_id = None
+    if form:
+        media_id = form.get('media_id')
 
-        action = (dl_form.get('action') or '').strip()
-        params = {inp.get('name'): inp.get('value') for inp in dl_form.find_all('input') if inp.get('name') and inp.get('value') is not None}
+        action = (form.get('action') or '').strip()
+        params = {name: value for name, value in form.get('inputs', []) if name and value is not None}
         if media_id and 'mediaId' not in params:
             params['mediaId'] = media_id
 
         if action:
             action_url = urljoin(BASE_URL + '/', action)
-            method = (dl_form.get('method') or 'get').lower()
+            method = (form.get('method') or 'get').lower()
             parsed = urlparse(action_url)
             q = parse_qs(parsed.query)
             for k, v in list(q.items()):
@@ -147,15 +208,13 @@ def resolve_download_form(html_content: str, session: requests.Session, game_pag
                     return download_url
 
     # Fallbacks if form parsing fails
-    a = soup.find('a', href=re.compile(r'mediaId=', re.IGNORECASE))
-    if a and a.get('href'):
-        resolved = urljoin(BASE_URL + '/', a.get('href'))
+    if anchor_href:
+        resolved = urljoin(BASE_URL + '/', anchor_href)
         if logger: logger.info(f"Resolved download URL via anchor for {game_id}: {resolved}")
         return resolved
 
     if not media_id:
-        alt = soup.find('input', attrs={'name': re.compile(r'^mediaId$', re.I)})
-        media_id = alt.get('value') if alt else None
+        media_id = page_media_id
     if media_id:
         fallback = f"{DOWNLOAD_BASE}/?mediaId={media_id}"
         if logger: logger.info(f"Fallback constructed download URL for {game_id}: {fallback}")
@@ -0,0 +1,331 @@
+"""Token-bucket rate limiting for requests to Vimm's Lair.
+
+Section and page listings are fetched from a thread pool, so instead of each
+caller sleeping `delay_between_page_requests` between its own requests, every
+request takes a token from one bucket shared by the whole process. The bucket
+refills at `rate` tokens per second up to `burst`, which caps the global request
+rate while letting concurrent fetches overlap their network latency.
+
+`AdaptiveTokenBucket` also adapts the rate to the server (AIMD, as in TCP
+congestion control): every successful response adds a little to the rate,
+a 429 or 5xx halves it, and a `Retry-After` pauses the whole bucket. The learned
+rate is saved to a small JSON file so the next run starts where this one ended.
+
+A bucket can also be shared between processes (`run_vimms.py`, the web UI and
+its download subprocesses running at the same time): with `shared_path` the
+token balance lives in a small file updated under an exclusive file lock, so
+every process draws from one budget. If the file can't be used the bucket
+falls back to its own in-process balance.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Token balance shared by every process on this machine (see `SharedBudget`)
+SHARED_BUDGET_PATH = Path(tempfile.gettempdir()) / 'vimms_request_budget.json'
+
+
+@contextmanager
+def _file_lock(f):
+    """Hold an exclusive lock on an open file (blocks until it is free)."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:  # LK_LOCK gives up after ~10s
+                continue
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SharedBudget:
+    """Token balance kept in a file, updated under a lock by any number of processes.
+
+    The file holds `{"tokens": .., "updated": <unix time>}`; wall-clock time is
+    used because monotonic clocks are not comparable between processes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def update(self, rate: float, burst: float, change: Callable[[float], Tuple[float, float]]) -> float:
+        """Refill the balance, apply `change(tokens) -> (new_tokens, result)`, return `result`.
+
+        Raises `OSError` when the file can't be opened or locked.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+b') as f, _file_lock(f):
+            f.seek(0)
+            try:
+                state = json.loads(f.read() or b'{}')
+            except ValueError:
+                state = {}
+            now = time.time()
+            try:
+                tokens = float(state.get('tokens', burst))
+                updated = float(state.get('updated', now))
+            except (TypeError, ValueError):
+                tokens, updated = burst, now
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+            tokens, result = change(tokens)
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps({'tokens': tokens, 'updated': now}).encode('utf-8'))
+            f.flush()
+        return result
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `acquire()` blocks until a request may be sent.
+
+    With `shared_path` the balance is shared with other processes (`SharedBudget`).
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, shared_path: Optional[Path] = None):
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self.shared: Optional[SharedBudget] = None
+        self.share(shared_path)
+
+    def share(self, path: Optional[Path]) -> None:
+        """Draw tokens from the cross-process balance in `path` (None: this process only)."""
+        with self._lock:
+            self.shared = SharedBudget(path) if path else None
+
+    def _take_shared(self, change: Callable[[float], Tuple[float, float]]) -> Optional[float]:
+        """Apply `change` to the shared balance; None when there is none or it failed."""
+        if self.shared is None:
+            return None
+        try:
+            return self.shared.update(self.rate, self.burst, change)
+        except OSError:
+            return None
+
+    def configure(self, rate: float, burst: float = 1.0) -> None:
+        """Change the refill rate (tokens/second) and bucket size."""
+        with self._lock:
+            self.rate = max(float(rate), 1e-6)
+            self.burst = max(float(burst), 1.0)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token now and return how long to wait before using it (seconds).
+
+        Waiting callers reserve their token up front (the balance goes negative),
+        so concurrent callers are served in arrival order and never overshoot the
+        rate. Async callers `await asyncio.sleep(bucket.reserve())`.
+        """
+        with self._lock:
+            rate = self.rate
+
+            def take(tokens):
+                tokens -= 1.0
+                return tokens, (-tokens / rate if tokens < 0 else 0.0)
+
+            wait = self._take_shared(take)
+            if wait is not None:
+                return wait
+            self._refill(time.monotonic())
+            self._tokens, wait = take(self._tokens)
+            return wait
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns the time waited (seconds)."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for at least `seconds` from now (e.g. a `Retry-After`)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            # Running a token debt keeps waiting callers in arrival order after the pause
+            debt = -seconds * self.rate
+            if self._take_shared(lambda tokens: (min(tokens, debt), 0.0)) is not None:
+                return
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, debt)
+
+    def record(self, status: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """Report a response; honours `Retry-After`. Returns the pause applied (seconds)."""
+        wait = retry_after_seconds(headers) if status == 429 or status >= 500 else None
+        if wait:
+            self.pause(wait)
+        return wait or 0.0
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header (delta-seconds or HTTP date), else None."""
+    value = (headers or {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket whose rate follows the server: additive increase, multiplicative decrease.
+
+    - a success (status < 400, including 304) raises the rate by `increase`
+      requests/second, up to `max_rate`
+    - a 429 or 5xx multiplies it by `decrease`, down to `min_rate`; responses in
+      the same burst (within `cooldown` seconds) only count once
+    - `Retry-After` pauses the bucket as in `TokenBucket.record`
+
+    With `state_path` the rate is loaded on creation and saved (at most every
+    `save_interval` seconds, and by `save()`).
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, min_rate: float = 0.2, max_rate: float = 4.0,
+                 increase: float = 0.05, decrease: float = 0.5, cooldown: float = 2.0,
+                 state_path: Optional[Path] = None, save_interval: float = 30.0,
+                 shared_path: Optional[Path] = None):
+        self.min_rate = max(float(min_rate), 1e-6)
+        self.max_rate = max(float(max_rate), self.min_rate)
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+        self.cooldown = float(cooldown)
+        self.state_path = Path(state_path) if state_path else None
+        self.save_interval = float(save_interval)
+        self._last_decrease = float('-inf')
+        self._last_save = time.monotonic()
+        self._dirty = False
+        # Instrumentation: responses that raised / lowered the rate
+        self.stats = {'increases': 0, 'decreases': 0}
+        saved = self._load_rate()
+        super().__init__(self._clamp(saved if saved is not None else rate), burst, shared_path)
+
+    def _clamp(self, rate: float) -> float:
+        return min(self.max_rate, max(self.min_rate, float(rate)))
+
+    def set_bounds(self, min_rate: float, max_rate: float) -> None:
+        """Change the rate limits, clamping the current rate into them."""
+        with self._lock:
+            self.min_rate = max(float(min_rate), 1e-6)
+            self.max_rate = max(float(max_rate), self.min_rate)
+            self.rate = self._clamp(self.rate)
+
+    def record(self, status: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        now = time.monotonic()
+        with self._lock:
+            old = self.rate
+            if status == 429 or status >= 500:
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self._refill(now)
+                    self.rate = self._clamp(self.rate * self.decrease)
+                    self.stats['decreases'] += 1
+            elif status < 400:
+                self._refill(now)
+                self.rate = self._clamp(self.rate + self.increase)
+                self.stats['increases'] += 1
+            self._dirty = self._dirty or self.rate != old
+            save = self._dirty and now - self._last_save >= self.save_interval
+        if save:
+            self.save()
+        return super().record(status, headers)
+
+    def _load_rate(self) -> Optional[float]:
+        if self.state_path is None:
+            return None
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return float(json.load(f)['rate'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self) -> None:
+        """Write the current rate to `state_path` (errors are ignored)."""
+        if self.state_path is None:
+            return
+        with self._lock:
+            self._dirty = False
+            self._last_save = time.monotonic()
+            data = json.dumps({'rate': self.rate, 'saved_at': time.time()})
+        tmp = self.state_path.with_name(f'{self.state_path.name}.{os.getpid()}.tmp')
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass
+
+
+_SHARED: Optional[TokenBucket] = None
+_SHARED_CONFIG = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_limiter(rate: float, burst: float = 1.0, adaptive: Optional[dict] = None,
+                   state_path: Optional[Path] = None, shared_path: Optional[Path] = None) -> TokenBucket:
+    """Return the process-wide bucket, (re)configured when the settings change.
+
+    Every `VimmsDownloader` in a process (the web UI keeps one per console)
+    shares this bucket, so the budget holds no matter how many run at once;
+    `shared_path` extends that to other processes (`SharedBudget`).
+    With `adaptive` (`{'min_rate': .., 'max_rate': ..}`) it is an
+    `AdaptiveTokenBucket` starting from the rate saved in `state_path`, or
+    `rate` when there is none. The learned rate survives later calls, even with
+    different settings: those only change the burst, the shared budget and the
+    bounds (clamping the current rate into them), not the rate itself.
+    """
+    global _SHARED, _SHARED_CONFIG
+    config = (max(float(rate), 1e-6), max(float(burst), 1.0), tuple(sorted((adaptive or {}).items())),
+              str(shared_path) if shared_path else None)
+    with _SHARED_LOCK:
+        if _SHARED is None or isinstance(_SHARED, AdaptiveTokenBucket) != bool(adaptive):
+            if adaptive:
+                _SHARED = AdaptiveTokenBucket(rate, burst, state_path=state_path, shared_path=shared_path, **adaptive)
+            else:
+                _SHARED = TokenBucket(rate, burst, shared_path)
+        elif config != _SHARED_CONFIG:
+            _SHARED.share(shared_path)
+            if adaptive:
+                # `rate` is only the starting point; keep what has been learned since
+                _SHARED.configure(_SHARED.rate, burst)
+                _SHARED.set_bounds(adaptive.get('min_rate', _SHARED.min_rate), adaptive.get('max_rate', _SHARED.max_rate))
+            else:
+                _SHARED.configure(rate, burst)
+        _SHARED_CONFIG = config
+        return _SHARED
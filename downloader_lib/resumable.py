@@ -0,0 +1,202 @@
+"""Resumable downloads: `.part` files with sidecar metadata and `Range` requests.
+
+`download_game` used to write straight into the target with `open(path, 'wb')`,
+so every retry (and every later run) of an interrupted multi-GB disc image
+started again from byte zero. `PartialDownload` keeps the bytes received so far
+in `<download dir>/<game_id>.part`, next to `<game_id>.part.json` holding what
+is needed to continue them safely:
+
+- `url` and `filename` (from Content-Disposition) of the transfer
+- `length`: the full size in bytes (Content-Length / Content-Range total)
+- `etag` / `last_modified`: validators of the response that started the part
+
+The next request for the same URL sends `Range: bytes=<received>-` with
+`If-Range` (the strong ETag, else Last-Modified). A `206` whose Content-Range
+starts at the received size and reports the same full length is appended;
+a `200` (the server ignores ranges, or the file changed) restarts the part from
+zero. The part is moved into place with `os.replace` only once it holds exactly
+`length` bytes, so a truncated archive never appears under its real name.
+
+Parts are named after the game id because the real filename is only known
+once the server has answered. Parts fetched in parallel ranges (see
+`segmented.py`) also keep their per-segment progress in the sidecar.
+"""
+import json
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)', re.IGNORECASE)
+
+
+class IncompleteDownload(Exception):
+    """The response or the part file does not match the expected bytes."""
+
+
+def parse_content_range(value: Optional[str]) -> Optional[Tuple[int, int, Optional[int]]]:
+    """`(first, last, total)` from a Content-Range header (total is None for `*`)."""
+    m = _CONTENT_RANGE_RE.match((value or '').strip())
+    if not m:
+        return None
+    total = None if m.group(3) == '*' else int(m.group(3))
+    return int(m.group(1)), int(m.group(2)), total
+
+
+def full_length(response) -> Optional[int]:
+    """Size of the whole file behind a 200/206 response, when the headers state it."""
+    headers = response.headers
+    if response.status_code == 206:
+        rng = parse_content_range(headers.get('Content-Range'))
+        return rng[2] if rng else None
+    encoding = (headers.get('Content-Encoding') or 'identity').lower()
+    length = headers.get('Content-Length')
+    # An encoded body is decoded while streaming, so its length is not the file's
+    if encoding != 'identity' or not length or not length.isdigit():
+        return None
+    return int(length)
+
+
+class PartialDownload:
+    """The `.part` file and sidecar for one game in `directory`."""
+
+    def __init__(self, directory, game_id: str):
+        directory = Path(directory)
+        self.path = directory / f'{game_id}.part'
+        self.meta_path = directory / f'{game_id}.part.json'
+        self.meta: Dict = self._load()
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def save(self) -> None:
+        """Write the sidecar."""
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f)
+
+    @property
+    def received(self) -> int:
+        """Bytes received so far (the part's size, or the segments' progress)."""
+        segments = self.meta.get('segments')
+        if segments:
+            return sum(done for _, _, done in segments)
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def validator(self) -> Optional[str]:
+        """`If-Range` value for the part: its strong ETag, else Last-Modified."""
+        etag = self.meta.get('etag')
+        return etag if etag and not etag.startswith('W/') else self.meta.get('last_modified')
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """`Range`/`If-Range` headers continuing the part, or `{}` to download from the start.
+
+        Only parts started from the same URL with a known full length are resumed;
+        segmented parts are continued by `SegmentedDownload` instead.
+        """
+        received = self.received
+        length = self.meta.get('length')
+        if (not received or not length or received >= length or self.meta.get('url') != url
+                or self.meta.get('segments')):
+            return {}
+        headers = {'Range': f'bytes={received}-'}
+        validator = self.validator()
+        if validator:
+            headers['If-Range'] = validator
+        return headers
+
+    def begin(self, response, url: str, filename: str, segmented: bool = False) -> int:
+        """Record `response` in the sidecar and return the offset its body starts at.
+
+        A 206 must continue the part exactly (same URL, starting at the received
+        size, same full length); otherwise the part is dropped and
+        `IncompleteDownload` raised so the next attempt starts over. Any other
+        response restarts the part from zero.
+
+        With `segmented` the response is the reply to a `Range: bytes=0-0` probe
+        and only its length and validators are used; the segment progress of the
+        same file (URL, length and validators) is kept.
+        """
+        offset = 0
+        length = full_length(response)
+        segments = None
+        if segmented:
+            if self._same_file(response, url, length):
+                segments = self.meta.get('segments')
+        elif response.status_code == 206:
+            rng = parse_content_range(response.headers.get('Content-Range'))
+            received = self.received
+            if (rng is None or rng[0] != received or self.meta.get('url') != url
+                    or length is None or length != self.meta.get('length')):
+                self.discard()
+                raise IncompleteDownload(f"Server answered the resume request with an unexpected range "
+                                         f"({response.headers.get('Content-Range')!r}); restarting")
+            offset = received
+        self.meta = {
+            'url': url,
+            'filename': filename,
+            'length': length,
+            'etag': response.headers.get('ETag') or (self.meta.get('etag') if offset else None),
+            'last_modified': response.headers.get('Last-Modified') or (self.meta.get('last_modified') if offset else None),
+        }
+        if segments:
+            self.meta['segments'] = segments
+        self.save()
+        return offset
+
+    def _same_file(self, response, url: str, length: Optional[int]) -> bool:
+        if not self.meta or self.meta.get('url') != url or length is None or self.meta.get('length') != length:
+            return False
+        for header, key in (('ETag', 'etag'), ('Last-Modified', 'last_modified')):
+            if response.headers.get(header) != self.meta.get(key):
+                return False
+        return True
+
+    def preallocate(self, length: int) -> None:
+        """Size the part to `length` bytes, keeping its contents when segment progress exists."""
+        keep = self.path.exists() and any(done for _, _, done in self.meta.get('segments') or ())
+        with open(self.path, 'r+b' if keep else 'wb') as f:
+            f.truncate(length)
+
+    def open(self, offset: int) -> BinaryIO:
+        """The part file opened for writing at `offset` (anything after it is cut off)."""
+        f = open(self.path, 'r+b' if offset and self.path.exists() else 'wb')
+        f.seek(offset)
+        f.truncate()
+        return f
+
+    def finish(self, target: Path) -> Path:
+        """Move the verified part to `target` and drop the sidecar.
+
+        Raises `IncompleteDownload` (keeping the part for a resume) when it does
+        not hold the expected number of bytes.
+        """
+        length = self.meta.get('length')
+        received = self.received
+        if length is not None and (received != length or self.path.stat().st_size != length):
+            raise IncompleteDownload(f'Download incomplete: {received} of {length} bytes received')
+        os.replace(self.path, target)
+        self._drop_meta()
+        return Path(target)
+
+    def discard(self) -> None:
+        """Delete the part and its sidecar."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+        self._drop_meta()
+
+    def _drop_meta(self) -> None:
+        self.meta = {}
+        try:
+            self.meta_path.unlink()
+        except OSError:
+            pass
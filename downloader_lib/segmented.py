@@ -0,0 +1,145 @@
+"""Parallel range downloads of one file into a preallocated `.part`.
+
+One TCP stream often can't fill the link for the multi-GB `.7z` disc images of
+PS2, Wii, GameCube or Dreamcast games. When the download server answers with
+`Accept-Ranges: bytes`, `SegmentedDownload` splits the file into contiguous
+ranges and fetches them concurrently, each worker writing at its own offset of
+a `.part` file preallocated to the full length (see `resumable.py`).
+
+- the plan (`[start, end, done]` per segment, end inclusive) is kept in the
+  part's sidecar, so an interrupted transfer continues each segment where it
+  stopped
+- the caller learns the length and range support from a `Range: bytes=0-0`
+  probe, and takes `workers` from `network.segmented_download.segments`,
+  capped at the per-host connection budget (`network.download_connections`)
+  that sizes the shared session's download pool
+- every range request first takes a token from the shared rate limiter, so the
+  segments stay within the same request budget as every other request
+- a segment answered with a `200` or the wrong `Content-Range` (the server
+  stopped honouring ranges, or the file changed) drops the part and raises
+  `IncompleteDownload`; other failures keep the progress for the next attempt
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from .resumable import IncompleteDownload, PartialDownload, parse_content_range
+
+CHUNK_SIZE = 64 * 1024
+SAVE_INTERVAL = 2.0        # Seconds between sidecar writes while segments run
+PROGRESS_INTERVAL = 0.5    # Seconds between progress callbacks
+
+
+def plan_segments(length: int, count: int) -> List[List[int]]:
+    """`count` contiguous `[start, end, done]` ranges covering `length` bytes."""
+    count = max(1, min(count, length))
+    size, extra = divmod(length, count)
+    segments, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0) - 1
+        segments.append([start, end, 0])
+        start = end + 1
+    return segments
+
+
+class SegmentedDownload:
+    """Fetch the part's missing ranges over up to `workers` concurrent requests.
+
+    `part.meta` must hold the file's `length` (from `PartialDownload.begin`); a
+    plan of `workers` segments is made unless the sidecar already has one.
+    `progress(downloaded, total)` is called from the worker threads.
+    """
+
+    def __init__(self, session, url: str, part: PartialDownload, headers: Optional[Dict[str, str]] = None,
+                 workers: int = 4, limiter=None, progress: Optional[Callable[[int, int], None]] = None,
+                 verify: bool = True):
+        self.session = session
+        self.url = url
+        self.part = part
+        self.headers = dict(headers or {})
+        self.workers = max(1, int(workers))
+        self.limiter = limiter
+        self.progress = progress
+        self.verify = verify
+        self.length = int(part.meta['length'])
+        if not part.meta.get('segments'):
+            part.meta['segments'] = plan_segments(self.length, self.workers)
+        self.segments: List[List[int]] = part.meta['segments']
+        self.downloaded = part.received
+        self._lock = threading.Lock()
+        self._rejected = threading.Event()
+        self._last_save = self._last_progress = 0.0
+
+    def run(self) -> None:
+        """Download every unfinished segment; raises the first segment error afterwards."""
+        self.part.preallocate(self.length)
+        self.part.save()
+        pending = [seg for seg in self.segments if seg[2] < seg[1] - seg[0] + 1]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(pending) or 1)) as pool:
+            futures = [pool.submit(self._fetch, seg) for seg in pending]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if self._rejected.is_set():
+            self.part.discard()
+        else:
+            with self._lock:
+                self.part.save()
+        if self.progress:
+            self.progress(self.downloaded, self.length)
+        if errors:
+            raise errors[0]
+
+    def _fetch(self, seg: List[int]) -> None:
+        start, end, done = seg
+        if self._rejected.is_set():
+            return
+        headers = dict(self.headers, Range=f'bytes={start + done}-{end}')
+        validator = self.part.validator()
+        if validator:
+            headers['If-Range'] = validator
+        if self.limiter is not None:
+            self.limiter.acquire()
+        response = self.session.get(self.url, headers=headers, verify=self.verify, allow_redirects=True, stream=True)
+        try:
+            if self.limiter is not None:
+                self.limiter.record(response.status_code, response.headers)
+            if response.status_code in (200, 206):
+                rng = parse_content_range(response.headers.get('Content-Range'))
+                if response.status_code == 200 or rng is None or rng[0] != start + done or rng[2] != self.length:
+                    self._rejected.set()
+                    raise IncompleteDownload(f"Segment {start}-{end} answered with HTTP {response.status_code} "
+                                             f"({response.headers.get('Content-Range')!r}); restarting")
+            else:
+                raise IncompleteDownload(f'Segment {start}-{end} failed with HTTP {response.status_code}')
+
+            with open(self.part.path, 'r+b') as f:
+                f.seek(start + done)
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if self._rejected.is_set():
+                        return
+                    chunk = chunk[:end + 1 - (start + seg[2])]
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    # Count bytes only once they are out of Python's buffer
+                    f.flush()
+                    with self._lock:
+                        seg[2] += len(chunk)
+                        self.downloaded += len(chunk)
+                        self._tick()
+                    if start + seg[2] > end:
+                        break
+        finally:
+            response.close()
+        if start + seg[2] <= end:
+            raise IncompleteDownload(f'Segment {start}-{end} ended after {seg[2]} bytes')
+
+    def _tick(self) -> None:
+        # Called with the lock held
+        now = time.monotonic()
+        if now - self._last_save >= SAVE_INTERVAL:
+            self._last_save = now
+            self.part.save()
+        if self.progress and now - self._last_progress >= PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress(self.downloaded, self.length)
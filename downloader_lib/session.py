@@ -0,0 +1,89 @@
+"""Shared, pooled `requests` session for every request to Vimm's Lair.
+
+Each `VimmsDownloader` used to create its own bare `requests.Session()` (and
+`get_game_popularity` yet another), so the web UI held dozens of sessions, each
+with default-sized pools, and every console paid for its own TCP/TLS handshakes.
+`shared_session()` hands out one process-wide session instead, with a sized
+`HTTPAdapter` per host group:
+
+- vault pages (`vimm.net`): a pool large enough for the concurrent section
+  fetches, and transport retries with backoff for connect and read errors
+- download servers (`dl*.vimm.net`): a smaller pool, retrying connection errors
+  only
+
+No adapter retries on an HTTP status: a replayed 429/5xx would bypass the
+shared request budget, and the adaptive rate limiter has to see it
+(`TokenBucket.record`) to back off. Callers retry statuses themselves
+(`download_game`, `async_fetch`).
+
+It is one session, not one per group, because the download servers expect the
+cookies set while visiting the game page; adapters are mounted per host group
+so each group keeps its own pool and retry policy. Connections are kept alive
+and reused across consoles.
+"""
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+VAULT_HOSTS = ('vimm.net', 'www.vimm.net')
+DOWNLOAD_HOSTS = ('dl.vimm.net', 'dl2.vimm.net', 'dl3.vimm.net')
+
+VAULT_POOL_SIZE = 16     # >= network.fetch_workers plus page lookups from the web UI
+DOWNLOAD_POOL_SIZE = 4   # Default per-host connection budget of the download servers (network.download_connections)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5      # 0.5s, 1s, 2s between attempts
+
+_SHARED: Optional[requests.Session] = None
+_LOCK = threading.Lock()
+
+
+def _vault_retry() -> Retry:
+    return Retry(total=RETRY_TOTAL, connect=RETRY_TOTAL, read=RETRY_TOTAL, status=0,
+                 backoff_factor=RETRY_BACKOFF, allowed_methods=frozenset({'GET', 'HEAD'}),
+                 raise_on_status=False)
+
+
+def _download_retry() -> Retry:
+    return Retry(total=RETRY_TOTAL, connect=RETRY_TOTAL, read=0, status=0,
+                 backoff_factor=RETRY_BACKOFF, allowed_methods=frozenset({'GET', 'HEAD', 'POST'}),
+                 raise_on_status=False)
+
+
+def new_session(download_connections: int = DOWNLOAD_POOL_SIZE) -> requests.Session:
+    """Build a session with the pooled, retrying adapters mounted per host group.
+
+    `download_connections` is the per-host connection budget of the download
+    servers (`network.download_connections`); the download pool holds that
+    many connections per host.
+    """
+    session = requests.Session()
+    vault = HTTPAdapter(pool_connections=len(VAULT_HOSTS), pool_maxsize=VAULT_POOL_SIZE, max_retries=_vault_retry())
+    download = HTTPAdapter(pool_connections=len(DOWNLOAD_HOSTS), pool_maxsize=download_connections,
+                           max_retries=_download_retry())
+    for scheme in ('https://', 'http://'):
+        # Other hosts (other dl mirrors, redirects) use the download policy
+        session.mount(scheme, download)
+        for host in DOWNLOAD_HOSTS:
+            session.mount(f'{scheme}{host}/', download)
+        for host in VAULT_HOSTS:
+            session.mount(f'{scheme}{host}/', vault)
+    return session
+
+
+def shared_session(download_connections: int = DOWNLOAD_POOL_SIZE) -> requests.Session:
+    """Return the process-wide session (created on first use).
+
+    The adapters are built once, by the first caller: `download_connections`
+    only sizes the download pool of a session that does not exist yet, and
+    later callers get the same session unchanged. Callers keep their parallel
+    requests to a download host within the same configured budget
+    (`VimmsDownloader.download_segments`).
+    """
+    global _SHARED
+    with _LOCK:
+        if _SHARED is None:
+            _SHARED = new_session(download_connections)
+        return _SHARED
@@ -0,0 +1,220 @@
+"""Streaming (tree-free) parsers for section and game pages.
+
+Drop-in replacements for `parse.parse_section_page`, `parse_games_from_section`,
+`has_next_page`, `parse_game_details` and `resolve_download_form` built on the
+standard library's event-driven `html.parser.HTMLParser`: start/end tag and text
+callbacks update a little state (which table/row/cell/link we are in) and the
+results are collected on the fly, without building a BeautifulSoup tree. The
+decisions made from the extracted values (row -> game dict, rating text, form ->
+download URL) are shared with `parse.py`, so both produce the same output on
+well-formed pages.
+
+Select it with `network.html_parser: "stdlib"` in `vimms_config.json`;
+`scripts/bench_parsers.py` compares the two.
+"""
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from downloader_lib.parse import (
+    RESULTS_TABLE_CLASS,
+    _MEDIA_ID_HREF_RE,
+    _MEDIA_ID_NAME_RE,
+    _NEXT_RE,
+    _RATING_CLASS_RE,
+    _STAR_SRC_RE,
+    _add_text_rating,
+    _game_row,
+    _resolve_download_url,
+    _size_and_extension,
+)
+
+
+class _SectionParser(HTMLParser):
+    """Collects results-table rows and whether a 'Next' link exists."""
+
+    def __init__(self, section: str):
+        super().__init__(convert_charrefs=True)
+        self.section = section
+        self.games: List[Dict[str, str]] = []
+        self.has_next = False
+        self._table_depth = 0       # > 0 while inside the results table (counts nested tables)
+        self._table_done = False    # only the first results table is read, like soup.find()
+        self._cells: Optional[List[List[str]]] = None  # text per <td> of the current row
+        self._in_cell = False
+        self._link_href: Optional[str] = None  # first <a> of the row's first cell ...
+        self._link_text: List[str] = []        # ... and its text
+        self._link_state = 0  # 0: no link yet in this row, 1: inside it, 2: closed
+        self._anchor_text: List[List[str]] = []  # text of every open <a> (pager detection)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            self._anchor_text.append([])
+        if self._table_depth:
+            if tag == 'table':
+                self._table_depth += 1
+            elif tag == 'tr':
+                self.end_row()
+                self._cells = []
+            elif tag == 'td' and self._cells is not None:
+                self._cells.append([])
+                self._in_cell = True
+            elif tag == 'a' and self._cells is not None and len(self._cells) == 1 and self._link_state == 0:
+                # First link of the first cell carries the game name and URL
+                self._link_state = 1
+                self._link_href = dict(attrs).get('href')
+        elif tag == 'table' and not self._table_done:
+            if ' '.join((dict(attrs).get('class') or '').split()) == RESULTS_TABLE_CLASS:
+                self._table_depth = 1
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            if self._link_state == 1:
+                self._link_state = 2
+            if self._anchor_text and _NEXT_RE.search(''.join(self._anchor_text.pop())):
+                self.has_next = True
+        if self._table_depth:
+            if tag == 'table':
+                self._table_depth -= 1
+                if not self._table_depth:
+                    self.end_row()
+                    self._table_done = True
+            elif tag == 'tr':
+                self.end_row()
+            elif tag == 'td':
+                self._in_cell = False
+
+    def handle_data(self, data):
+        for parts in self._anchor_text:
+            parts.append(data)
+        if self._cells:
+            if self._in_cell:
+                self._cells[-1].append(data)
+            if self._link_state == 1:
+                self._link_text.append(data)
+
+    def end_row(self):
+        """Emit the current row (if it had a linked first cell) and reset the row state."""
+        cells, href, name = self._cells, self._link_href, ''.join(self._link_text).strip()
+        self._cells, self._in_cell, self._link_href, self._link_text, self._link_state = None, False, None, [], 0
+        if not cells or not href:
+            return
+        rating_text = ''.join(cells[4]) if len(cells) >= 5 else None
+        self.games.append(_game_row(name, href, self.section, rating_text))
+
+
+def parse_section_page(html_content: str, section: str) -> Tuple[List[Dict[str, str]], bool]:
+    """Stream a section page once: `(games, has_next)` (same output as `parse.parse_section_page`)."""
+    parser = _SectionParser(section)
+    parser.feed(html_content)
+    parser.close()
+    parser.end_row()
+    return parser.games, parser.has_next
+
+
+def parse_games_from_section(html_content: str, section: str) -> List[Dict[str, str]]:
+    """Parse a list of games from the HTML of a section page (streaming)."""
+    return parse_section_page(html_content, section)[0]
+
+
+def has_next_page(html_content: str) -> bool:
+    """Whether a section page links to a following page ('Next')."""
+    return parse_section_page(html_content, '')[1]
+
+
+class _DetailsParser(HTMLParser):
+    """Counts star icons inside the first rating/score container."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found = False
+        self.stars = 0
+        self._depth = 0  # > 0 while inside the container (counts nested divs)
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth:
+            if tag == 'div':
+                self._depth += 1
+            elif tag == 'img' and _STAR_SRC_RE.search(dict(attrs).get('src') or ''):
+                self.stars += 1
+        elif not self.found and tag == 'div' and _RATING_CLASS_RE.search(dict(attrs).get('class') or ''):
+            self.found = True
+            self._depth = 1
+
+    def handle_endtag(self, tag):
+        if self._depth and tag == 'div':
+            self._depth -= 1
+
+
+def parse_game_details(html_content: str) -> Dict[str, any]:
+    """Parse game details (size, format, rating) from game page HTML (streaming)."""
+    details = _size_and_extension(html_content)
+    parser = _DetailsParser()
+    parser.feed(html_content)
+    parser.close()
+    if parser.found:
+        if parser.stars > 0:
+            details['rating'] = parser.stars
+    else:
+        _add_text_rating(details, html_content)
+    return details
+
+
+class _FormParser(HTMLParser):
+    """Collects the `dl_form` element's inputs plus the page-wide download fallbacks."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.form: Optional[Dict] = None
+        self.anchor_href: Optional[str] = None
+        self.page_media_id: Optional[str] = None
+        self._page_media_seen = False
+        self._form_tag: Optional[str] = None
+        self._depth = 0  # > 0 while inside the dl_form element
+        self._media_exact: Optional[str] = None
+        self._media_any: Optional[str] = None
+        self._media_exact_seen = False
+        self._media_any_seen = False
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if self._depth and tag == self._form_tag:
+            self._depth += 1
+        elif self.form is None and a.get('id') == 'dl_form':
+            self.form = {'action': a.get('action'), 'method': a.get('method'), 'inputs': []}
+            self._form_tag = tag
+            self._depth = 1
+            return
+
+        if tag == 'input':
+            name = a.get('name')
+            if self._depth:
+                self.form['inputs'].append((name, a.get('value')))
+                if name == 'mediaId' and not self._media_exact_seen:
+                    self._media_exact_seen, self._media_exact = True, a.get('value')
+                if name and _MEDIA_ID_NAME_RE.match(name) and not self._media_any_seen:
+                    self._media_any_seen, self._media_any = True, a.get('value')
+            if name and _MEDIA_ID_NAME_RE.match(name) and not self._page_media_seen:
+                self._page_media_seen, self.page_media_id = True, a.get('value')
+        elif tag == 'a' and self.anchor_href is None:
+            href = a.get('href')
+            if href and _MEDIA_ID_HREF_RE.search(href):
+                self.anchor_href = href
+
+    def handle_endtag(self, tag):
+        if self._depth and tag == self._form_tag:
+            self._depth -= 1
+
+    def close(self):
+        super().close()
+        if self.form is not None:
+            self.form['media_id'] = self._media_exact if self._media_exact_seen else self._media_any
+
+
+def resolve_download_form(html_content: str, session: requests.Session, game_page_url: str, game_id: str, logger) -> Optional[str]:
+    """Find the download form and resolve the final download URL, handling POSTs (streaming)."""
+    parser = _FormParser()
+    parser.feed(html_content)
+    parser.close()
+    return _resolve_download_url(parser.form, parser.anchor_href, parser.page_media_id, game_id, logger)
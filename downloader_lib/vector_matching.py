@@ -0,0 +1,154 @@
+"""Optional NumPy backend for bulk fuzzy candidate selection.
+
+For whole-console index builds `VimmsDownloader.match_titles` resolves thousands
+of catalog titles against the same local keys. With this backend the fuzzy
+candidates for a whole batch of titles come from one vectorized pass: titles and
+keys become sparse (binary) character-trigram vectors and their cosine
+similarities are computed as a batched sparse matrix product, keeping at most
+`top_k` keys per title above a calibrated cutoff. The surviving candidates are
+still confirmed with the exact `difflib` check (`FuzzyScorer`), so the backend
+can only drop matches, never add them.
+
+The cutoff is calibrated per `match_threshold` so that >= 99% of the pairs that
+pass `difflib` on the bundled catalog (`src/webui_index.json`) are kept; the
+pairs below it are mostly coincidental ('mega man' / 'mad max' at 0.67). Use
+`calibrate_cutoff()` to recalibrate on another corpus.
+
+NumPy is optional: `available()` reports whether it is installed, and the
+downloader falls back to the pure-Python index without it.
+"""
+import math
+from typing import Dict, Iterable, List, Optional
+
+from downloader_lib.matching import FuzzyScorer, trigrams
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # optional dependency
+    np = None
+
+# difflib match_threshold -> lowest trigram cosine kept (99% recall on the bundled catalog)
+CALIBRATED_CUTOFFS = {0.6: 0.0, 0.65: 0.13, 0.7: 0.27, 0.75: 0.38, 0.8: 0.54, 0.85: 0.64, 0.9: 0.72}
+
+# Upper bound on the dense (titles x keys) score block computed at once
+_MAX_BLOCK_CELLS = 4_000_000
+
+
+def available() -> bool:
+    """Whether NumPy is installed (the backend is usable)."""
+    return np is not None
+
+
+def _grams(s: str):
+    # Pad with spaces so word starts/ends and very short keys still produce trigrams
+    return trigrams(f' {s} ')
+
+
+def cutoff_for(threshold: float) -> float:
+    """Cosine cutoff for a difflib threshold (the nearest calibrated threshold at or below it)."""
+    usable = [t for t in CALIBRATED_CUTOFFS if t <= threshold]
+    return CALIBRATED_CUTOFFS[max(usable)] if usable else 0.0
+
+
+def calibrate_cutoff(targets: Iterable[str], keys: Iterable[str], threshold: float, recall: float = 0.99) -> float:
+    """Lowest cosine keeping `recall` of the fuzzy (non-containment) difflib matches between targets and keys."""
+    keys = list(keys)
+    key_grams = [_grams(k) for k in keys]
+    cosines: List[float] = []
+    for target in targets:
+        tg = _grams(target)
+        scorer = FuzzyScorer(target, threshold)
+        for key, kg in zip(keys, key_grams):
+            if target in key or key in target or not scorer(key):
+                continue
+            cosines.append(len(tg & kg) / math.sqrt(len(tg) * len(kg)) if tg and kg else 0.0)
+    if not cosines:
+        return 0.0
+    cosines.sort()
+    return cosines[min(len(cosines) - 1, int((1.0 - recall) * len(cosines)))]
+
+
+class TrigramVectorIndex:
+    """Sparse trigram vectors for a list of keys, queried in batches."""
+
+    def __init__(self, keys: List[str]):
+        if np is None:
+            raise ImportError("numpy is required for the vector matching backend")
+        self.keys: List[str] = keys if isinstance(keys, list) else list(keys)
+        self.vocab: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, key in enumerate(self.keys):
+            for g in _grams(key):
+                rows.append(i)
+                cols.append(self.vocab.setdefault(g, len(self.vocab)))
+
+        n_keys, n_grams = len(self.keys), len(self.vocab)
+        rows_a = np.asarray(rows, dtype=np.int64)
+        cols_a = np.asarray(cols, dtype=np.int64)
+        # Column-major postings: the key ids holding each trigram are contiguous
+        order = np.argsort(cols_a, kind='stable')
+        self._post_keys = rows_a[order]
+        self._post_ptr = np.zeros(n_grams + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols_a, minlength=n_grams), out=self._post_ptr[1:])
+        self._norms = np.sqrt(np.bincount(rows_a, minlength=n_keys).astype(np.float64))
+        # Keys without trigrams cannot be ranked; they are always candidates
+        self._always = np.flatnonzero(self._norms == 0)
+
+    def candidates(self, targets: List[str], cutoff: float, top_k: Optional[int] = 256) -> List[List[int]]:
+        """Key positions (ascending) per target with cosine >= `cutoff`, at most `top_k` best."""
+        n_keys = len(self.keys)
+        out: List[List[int]] = []
+        if not n_keys:
+            return [[] for _ in targets]
+        block = max(1, _MAX_BLOCK_CELLS // n_keys)
+        for start in range(0, len(targets), block):
+            out.extend(self._candidates_block(targets[start:start + block], cutoff, top_k))
+        return out
+
+    def _candidates_block(self, targets: List[str], cutoff: float, top_k: Optional[int]) -> List[List[int]]:
+        n_keys = len(self.keys)
+        t_rows: List[int] = []
+        t_cols: List[int] = []
+        t_norms = np.zeros(len(targets), dtype=np.float64)
+        for b, target in enumerate(targets):
+            grams = _grams(target)
+            t_norms[b] = math.sqrt(len(grams))
+            for g in grams:
+                col = self.vocab.get(g)
+                if col is not None:
+                    t_rows.append(b)
+                    t_cols.append(col)
+
+        # Sparse (targets x trigrams) . (trigrams x keys): expand each target trigram
+        # into the postings of keys holding it and count hits per (target, key).
+        dots = np.zeros(len(targets) * n_keys, dtype=np.float64)
+        if t_cols:
+            cols = np.asarray(t_cols, dtype=np.int64)
+            starts = self._post_ptr[cols]
+            lengths = self._post_ptr[cols + 1] - starts
+            total = int(lengths.sum())
+            if total:
+                offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+                key_ids = self._post_keys[np.arange(total, dtype=np.int64) + offsets]
+                batch_ids = np.repeat(np.asarray(t_rows, dtype=np.int64), lengths)
+                dots = np.bincount(batch_ids * n_keys + key_ids, minlength=len(targets) * n_keys).astype(np.float64)
+        dots = dots.reshape(len(targets), n_keys)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos = dots / (t_norms[:, None] * self._norms[None, :])
+        cos = np.nan_to_num(cos, nan=0.0, posinf=0.0)
+
+        out: List[List[int]] = []
+        for b in range(len(targets)):
+            if t_norms[b] == 0:
+                out.append(list(range(n_keys)))
+                continue
+            row = cos[b]
+            hits = np.flatnonzero(row >= cutoff) if cutoff > 0 else np.flatnonzero(row > 0)
+            if top_k is not None and len(hits) > top_k:
+                hits = hits[np.argpartition(row[hits], -top_k)[-top_k:]]
+            if len(self._always):
+                hits = np.union1d(hits, self._always)
+            out.append(sorted(int(i) for i in hits))
+        return out
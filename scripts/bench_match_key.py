@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for utils.filenames.match_key on the bundled catalog titles.
+
+Runs several passes over every title in src/webui_index.json (as repeated index
+builds / section scans do) and compares the un-memoized
+`normalize_for_match(clean_filename(name))` with the memoized `match_key(name)`.
+
+Usage: python scripts/bench_match_key.py [passes]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.filenames import clean_filename, normalize_for_match, match_key  # noqa: E402
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    index = json.loads((ROOT / 'src' / 'webui_index.json').read_text(encoding='utf-8'))
+    titles = [e['name'] for c in index.get('consoles', []) for entries in c.get('sections', {}).values() for e in entries]
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        plain = [normalize_for_match(clean_filename(t)) for t in titles]
+    plain_s = time.perf_counter() - start
+
+    match_key.cache_clear()
+    start = time.perf_counter()
+    for _ in range(passes):
+        cached = [match_key(t) for t in titles]
+    cached_s = time.perf_counter() - start
+
+    assert plain == cached
+    print(f"{len(titles)} titles x {passes} passes")
+    print(f"  normalize_for_match(clean_filename()): {plain_s:.3f}s")
+    print(f"  match_key (memoized):                 {cached_s:.3f}s  ({plain_s / cached_s:.1f}x)")
+    print(f"  cache: {match_key.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark the BeautifulSoup page parsers (parse.py) against the streaming ones (stream_parse.py).
+
+Builds a section page with 200 results rows (real titles from src/webui_index.json,
+wrapped in the nav/menu/form markup a vault page carries) and a game page, checks
+both implementations agree, and times each.
+
+Usage: python scripts/bench_parsers.py [repeats]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from downloader_lib import parse, stream_parse  # noqa: E402
+
+
+def _section_page(titles):
+    rows = ''.join(
+        f'<tr><td><a href="/vault/{i}">{t}</a></td><td><img src="/images/flags/us.png" title="USA"></td>'
+        f'<td>1.0</td><td>En</td><td>{(i % 90) / 10 + 1:.1f}</td></tr>'
+        for i, t in enumerate(titles)
+    )
+    menu = '<div class="menu"><ul>' + ''.join(f'<li><a href="/vault/?p=list&section={c}">{c}</a></li>' for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ') + '</ul></div>'
+    options = ''.join(f'<option value="{k}">Option {k}</option>' for k in range(150))
+    return (f'<!DOCTYPE html><html><head><title>Vault</title><script>var a = 1;</script></head><body>{menu}'
+            f'<form><select name="system">{options}</select></form>'
+            f'<table class="rounded centered cellpadding1 hovertable striped"><tr><th>Title</th><th>Region</th>'
+            f'<th>Version</th><th>Languages</th><th>Rating</th></tr>{rows}</table>'
+            f'<div class="pager"><a href="?page=2">Next &raquo;</a></div>{menu}</body></html>')
+
+
+def _game_page():
+    menu = ''.join(f'<div class="menu"><a href="/x{j}">Item {j}</a></div>' for j in range(200))
+    return (f'<html><body>{menu}<div class="rating">' + '<img src="/images/star.png">' * 4 +
+            '</div><p>Size: 64.5 MB</p><form action="//dl3.vimm.net/" method="POST" id="dl_form">'
+            '<input type="hidden" name="mediaId" value="6590"><input type="hidden" name="alt" value="0">'
+            '<button type="submit">Download</button></form></body></html>')
+
+
+def _time(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    index = json.loads((ROOT / 'src' / 'webui_index.json').read_text(encoding='utf-8'))
+    titles = [e['name'] for c in index.get('consoles', []) for entries in c.get('sections', {}).values() for e in entries][:200]
+    section_html, game_html = _section_page(titles), _game_page()
+
+    cases = [
+        ('parse_section_page', lambda m: m.parse_section_page(section_html, 'A')),
+        ('parse_game_details', lambda m: m.parse_game_details(game_html)),
+        ('resolve_download_form', lambda m: m.resolve_download_form(game_html, None, 'https://vimm.net/vault/1', '1', None)),
+    ]
+    print(f"{repeats} repeats; section page {len(section_html) // 1024} KB ({len(titles)} rows), game page {len(game_html) // 1024} KB")
+    for name, call in cases:
+        assert call(parse) == call(stream_parse), name
+        soup_ms = _time(lambda: call(parse), repeats)
+        stream_ms = _time(lambda: call(stream_parse), repeats)
+        print(f"  {name:22s} BeautifulSoup {soup_ms:7.2f} ms   HTMLParser {stream_ms:7.2f} ms  ({soup_ms / stream_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
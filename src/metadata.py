@@ -7,14 +7,17 @@ real-time lookups during downloads.
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 import requests
 from downloader_lib.parse import parse_game_details
+from downloader_lib.session import shared_session
 
 
 def get_game_popularity(url: str, session: Optional[requests.Session] = None, 
                        cache_path: Optional[Path] = None,
-                       logger: Optional[logging.Logger] = None) -> Optional[Tuple[float, int]]:
+                       logger: Optional[logging.Logger] = None,
+                       limiter=None,
+                       pages: Optional[Callable[[str], Dict]] = None) -> Optional[Tuple[float, int]]:
     """Fetch game popularity (overall rating and star rating) from Vimm game page.
     
     Args:
@@ -22,6 +25,9 @@ def get_game_popularity(url: str, session: Optional[requests.Session] = None,
         session: Optional requests Session for connection pooling
         cache_path: Optional path to metadata_cache.json for persistent caching
         logger: Optional logger for diagnostics
+        limiter: Optional `rate_limit.TokenBucket` for the request (and fed its status)
+        pages: Optional loader returning the parsed page record for a URL
+            (`VimmsDownloader.game_page`); used instead of fetching the page here
         
     Returns:
         Tuple of (overall_rating, stars) where overall_rating is a float (e.g., 8.62)
@@ -47,16 +53,24 @@ def get_game_popularity(url: str, session: Optional[requests.Session] = None,
     
     # Fetch from network
     if session is None:
-        session = requests.Session()
+        session = shared_session()
     
     try:
         if logger:
             logger.info(f"get_game_popularity: fetching {url}")
-        response = session.get(url, timeout=15)
-        response.raise_for_status()
-        
-        # Parse game details from page
-        details = parse_game_details(response.text)
+        if pages is not None:
+            # Shared, already-parsed page (single request per game across callers)
+            details = pages(url)['details']
+        else:
+            if limiter is not None:
+                limiter.acquire()
+            response = session.get(url, timeout=15)
+            if limiter is not None:
+                limiter.record(response.status_code, getattr(response, 'headers', None))
+            response.raise_for_status()
+
+            # Parse game details from page
+            details = parse_game_details(response.text)
         
         # Extract rating (prefer overall rating if available)
         rating = details.get('rating')
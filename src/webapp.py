@@ -9,6 +9,9 @@ from pathlib import Path
 import logging
 from logging.handlers import RotatingFileHandler
 import json
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 # Add repository root to path for shared libraries (downloader_lib, utils)
 # and cli directory for CLI tool imports
@@ -22,6 +25,9 @@ if str(cli_dir) not in sys.path:
 
 from download_vimms import VimmsDownloader, CONSOLE_MAP, SECTIONS
 from downloader_lib.parse import parse_game_details
+from downloader_lib.matching import match_targets_for_keys
+from downloader_lib.async_fetch import crawl_catalog_sync
+from downloader_lib.catalog_sync import ConsoleDelta, catalog_rows, needs_full_sync
 
 # Try to import metadata functionality (optional)
 try:
@@ -337,28 +343,28 @@ def api_index_build():
             
             # Scan all sections
             sections_data = {}
-            for idx, section in enumerate(SECTIONS):
+            for idx, (section, games) in enumerate(dl.iter_section_game_lists(SECTIONS)):
                 INDEX_PROGRESS['current_section'] = section
                 INDEX_PROGRESS['sections_done'] = idx
                 try:
-                    games = dl.get_game_list_from_section(section)
-                    
-                    # Annotate with local presence
+
+                    # Annotate with local presence (one batched lookup for the whole section)
+                    section_matches = [[] for _ in games]
+                    if dl.local_index is not None:
+                        try:
+                            section_matches = dl.match_games(games)
+                        except Exception as e:
+                            logger.exception(f"api_index_build: error matching section '{section}': {e}")
                     annotated_games = []
                     debug_count = 0
-                    for game in games:
+                    for game, matches in zip(games, section_matches):
                         present = False
-                        try:
-                            if dl.local_index is not None:
-                                matches = dl.find_all_matching_files(game['name'])
-                                present = bool(matches)
-                                # Debug log first few games in each section to see matching behavior
-                                if debug_count < 3:
-                                    logger.info(f"api_index_build: game='{game['name']}' present={present} matches={len(matches) if matches else 0}")
-                                    debug_count += 1
-                        except Exception as e:
-                            logger.exception(f"api_index_build: error checking '{game['name']}': {e}")
-                            pass
+                        if dl.local_index is not None:
+                            present = bool(matches)
+                            # Debug log first few games in each section to see matching behavior
+                            if debug_count < 3:
+                                logger.info(f"api_index_build: game='{game['name']}' present={present} matches={len(matches) if matches else 0}")
+                                debug_count += 1
                         
                         game_entry = {
                             'id': game.get('game_id', ''),
@@ -480,6 +486,7 @@ def api_index_get():
 
 # Global paths for catalog cache
 REMOTE_CATALOG_FILE = BASE_DIR / 'webui_remote_catalog.json'
+CATALOG_FULL_SYNC_DAYS = 7  # Delta syncs list a console in full again after this many days
 REMOTE_CATALOG_PROGRESS = {
     'in_progress': False,
     'consoles_total': 0,
@@ -518,13 +525,39 @@ def api_catalog_remote_build():
     
     This fetches ALL game lists from Vimm's Lair and caches them locally.
     Takes 15-30 minutes due to network requests but only needs to run once.
+
+    Send `{"async": true}` to crawl every console at once on one asyncio event
+    loop (`downloader_lib.async_fetch`), bounded only by the request budget.
+
+    Send `{"delta": true}` to refresh an existing catalog instead: each section
+    stops paginating at the first page that is already cached in place and only
+    changed rows are updated (`downloader_lib.catalog_sync`). Consoles whose last
+    full listing is older than `full_sync_days` (default 7) are listed in full.
+    Each console records `last_synced` (and `last_full_sync`) plus the ids added
+    and removed by the last sync.
     """
     global REMOTE_CATALOG_PROGRESS
     
     if REMOTE_CATALOG_PROGRESS['in_progress']:
         return jsonify({'error': 'Remote catalog build already in progress'}), 409
     
-    logger.info("api_catalog_remote_build: starting remote catalog fetch")
+    data = request.get_json(silent=True) or {}
+    use_async = bool(data.get('async', False))
+    use_delta = bool(data.get('delta', False))
+    full_sync_days = float(data.get('full_sync_days', CATALOG_FULL_SYNC_DAYS))
+    # The current catalog: the delta base, and where sections that fail to list are kept from
+    existing = None
+    if REMOTE_CATALOG_FILE.exists():
+        try:
+            with open(REMOTE_CATALOG_FILE, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+        except Exception as e:
+            logger.warning(f"api_catalog_remote_build: cached catalog unreadable, doing a full build: {e}")
+    previous = existing if use_delta else None
+    if previous is not None:
+        # The async crawler has no early-stop hook; delta sync pages with the thread pool
+        use_async = False
+    logger.info(f"api_catalog_remote_build: starting remote catalog fetch (async={use_async}, delta={previous is not None})")
     
     def build_remote_catalog():
         """Background thread to fetch remote game catalog."""
@@ -536,12 +569,33 @@ def api_catalog_remote_build():
             REMOTE_CATALOG_PROGRESS['consoles_total'] = len(CONSOLE_MAP)
             REMOTE_CATALOG_PROGRESS['consoles_done'] = 0
             
+            synced_at = datetime.utcnow().isoformat() + 'Z'
             catalog = {
-                'timestamp': datetime.utcnow().isoformat() + 'Z',
-                'consoles': {}
+                'timestamp': synced_at,
+                'consoles': dict((previous or {}).get('consoles', {}))
             }
             
             console_keys = sorted(CONSOLE_MAP.keys())
+
+            # Async mode: crawl every system up front on one event loop (aliases share a crawl)
+            crawled = None
+            if use_async:
+                temp_dir = BASE_DIR / 'temp_catalog'
+                temp_dir.mkdir(exist_ok=True)
+                crawl_dl = VimmsDownloader(str(temp_dir), system='DS', detect_existing=False, pre_scan=False)
+                systems = {CONSOLE_MAP[c]: CONSOLE_MAP[c] for c in console_keys}
+                sections_total = len(systems) * len(SECTIONS)
+                crawl_done = {'sections': 0}
+
+                def on_section(system, section, games, error):
+                    crawl_done['sections'] += 1
+                    REMOTE_CATALOG_PROGRESS['current_console'] = system
+                    REMOTE_CATALOG_PROGRESS['percent_complete'] = int(crawl_done['sections'] / sections_total * 100)
+                    if error is not None:
+                        logger.warning(f"api_catalog_remote_build: error fetching section '{section}' for '{system}': {error}")
+
+                crawled = crawl_catalog_sync(systems, SECTIONS, crawl_dl.rate_limiter, on_section=on_section,
+                                             parser=crawl_dl.html_parser)
             
             for console_idx, console_name in enumerate(console_keys):
                 system = CONSOLE_MAP[console_name]
@@ -554,35 +608,55 @@ def api_catalog_remote_build():
                 temp_dir = BASE_DIR / 'temp_catalog'
                 temp_dir.mkdir(exist_ok=True)
                 dl = VimmsDownloader(str(temp_dir), system=system, detect_existing=False, pre_scan=False)
+
+                # Delta sync against the cached console unless it is due a full listing
+                cached_console = catalog['consoles'].get(console_name) if previous is not None else None
+                delta = None
+                if cached_console is not None and not needs_full_sync(cached_console, full_sync_days):
+                    delta = ConsoleDelta(cached_console)
                 
                 sections_data = {}
-                for section_idx, section in enumerate(SECTIONS):
+                added, removed = [], []
+                if crawled is not None:
+                    # Sections that failed to crawl are missing here and keep their previous rows below
+                    section_lists = [(section, crawled[system][section]) for section in SECTIONS if section in crawled[system]]
+                else:
+                    section_lists = dl.iter_section_game_lists(SECTIONS, stop_at=delta.stop_at if delta else None)
+                for section_idx, (section, games) in enumerate(section_lists):
                     REMOTE_CATALOG_PROGRESS['sections_done'] = section_idx
                     REMOTE_CATALOG_PROGRESS['percent_complete'] = int(
                         (console_idx * len(SECTIONS) + section_idx) / (len(CONSOLE_MAP) * len(SECTIONS)) * 100
                     )
                     
                     try:
-                        games = dl.get_game_list_from_section(section)
                         # Store game metadata without local presence info
-                        sections_data[section] = [
-                            {
-                                'id': g.get('game_id', ''),
-                                'name': g.get('name', ''),
-                                'url': g.get('page_url', '')
-                            }
-                            for g in games
-                        ]
-                        logger.info(f"api_catalog_remote_build: section '{section}' for '{console_name}': {len(games)} games")
+                        rows = catalog_rows(games)
+                        if delta is not None:
+                            rows, section_added, section_removed = delta.merge(section, rows)
+                            added.extend(section_added)
+                            removed.extend(section_removed)
+                        sections_data[section] = rows
+                        logger.info(f"api_catalog_remote_build: section '{section}' for '{console_name}': {len(rows)} games")
                     except Exception as e:
                         logger.exception(f"api_catalog_remote_build: error fetching section '{section}' for '{console_name}': {e}")
-                        sections_data[section] = []
+
+                # Never replace a section with an empty list because listing it failed
+                kept = ((existing or {}).get('consoles', {}).get(console_name) or {}).get('sections') or {}
+                sections_data = {section: sections_data[section] if section in sections_data else kept[section]
+                                 for section in SECTIONS if section in sections_data or section in kept}
                 
-                catalog['consoles'][console_name] = {
+                entry = {
                     'name': console_name,
                     'system': system,
-                    'sections': sections_data
+                    'sections': sections_data,
+                    'last_synced': synced_at,
+                    'last_full_sync': synced_at if delta is None else cached_console.get('last_full_sync', synced_at),
                 }
+                if delta is not None:
+                    entry['last_delta'] = {'added': added, 'removed': removed}
+                    logger.info(f"api_catalog_remote_build: delta for '{console_name}': "
+                                f"{len(added)} added, {len(removed)} removed")
+                catalog['consoles'][console_name] = entry
                 
                 REMOTE_CATALOG_PROGRESS['consoles_done'] = console_idx + 1
                 REMOTE_CATALOG_PROGRESS['percent_complete'] = int((console_idx + 1) / len(CONSOLE_MAP) * 100)
@@ -605,6 +679,81 @@ def api_catalog_remote_build():
     return jsonify({'status': 'started', 'message': 'Remote catalog build started in background'})
 
 
+# Worker processes for CPU-bound presence matching during index builds. Matching
+# in a Flask thread holds the GIL and stalls every request while a build runs.
+MATCH_POOL = None
+
+
+def _get_match_pool():
+    global MATCH_POOL
+    if MATCH_POOL is None:
+        # 'spawn' everywhere: forking a threaded server process is unsafe
+        MATCH_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                         mp_context=multiprocessing.get_context('spawn'))
+    return MATCH_POOL
+
+
+class _PresenceJob:
+    """Local presence flags for one console's games, matched in the process pool.
+
+    Games found in the downloader's manifest are resolved here by id; the other
+    titles are normalized once and matched in a worker that receives the console's
+    local index keys. If the pool is unavailable the match runs in-process.
+    """
+
+    def __init__(self, dl, games):
+        self.dl = dl
+        self.exact = [bool(dl.manifest.files(g.get('game_id') or g.get('id') or '')) for g in games]
+        self.targets = [None if e else dl._match_key(g.get('name', '')) for g, e in zip(games, self.exact)]
+        self.unique = list(dict.fromkeys(t for t in self.targets if t is not None))
+        self.future = None
+        self.result = None
+        if dl.local_index is None:
+            self.exact = [False] * len(games)
+            self.result = {}
+        elif not self.unique:
+            self.result = {}
+        else:
+            try:
+                self.future = _get_match_pool().submit(match_targets_for_keys, dl._local_index_keys, self.unique,
+                                                       dl.match_threshold, dl.match_backend)
+            except Exception as e:
+                logger.warning(f"presence matching: process pool unavailable, matching in-process: {e}")
+
+    def done(self):
+        return self.result is not None or self.future is None or self.future.done()
+
+    def present(self):
+        """Presence flag per game (blocks until the worker finishes)."""
+        if self.result is None:
+            positions = None
+            if self.future is not None:
+                try:
+                    positions = self.future.result()
+                except Exception as e:
+                    logger.warning(f"presence matching: worker failed, matching in-process: {e}")
+            if positions is None:
+                positions = match_targets_for_keys(self.dl._local_index_keys, self.unique,
+                                                   self.dl.match_threshold, self.dl.match_backend)
+            self.result = {t: bool(p) for t, p in zip(self.unique, positions)}
+        return [e or bool(self.result.get(t)) for e, t in zip(self.exact, self.targets)]
+
+
+def _finish_presence_jobs(pending, on_done, wait=False):
+    """Call `on_done(*item)` for pending (job, ...) tuples whose matching finished; return the rest.
+
+    With `wait=True` every job is finished, in submission order.
+    """
+    remaining = []
+    for item in pending:
+        job = item[0]
+        if wait or job.done():
+            on_done(*item)
+        else:
+            remaining.append(item)
+    return remaining
+
+
 @app.route('/api/index/build_fast', methods=['POST'])
 def api_index_build_fast():
     """Fast index build using cached remote catalog + local file scan.
@@ -751,7 +900,33 @@ def api_index_build_fast_internal(workspace_root):
             'complete': False
         }
     
+    def publish_console(job, console_name, console_entry, entries):
+        """Apply presence flags once matching finished, then record the console."""
+        try:
+            for entry, present in zip(entries, job.present()):
+                entry['present'] = present
+        except Exception as e:
+            logger.exception(f"api_index_build_fast_internal: error matching '{console_name}': {e}")
+
+        # Remove any old incomplete entry for this console
+        index_data['consoles'] = [c for c in index_data.get('consoles', []) if c.get('name') != console_name]
+
+        index_data['consoles'].append(console_entry)
+        INDEX_PROGRESS['partial_consoles'].append(console_entry)
+        INDEX_PROGRESS['consoles_done'] += 1
+
+        logger.info(f"api_index_build_fast_internal: completed '{console_name}' with {console_entry['total_games']} games "
+                    f"({sum(1 for e in entries if e['present'])} present)")
+
+        # Save incremental progress
+        try:
+            with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump(index_data, f, indent=2)
+        except Exception as e:
+            logger.exception(f"api_index_build_fast_internal: error saving progress: {e}")
+
     total_games = 0
+    pending = []  # (presence job, console name, console entry, game entries) still matching
     for console_name in console_folders:
         system = CONSOLE_MAP.get(console_name, console_name)
         
@@ -793,6 +968,7 @@ def api_index_build_fast_internal(workspace_root):
             # Get remote game list from cached catalog (INSTANT - no network)
             console_remote = remote_catalog['consoles'].get(console_name, {})
             sections_data = {}
+            console_games = []  # (catalog game, index entry) pairs for presence matching
             
             for idx, section in enumerate(SECTIONS):
                 INDEX_PROGRESS['current_section'] = section
@@ -801,22 +977,14 @@ def api_index_build_fast_internal(workspace_root):
                 # Get games from cached catalog (no network fetch!)
                 cached_games = console_remote.get('sections', {}).get(section, [])
                 
-                # Annotate with local presence (FAST - uses pre-built local index)
                 annotated_games = []
                 for game in cached_games:
-                    present = False
-                    try:
-                        if dl.local_index is not None:
-                            matches = dl.find_all_matching_files(game['name'])
-                            present = bool(matches)
-                    except Exception as e:
-                        logger.exception(f"api_index_build_fast_internal: error checking '{game['name']}': {e}")
-                    
+                    # Presence is filled in when the console's matching job finishes
                     game_entry = {
                         'id': game.get('id', ''),
                         'name': game.get('name', ''),
                         'url': game.get('url', ''),
-                        'present': present
+                        'present': False
                     }
                     
                     # Preserve rating from cached catalog (from previous full build)
@@ -824,6 +992,7 @@ def api_index_build_fast_internal(workspace_root):
                         game_entry['rating'] = game['rating']
                     
                     annotated_games.append(game_entry)
+                    console_games.append((game, game_entry))
                     total_games += 1
                     INDEX_PROGRESS['games_found'] = total_games
                 
@@ -840,24 +1009,16 @@ def api_index_build_fast_internal(workspace_root):
                 'complete': True  # Mark as complete
             }
             
-            # Remove any old incomplete entry for this console
-            index_data['consoles'] = [c for c in index_data.get('consoles', []) if c.get('name') != console_name]
-            
-            index_data['consoles'].append(console_entry)
-            INDEX_PROGRESS['partial_consoles'].append(console_entry)
-            INDEX_PROGRESS['consoles_done'] += 1
-            
-            logger.info(f"api_index_build_fast_internal: completed '{console_name}' with {console_entry['total_games']} games")
-            
-            # Save incremental progress
-            try:
-                with open(INDEX_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(index_data, f, indent=2)
-            except Exception as e:
-                logger.exception(f"api_index_build_fast_internal: error saving progress: {e}")
+            # Match presence in a worker process; publish consoles as their jobs finish
+            job = _PresenceJob(dl, [g for g, _ in console_games])
+            pending.append((job, console_name, console_entry, [e for _, e in console_games]))
         
         except Exception as e:
             logger.exception(f"api_index_build_fast_internal: error scanning '{console_name}': {e}")
+
+        pending = _finish_presence_jobs(pending, publish_console)
+
+    _finish_presence_jobs(pending, publish_console, wait=True)
     
     # Mark as complete
     index_data['complete'] = True
@@ -993,7 +1154,29 @@ def api_index_build_internal(workspace_root):
     if index_data['consoles']:
         logger.info(f"api_index_build_internal: preserved {len(index_data['consoles'])} completed consoles from previous index")
     
+    def publish_console(job, console_name, console_entry, entries):
+        """Apply presence flags once matching finished, then record the console."""
+        try:
+            for entry, present in zip(entries, job.present()):
+                entry['present'] = present
+        except Exception as e:
+            logger.exception(f"api_index_build_internal: error matching '{console_name}': {e}")
+
+        index_data['consoles'].append(console_entry)
+        INDEX_PROGRESS['consoles_done'] += 1
+        INDEX_PROGRESS['partial_consoles'].append(console_entry)  # Add to partial list for progressive UI
+        logger.info(f"api_index_build_internal: completed '{console_name}' with {len(entries)} total games "
+                    f"({sum(1 for e in entries if e['present'])} present)")
+
+        # Save incrementally after each console to avoid data loss
+        try:
+            with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump(index_data, f, indent=2)
+        except Exception as e:
+            logger.exception(f"api_index_build_internal: error saving incremental progress: {e}")
+
     total_games = 0
+    pending = []  # (presence job, console name, console entry, game entries) still matching
     for console_name in console_folders:
         system = CONSOLE_MAP.get(console_name, console_name)
         
@@ -1039,34 +1222,20 @@ def api_index_build_internal(workspace_root):
             
             # Scan all sections
             sections_data = {}
-            for idx, section in enumerate(SECTIONS):
+            console_games = []  # (section game, index entry) pairs for presence matching
+            for idx, (section, games) in enumerate(dl.iter_section_game_lists(SECTIONS)):
                 INDEX_PROGRESS['current_section'] = section
                 INDEX_PROGRESS['sections_done'] = idx
                 try:
-                    games = dl.get_game_list_from_section(section)
-                    
-                    # Annotate with local presence
+
                     annotated_games = []
-                    debug_count = 0
                     for game in games:
-                        present = False
-                        try:
-                            if dl.local_index is not None:
-                                matches = dl.find_all_matching_files(game['name'])
-                                present = bool(matches)
-                                # Debug log first few games in number section to see matching behavior
-                                if section == 'number' and debug_count < 5:
-                                    logger.info(f"api_index_build_internal: game='{game['name']}' present={present} matches={len(matches) if matches else 0}")
-                                    debug_count += 1
-                        except Exception as e:
-                            logger.exception(f"api_index_build_internal: error checking '{game['name']}': {e}")
-                            pass
-                        
+                        # Presence is filled in when the console's matching job finishes
                         game_entry = {
                             'id': game.get('game_id', ''),
                             'name': game.get('name', ''),
                             'url': game.get('page_url', ''),
-                            'present': present
+                            'present': False
                         }
                         
                         # Preserve rating if extracted from section page
@@ -1074,6 +1243,7 @@ def api_index_build_internal(workspace_root):
                             game_entry['rating'] = game['rating']
                         
                         annotated_games.append(game_entry)
+                        console_games.append((game, game_entry))
                         total_games += 1
                         INDEX_PROGRESS['games_found'] = total_games
                     
@@ -1090,20 +1260,16 @@ def api_index_build_internal(workspace_root):
                 'folder': str(target_folder),
                 'sections': sections_data
             }
-            index_data['consoles'].append(console_entry)
-            INDEX_PROGRESS['consoles_done'] += 1
-            INDEX_PROGRESS['partial_consoles'].append(console_entry)  # Add to partial list for progressive UI
-            logger.info(f"api_index_build_internal: completed '{console_name}' with {sum(len(s) for s in sections_data.values())} total games")
-            
-            # Save incrementally after each console to avoid data loss
-            try:
-                with open(INDEX_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(index_data, f, indent=2)
-            except Exception as e:
-                logger.exception(f"api_index_build_internal: error saving incremental progress: {e}")
+            # Match presence in a worker process while the next console is fetched
+            job = _PresenceJob(dl, [g for g, _ in console_games])
+            pending.append((job, console_name, console_entry, [e for _, e in console_games]))
             
         except Exception as e:
             logger.exception(f"api_index_build_internal: error scanning console '{console_name}': {e}")
+
+        pending = _finish_presence_jobs(pending, publish_console)
+
+    _finish_presence_jobs(pending, publish_console, wait=True)
     
     # Mark as complete and save final version
     index_data['complete'] = True
@@ -1197,21 +1363,17 @@ def _scan_console_and_append(index_data: dict, console_name: str, root_path: Pat
         dl = VimmsDownloader(str(target_folder), system=console_name, detect_existing=True, pre_scan=True)
         DL_INSTANCES[str(target_folder)] = dl
         sections_data = {}
-        for idx, section in enumerate(SECTIONS):
+        for idx, (section, games) in enumerate(dl.iter_section_game_lists(SECTIONS)):
             INDEX_PROGRESS['current_section'] = section
             INDEX_PROGRESS['sections_done'] = idx
-            games = dl.get_game_list_from_section(section)
-            # Annotate presence
-            annotated_games = []
-            for game in games:
-                present = False
+            # Annotate presence (one batched lookup for the whole section)
+            section_matches = [[] for _ in games]
+            if dl.local_index is not None:
                 try:
-                    if dl.local_index is not None:
-                        matches = dl.find_all_matching_files(game['name'])
-                        present = bool(matches)
+                    section_matches = dl.match_games(games)
                 except Exception:
-                    present = False
-                annotated_games.append(game)
+                    section_matches = [[] for _ in games]
+            annotated_games = [{**game, 'present': bool(matches)} for game, matches in zip(games, section_matches)]
             sections_data[section] = annotated_games
         console_entry = {
             'name': console_name,
@@ -1646,16 +1808,16 @@ def api_section(section):
     # Annotate games with local presence if we have a downloader with indexing
     annotated = []
     present_count = 0
-    for g in games:
-        present = False
-        try:
-            if dl and dl.local_index is not None:
-                matches = dl.find_all_matching_files(g['name'])
-                present = bool(matches)
-                if present:
-                    present_count += 1
-        except Exception:
-            present = False
+    section_matches = [[] for _ in games]
+    try:
+        if dl and dl.local_index is not None:
+            section_matches = dl.match_games(games)
+    except Exception:
+        section_matches = [[] for _ in games]
+    for g, matches in zip(games, section_matches):
+        present = bool(matches)
+        if present:
+            present_count += 1
         annotated.append({**g, 'present': present})
 
     logger.info(f"api_section: section={section} folder={folder} games={len(games)} present={present_count}")
@@ -1698,41 +1860,31 @@ def api_game(game_id):
         except Exception:
             cache_path_arg = None
     logger_arg = getattr(dl, 'logger', None) if dl else None
+    # The rating lookup's own page request (used when the shared load failed)
+    # goes through the downloader's request budget
+    limiter_arg = getattr(dl, 'rate_limiter', None) if dl else None
+    # One parsed page per game, shared with the rating lookup and the downloader
+    # (`VimmsDownloader.game_page`); test doubles may not provide it
+    pages_arg = getattr(dl, 'game_page', None) if dl else None
+    page = None
+    if callable(pages_arg):
+        try:
+            page = pages_arg(url)
+        except Exception as e:
+            logger.warning(f"api_game: could not load page for {game_id}: {e}")
     pop = None
     if get_game_popularity:
-        pop = get_game_popularity(url, session=session_arg, cache_path=cache_path_arg, logger=logger_arg)
+        pop = get_game_popularity(url, session=session_arg, cache_path=cache_path_arg, logger=logger_arg,
+                                  limiter=limiter_arg, pages=pages_arg if page is not None else None)
     present = False
     files = []
-    title = ''
-    if dl:
-        # We don't have the game name here, attempt to find files by calling find_all_matching_files on title fetched from page
+    title = page['title'] if page else ''
+    if dl and title:
+        # Find local files matching the page title
         try:
-            # Fetch page title. Be permissive about session.get signature to support
-            # simple test doubles that may be implemented as class-level functions.
-            s = getattr(dl, 'session', None)
-            resp = None
-            if s:
-                get_fn = getattr(s, 'get', None)
-                if get_fn:
-                    try:
-                        resp = get_fn(url, timeout=10)
-                    except TypeError:
-                        # Some test doubles define get as a plain function expecting (self, url)
-                        try:
-                            resp = get_fn(None, url, timeout=10)
-                        except TypeError:
-                            # Last resort, call without timeout
-                            resp = get_fn(url)
-            if resp:
-                resp.raise_for_status()
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                title_el = soup.find('title')
-                title = title_el.text.strip() if title_el else ''
-                if title:
-                    matches = dl.find_all_matching_files(title)
-                    present = bool(matches)
-                    files = [str(p) for p in matches]
+            matches = dl.find_all_matching_files(title)
+            present = bool(matches)
+            files = [str(p) for p in matches]
         except Exception:
             pass
 
@@ -1746,44 +1898,35 @@ def api_game(game_id):
     size_bytes = None
     extension = None
     try:
-        if dl and title:
-            # Attempt to find download form on page and resolve URL
-            # Re-fetch page if resp not available
-            if not resp:
+        if dl and page:
+            download_url = page['download_url']
+            if download_url:
+                # HEAD the download URL to get size and filename
                 try:
-                    resp = dl.session.get(url, timeout=10)
+                    head = dl.session.head(download_url, allow_redirects=True, timeout=10)
+                    head.raise_for_status()
+                    cl = head.headers.get('Content-Length')
+                    if cl:
+                        size_bytes = int(cl)
+                    cd = head.headers.get('Content-Disposition') or ''
+                    # parse filename from content-disposition
+                    import re
+                    m = re.search(r'filename\*=.*\'\'([^;]+)|filename="?([^\";]+)"?', cd)
+                    fname = None
+                    if m:
+                        fname = (m.group(1) or m.group(2)) if m.group(1) or m.group(2) else None
+                    if not fname:
+                        # fallback to URL path
+                        from urllib.parse import urlparse, unquote
+                        p = urlparse(download_url).path
+                        fname = unquote(p.split('/')[-1] or '')
+                    if fname:
+                        import os
+                        _, ext = os.path.splitext(fname)
+                        if ext:
+                            extension = ext.lower()
                 except Exception:
-                    resp = None
-            if resp:
-                from downloader_lib.parse import resolve_download_form
-                download_url = resolve_download_form(resp.text, dl.session, url, game_id, getattr(dl, 'logger', None))
-                if download_url:
-                    # HEAD the download URL to get size and filename
-                    try:
-                        head = dl.session.head(download_url, allow_redirects=True, timeout=10)
-                        head.raise_for_status()
-                        cl = head.headers.get('Content-Length')
-                        if cl:
-                            size_bytes = int(cl)
-                        cd = head.headers.get('Content-Disposition') or ''
-                        # parse filename from content-disposition
-                        import re
-                        m = re.search(r'filename\*=.*\'\'([^;]+)|filename="?([^\";]+)"?', cd)
-                        fname = None
-                        if m:
-                            fname = (m.group(1) or m.group(2)) if m.group(1) or m.group(2) else None
-                        if not fname:
-                            # fallback to URL path
-                            from urllib.parse import urlparse, unquote
-                            p = urlparse(download_url).path
-                            fname = unquote(p.split('/')[-1] or '')
-                        if fname:
-                            import os
-                            _, ext = os.path.splitext(fname)
-                            if ext:
-                                extension = ext.lower()
-                    except Exception:
-                        pass
+                    pass
     except Exception:
         logger.exception('api_game: error resolving download details')
 
@@ -2167,8 +2310,10 @@ def init_worker():
         worker_thread = t
         logger.info('init_worker: worker thread started')
 
-# Initialize worker when module is loaded
-init_worker()
+# Initialize worker when module is loaded (not in presence-matching pool workers,
+# which re-import this module when started with the 'spawn' method)
+if multiprocessing.parent_process() is None:
+    init_worker()
 
 if __name__ == '__main__':
     app.run(host='127.0.0.1', port=8000, debug=True)
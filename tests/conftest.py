@@ -1,8 +1,56 @@
 """Pytest configuration for vimms-downloader tests."""
+import atexit
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+import pytest
+
+# Importing the web app starts its queue worker, which may launch downloader
+# subprocesses; they keep the cross-process request budget in the system temp
+# folder, so give this test session a private one instead of the machine's.
+_SESSION_TMP = tempfile.mkdtemp(prefix='vimms-tests-')
+for _var in ('TMPDIR', 'TEMP', 'TMP'):
+    os.environ[_var] = _SESSION_TMP
+tempfile.tempdir = None
+atexit.register(shutil.rmtree, _SESSION_TMP, True)
+
 # Add cli directory to path so tests can import CLI modules
 cli_dir = Path(__file__).parent.parent / 'cli'
 if str(cli_dir) not in sys.path:
     sys.path.insert(0, str(cli_dir))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_game_page_cache(monkeypatch):
+    """Parsed game pages (and their stats) are shared per process; don't let them leak between tests."""
+    from downloader_lib import game_pages
+    monkeypatch.setattr(game_pages, '_SHARED', None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _private_request_budget(tmp_path, monkeypatch):
+    """Keep downloaders off the machine-wide request budget (and each test on a fresh limiter).
+
+    The default budget file lives in the system temp folder and is shared with
+    any real downloader or web UI running on this machine.
+    """
+    import download_vimms
+    from downloader_lib import rate_limit
+    budget = tmp_path / 'vimms_request_budget.json'
+    monkeypatch.setattr(rate_limit, 'SHARED_BUDGET_PATH', budget)
+    monkeypatch.setattr(download_vimms, 'SHARED_BUDGET_PATH', budget)
+    monkeypatch.setattr(rate_limit, '_SHARED', None)
+    monkeypatch.setattr(rate_limit, '_SHARED_CONFIG', None)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _private_http_cache(tmp_path, monkeypatch):
+    """Cache vault pages under the test's tmp_path, not next to the project's config."""
+    import download_vimms
+    monkeypatch.setattr(download_vimms, 'HTTP_CACHE_DIRNAME', str(tmp_path / 'http_cache'))
+    yield
@@ -0,0 +1,69 @@
+import asyncio
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from downloader_lib import async_fetch
+from downloader_lib.rate_limit import TokenBucket
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+PAGE_WITH_NEXT = (FIXTURES / 'section_page.html').read_text()
+LAST_PAGE = PAGE_WITH_NEXT.replace('Next', 'Previous').replace('/vault/1', '/vault/3').replace('/vault/2', '/vault/4')
+
+
+class RecordingBucket(TokenBucket):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pauses = []
+
+    def record(self, status, headers=None):
+        self.pauses.append(super().record(status, headers))
+        return self.pauses[-1]
+
+
+class FakeClient:
+    """Serves two pages for section 'A', one for 'B' (after a 429 the first time) and a 500 for 'C'."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def get(self, url, headers):
+        q = parse_qs(urlparse(url).query)
+        section, page = q['section'][0], int(q['page'][0])
+        self.requests.append((q['system'][0], section, page, headers['User-Agent']))
+        await asyncio.sleep(0)
+        if section == 'C':
+            return 500, {}, ''
+        if section == 'B' and sum(r[:2] == (q['system'][0], 'B') for r in self.requests) == 1:
+            return 429, {'Retry-After': '0.05'}, ''
+        if section == 'A' and page == 1:
+            return 200, {}, PAGE_WITH_NEXT
+        if page > 2:
+            return 404, {}, ''
+        return 200, {}, LAST_PAGE
+
+    async def close(self):
+        pass
+
+
+def test_crawl_catalog_follows_pages_and_reports_errors(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(async_fetch, '_make_client', lambda per_host: client)
+    monkeypatch.setattr(async_fetch, 'RETRY_BACKOFF', 0)
+    finished = []
+    limiter = RecordingBucket(rate=1000, burst=100)
+
+    catalog = async_fetch.crawl_catalog_sync(
+        {'DS': 'DS', 'GBA': 'GBA'}, ['A', 'B', 'C'], limiter,
+        on_section=lambda console, section, games, error: finished.append((console, section, error is not None)),
+    )
+
+    assert [g['game_id'] for g in catalog['DS']['A']] == ['1', '2', '3', '4']
+    # The 429 was retried after its Retry-After instead of emptying the section
+    assert [g['game_id'] for g in catalog['GBA']['B']] == ['3', '4']
+    assert limiter.pauses.count(0.05) == 2
+    # A section that keeps failing is left out, not stored as an empty list
+    assert list(catalog['DS']) == ['A', 'B'] and 'C' not in catalog['GBA']
+    assert sorted(finished) == [(c, s, s == 'C') for c in ('DS', 'GBA') for s in ('A', 'B', 'C')]
+    # Per console: two pages for A, a 429 and a retry for B, PAGE_ATTEMPTS tries for C
+    assert len(client.requests) == 2 * (2 + 2 + async_fetch.PAGE_ATTEMPTS)
+    assert all(r[3] for r in client.requests)
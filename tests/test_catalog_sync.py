@@ -0,0 +1,135 @@
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import download_vimms
+from download_vimms import VimmsDownloader
+from downloader_lib.catalog_sync import ConsoleDelta, catalog_rows, needs_full_sync
+
+
+def _games(ids):
+    return [{'game_id': i, 'name': f'Game {i}', 'page_url': f'https://vimm.net/vault/{i}'} for i in ids]
+
+
+def _site(dl, monkeypatch, ids, page_size):
+    """Serve `ids` as a paginated section; returns the list of requested page numbers."""
+    requested = []
+
+    def fake_fetch(session, system, section, page_num, cache=None, limiter=None):
+        requested.append(page_num)
+        return SimpleNamespace(text=str(page_num))
+
+    def parse_section_page(text, section):
+        page = int(text)
+        chunk = ids[(page - 1) * page_size:page * page_size]
+        return _games(chunk), page * page_size < len(ids)
+
+    monkeypatch.setattr(download_vimms, 'fetch_section_page', fake_fetch)
+    dl.html_parser = SimpleNamespace(parse_section_page=parse_section_page)
+    return requested
+
+
+def test_delta_sync_stops_at_first_known_page_and_merges(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False)
+    old_ids = [f'{n:03d}' for n in range(100)]
+    cached = {'sections': {'A': catalog_rows(_games(old_ids))}, 'last_full_sync': '2000-01-01T00:00:00Z'}
+
+    # One game added and one removed near the start of a 10-page section
+    new_ids = ['000', '000a'] + old_ids[1:3] + old_ids[4:]
+    requested = _site(dl, monkeypatch, new_ids, page_size=10)
+    delta = ConsoleDelta(cached)
+    games = dl.get_game_list_from_section('A', stop_at=delta.stop_at)
+    rows, added, removed = delta.merge('A', catalog_rows(games))
+
+    # Page 1 has the changes; page 2 is the cached rows shifted in place, so paging stops there
+    assert requested == [1, 2]
+    assert [r['id'] for r in rows] == new_ids
+    assert added == ['000a']
+    assert removed == ['003']
+
+
+def test_delta_sync_without_changes_lists_one_page(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False)
+    ids = [f'{n:03d}' for n in range(50)]
+    delta = ConsoleDelta({'sections': {'A': catalog_rows(_games(ids))}})
+    requested = _site(dl, monkeypatch, ids, page_size=10)
+
+    rows, added, removed = delta.merge('A', catalog_rows(dl.get_game_list_from_section('A', stop_at=delta.stop_at)))
+
+    assert requested == [1]
+    assert [r['id'] for r in rows] == ids
+    assert (added, removed) == ([], [])
+    # A failed (empty) listing keeps the cached rows
+    assert [r['id'] for r in delta.merge('A', [])[0]] == ids
+
+
+def test_needs_full_sync():
+    now = datetime(2024, 1, 10)
+    assert needs_full_sync(None, 7, now)
+    assert needs_full_sync({'sections': {'A': []}, 'last_full_sync': '2024-01-01T00:00:00Z'}, 7, now)
+    assert not needs_full_sync({'sections': {'A': []}, 'last_full_sync': '2024-01-05T00:00:00Z'}, 7, now)
+
+
+def _write_catalog(path, synced):
+    catalog = {'timestamp': synced, 'consoles': {
+        'DS': {'name': 'DS', 'system': 'DS', 'last_synced': synced,
+               'sections': {'A': catalog_rows(_games(['1', '2']))}},
+    }}
+    path.write_text(json.dumps(catalog), encoding='utf-8')
+
+
+def test_fresh_catalog_replaces_the_crawl(tmp_path, monkeypatch):
+    catalog = tmp_path / 'webui_remote_catalog.json'
+    _write_catalog(catalog, datetime.utcnow().isoformat() + 'Z')
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False)
+    requested = _site(dl, monkeypatch, ['9'], page_size=10)
+
+    assert dl.use_catalog(catalog, max_age_hours=1)
+    games = dl.get_game_list_from_section('A')
+    assert [g['game_id'] for g in games] == ['1', '2']
+    assert games[0]['page_url'] == 'https://vimm.net/vault/1' and games[0]['section'] == 'A'
+    assert requested == []
+    # Sections the catalog lacks are still crawled
+    assert [g['game_id'] for g in dl.get_game_list_from_section('B')] == ['9']
+
+
+def test_stale_or_missing_catalog_falls_back_to_crawling(tmp_path):
+    catalog = tmp_path / 'webui_remote_catalog.json'
+    _write_catalog(catalog, (datetime.utcnow() - timedelta(hours=30)).isoformat() + 'Z')
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False)
+    assert not dl.use_catalog(catalog, max_age_hours=24)
+    assert dl.catalog_lists is None
+    assert not dl.use_catalog(tmp_path / 'missing.json')
+    gba = VimmsDownloader(str(tmp_path), system='GBA', detect_existing=False, pre_scan=False)
+    _write_catalog(catalog, datetime.utcnow().isoformat() + 'Z')
+    assert not gba.use_catalog(catalog)
+
+
+def test_async_build_keeps_sections_that_failed_to_crawl(tmp_path, monkeypatch):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+    import webapp
+
+    catalog_file = tmp_path / 'webui_remote_catalog.json'
+    old_rows = catalog_rows(_games(['7', '8']))
+    catalog_file.write_text(json.dumps({'consoles': {'DS': {'name': 'DS', 'system': 'DS', 'sections': {'A': [], 'B': old_rows}}}}))
+
+    class InlineThread:
+        def __init__(self, target, daemon=None):
+            self.start = target
+
+    monkeypatch.setattr(webapp, 'REMOTE_CATALOG_FILE', catalog_file)
+    monkeypatch.setattr(webapp, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(webapp, 'SECTIONS', ['A', 'B'])
+    monkeypatch.setattr(webapp, 'Thread', InlineThread)
+    monkeypatch.setattr(download_vimms, 'CONSOLE_MAP', {'DS': 'DS'})
+    # Section B failed (e.g. kept answering 429), so the crawl leaves it out
+    monkeypatch.setattr(webapp, 'crawl_catalog_sync', lambda systems, sections, limiter, **kw: {'DS': {'A': _games(['1'])}})
+
+    resp = webapp.app.test_client().post('/api/catalog/remote/build', json={'async': True})
+
+    assert resp.status_code == 200
+    sections = json.loads(catalog_file.read_text())['consoles']['DS']['sections']
+    assert [r['id'] for r in sections['A']] == ['1']
+    assert sections['B'] == old_rows
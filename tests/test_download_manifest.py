@@ -0,0 +1,49 @@
+from download_vimms import VimmsDownloader
+from downloader_lib.manifest import DownloadManifest
+
+
+def test_manifest_tracks_moves_and_detects_stale_files(tmp_path):
+    rom = tmp_path / 'Odd Name.nds'
+    rom.write_bytes(b'rom')
+    m = DownloadManifest(tmp_path)
+    m.record('123', [rom], 'Some Game')
+    m.save()
+
+    m = DownloadManifest(tmp_path)  # reload from disk
+    assert m.files('123') == [rom]
+
+    (tmp_path / 'rating' / '8').mkdir(parents=True)
+    moved = tmp_path / 'rating' / '8' / rom.name
+    rom.rename(moved)
+    assert m.files('123') == []
+    assert m.move(rom, moved)
+    assert m.files('123') == [moved]
+    assert m.games['123']['files'][0]['path'] == 'rating/8/Odd Name.nds'
+
+    moved.write_bytes(b'changed contents')
+    assert m.files('123') == []
+
+
+def test_match_games_prefers_manifest_over_fuzzy_matching(tmp_path, monkeypatch):
+    (tmp_path / 'xyz.nds').write_bytes(b'rom')  # name no fuzzy match would find
+    (tmp_path / 'Tetris DS.nds').write_bytes(b'rom')
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl._build_local_index()
+    dl.manifest.record('1', [tmp_path / 'xyz.nds'], 'Mario Kart DS')
+
+    fuzzy_titles = []
+    original = dl.match_titles
+
+    def recording_match_titles(names):
+        names = list(names)
+        fuzzy_titles.extend(names)
+        return original(names)
+
+    monkeypatch.setattr(dl, 'match_titles', recording_match_titles)
+
+    games = [{'game_id': '1', 'name': 'Mario Kart DS'}, {'id': '2', 'name': 'Tetris DS'}, {'game_id': '3', 'name': 'Nope'}]
+    result = dl.match_games(games)
+    assert result[0] == [tmp_path / 'xyz.nds']
+    assert {p.name for p in result[1]} == {'Tetris DS.nds'}
+    assert result[2] == []
+    assert fuzzy_titles == ['Tetris DS', 'Nope']
@@ -0,0 +1,106 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import download_vimms
+from download_vimms import VimmsDownloader
+
+PAGE = '<title>{id}</title><form action="//dl3.vimm.net/" method="POST" id="dl_form"><input name="mediaId" value="{id}"></form>'
+
+
+def _games(ids):
+    return [{'game_id': i, 'name': f'Game {i}', 'page_url': f'https://vimm.net/vault/{i}', 'section': 'A'} for i in ids]
+
+
+def test_next_download_urls_resolve_during_transfer(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False,
+                         section_priority_override=['A'], project_root=str(tmp_path))
+    dl.delay_between_downloads = (0, 0)
+    dl.delay_between_page_requests = (0, 0)
+    dl.prefetch_games = 2
+    fetched = []
+    transfer_threads = set()
+
+    def fake_fetch(session, url, cache=None, limiter=None, **kwargs):
+        fetched.append((url, threading.get_ident()))
+        time.sleep(0.05)
+        return SimpleNamespace(text=PAGE.format(id=url.rsplit('/', 1)[-1]))
+
+    def fake_download(game):
+        transfer_threads.add(threading.get_ident())
+        url = dl.get_download_url(game['page_url'], game['game_id'])
+        assert url == f"https://dl3.vimm.net/?mediaId={game['game_id']}"
+        time.sleep(0.2)  # the transfer
+        return True
+
+    monkeypatch.setattr(download_vimms, 'fetch_game_page', fake_fetch)
+    monkeypatch.setattr(dl, 'get_game_list_from_section', lambda section: _games(['1', '2', '3', '4']) if section == 'A' else [])
+    monkeypatch.setattr(dl, 'download_game', fake_download)
+
+    dl.download_all_games()
+
+    # Every page fetched once; all but the first were resolved off the transfer thread
+    assert sorted(u for u, _ in fetched) == [f'https://vimm.net/vault/{i}' for i in '1234']
+    assert [t in transfer_threads for _, t in fetched].count(True) == 1
+    assert dl.game_pages.stats['loaded'] == 4
+
+
+def test_prefetched_pages_survive_transfers_longer_than_the_ttl(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False,
+                         section_priority_override=['A'], project_root=str(tmp_path))
+    dl.delay_between_downloads = (0, 0)
+    dl.delay_between_page_requests = (0, 0)
+    dl.prefetch_games = 2
+    dl.game_pages.ttl = 0.05  # every transfer below outlasts it
+    fetched = []
+
+    def fake_fetch(session, url, cache=None, limiter=None, **kwargs):
+        fetched.append(url)
+        return SimpleNamespace(text=PAGE.format(id=url.rsplit('/', 1)[-1]))
+
+    def fake_download(game):
+        assert dl.get_download_url(game['page_url'], game['game_id']) == f"https://dl3.vimm.net/?mediaId={game['game_id']}"
+        time.sleep(0.2)
+        return True
+
+    monkeypatch.setattr(download_vimms, 'fetch_game_page', fake_fetch)
+    monkeypatch.setattr(dl, 'get_game_list_from_section', lambda section: _games(['1', '2', '3', '4']) if section == 'A' else [])
+    monkeypatch.setattr(dl, 'download_game', fake_download)
+
+    dl.download_all_games()
+
+    assert sorted(fetched) == [f'https://vimm.net/vault/{i}' for i in '1234']
+
+
+def test_next_section_list_is_fetched_while_current_section_downloads(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False,
+                         section_priority_override=['A', 'B'], project_root=str(tmp_path))
+    dl.delay_between_downloads = (0, 0)
+    dl.delay_between_page_requests = (0, 0)
+    dl.prefetch_games = 0
+    events = []
+    main = threading.get_ident()
+
+    def fake_list(section):
+        events.append(('list', section, threading.get_ident() == main))
+        if section == 'B':
+            time.sleep(0.2)  # a slow crawl
+        return {'A': _games(['1']), 'B': _games(['2'])}.get(section, [])
+
+    def fake_download(game):
+        events.append(('download', game['game_id'], time.monotonic()))
+        time.sleep(0.3)
+        return True
+
+    monkeypatch.setattr(dl, 'get_game_list_from_section', fake_list)
+    monkeypatch.setattr(dl, 'download_game', fake_download)
+
+    dl.download_all_games()
+
+    # Only the first list is fetched inline; B's crawl overlaps A's download
+    lists = [e for e in events if e[0] == 'list']
+    assert lists[0] == ('list', 'A', True)
+    assert all(not on_main for _, _, on_main in lists[1:])
+    downloads = [e for e in events if e[0] == 'download']
+    assert [d[1] for d in downloads] == ['1', '2']
+    assert downloads[1][2] - downloads[0][2] < 0.45
@@ -0,0 +1,66 @@
+import difflib
+import json
+from pathlib import Path
+
+from download_vimms import VimmsDownloader
+from downloader_lib.matching import LocalMatchIndex, duplicate_clusters
+
+
+def test_duplicate_clusters_are_transitive():
+    keys = ['advance wars', 'advance war', 'advance wa', 'tetris ds', 'mario kart ds']
+    clusters = duplicate_clusters(LocalMatchIndex(keys), 0.9)
+    assert clusters == [[0, 1, 2]]
+
+
+def test_find_duplicate_clusters_reports_reclaimable_bytes(tmp_path):
+    (tmp_path / 'Tetris DS.nds').write_bytes(b'x' * 10)
+    (tmp_path / 'Tetris DS (USA).nds').write_bytes(b'x' * 30)
+    (tmp_path / 'Tetris_DS_(Europe).nds').write_bytes(b'x' * 20)
+    (tmp_path / 'Advance Wars Days of Ruin.nds').write_bytes(b'x' * 5)
+    (tmp_path / 'Advance Wars Dual Strike.nds').write_bytes(b'x' * 5)
+    (tmp_path / 'Mario Kart DS.nds').write_bytes(b'x' * 5)
+    (tmp_path / 'Mario Kart DS').mkdir()
+
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    clusters = dl.find_duplicate_clusters()
+
+    assert len(clusters) == 1
+    assert clusters[0]['keep'].name == 'Tetris DS.nds'
+    assert {p.name for p in clusters[0]['extras']} == {'Tetris DS (USA).nds', 'Tetris_DS_(Europe).nds'}
+    assert clusters[0]['reclaimable_bytes'] == 50
+
+
+def _brute_force_clusters(keys, threshold):
+    parent = list(range(len(keys)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for j in range(len(keys)):
+        matcher = difflib.SequenceMatcher(None)
+        matcher.set_seq2(keys[j])
+        for i in range(j):
+            matcher.set_seq1(keys[i])
+            if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+                parent[max(find(i), find(j))] = min(find(i), find(j))
+    clusters = {}
+    for i in range(len(keys)):
+        clusters.setdefault(find(i), []).append(i)
+    return [c for c in clusters.values() if len(c) > 1]
+
+
+def test_blocking_scores_few_pairs_and_finds_the_same_clusters():
+    index = json.loads((Path(__file__).parent.parent / 'src' / 'webui_index.json').read_text(encoding='utf-8'))
+    titles = [e['name'] for c in index['consoles'] for s in c['sections'].values() for e in s]
+    dl = VimmsDownloader.__new__(VimmsDownloader)
+    keys = list(dict.fromkeys(dl._normalize_for_match(dl._clean_filename(t)) for t in titles))[:600]
+
+    match_index = LocalMatchIndex(keys)
+    clusters = duplicate_clusters(match_index, 0.9)
+
+    assert clusters == _brute_force_clusters(keys, 0.9)
+    assert clusters
+    # Blocking, not a scan of every pair
+    assert match_index.stats['scored'] < len(keys) * (len(keys) - 1) // 2 // 20
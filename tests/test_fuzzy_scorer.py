@@ -0,0 +1,34 @@
+import difflib
+import json
+from pathlib import Path
+
+from downloader_lib.matching import FuzzyScorer, new_match_stats
+from utils.filenames import clean_filename, normalize_for_match
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def _keys():
+    index = json.loads((REPO_ROOT / 'src' / 'webui_index.json').read_text(encoding='utf-8'))
+    ds = next(c for c in index['consoles'] if c['name'] == 'DS')
+    titles = [e['name'] for entries in ds['sections'].values() for e in entries]
+    return list(dict.fromkeys(normalize_for_match(clean_filename(t)) for t in titles))
+
+
+def test_scorer_agrees_with_full_ratio_and_counts_rejections():
+    keys = _keys()
+    targets = keys[::40] + ['', 'a', 'mario']
+    candidates = keys[::7] + ['']
+    for threshold in (0.65, 0.75):
+        stats = new_match_stats()
+        for target in targets:
+            scorer = FuzzyScorer(target, threshold, stats)
+            for key in candidates:
+                expected = difflib.SequenceMatcher(None, target, key).ratio() >= threshold
+                assert scorer(key) == expected, (target, key)
+
+        assert stats['scored'] == len(targets) * len(candidates)
+        rejected = stats['rejected_length'] + stats['rejected_quick_ratio'] + stats['rejected_ratio']
+        assert rejected + stats['matched'] == stats['scored']
+        # The cheap stages should do most of the work
+        assert stats['rejected_length'] + stats['rejected_quick_ratio'] > stats['rejected_ratio']
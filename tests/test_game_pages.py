@@ -0,0 +1,173 @@
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import download_vimms
+from download_vimms import VimmsDownloader
+from downloader_lib.game_pages import GamePageCache, page_title
+
+GAME_HTML = """
+<html><head><title>Vimm's Lair: Mario Kart DS</title></head><body>
+<p>Overall: 8.6 / 10</p>
+<form action="//dl3.vimm.net/" method="POST" id="dl_form">
+  <input type="hidden" name="mediaId" value="6590">
+</form>
+</body></html>
+"""
+
+
+def test_concurrent_callers_share_one_load():
+    cache = GamePageCache(ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return {'title': 'x'}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('1', load))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8 and all(r is results[0] for r in results)
+    assert cache.stats['loaded'] == 1 and cache.stats['shared'] == 7
+
+
+def test_errors_are_not_cached_and_ttl_expires():
+    cache = GamePageCache(ttl=0.05)
+
+    def fail():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        cache.get('1', fail)
+    assert cache.get('1', lambda: {'n': 1}) == {'n': 1}
+    assert cache.get('1', lambda: {'n': 2}) == {'n': 1}
+    time.sleep(0.06)
+    assert cache.get('1', lambda: {'n': 3}) == {'n': 3}
+
+
+def test_page_title():
+    assert page_title(GAME_HTML) == "Vimm's Lair: Mario Kart DS"
+    assert page_title('<p>none</p>') == ''
+
+
+def test_download_url_and_rating_share_one_fetch(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False, project_root=str(tmp_path))
+    fetched = []
+
+    def fake_fetch(session, url, cache=None, limiter=None, **kwargs):
+        fetched.append(url)
+        return SimpleNamespace(text=GAME_HTML)
+
+    monkeypatch.setattr(download_vimms, 'fetch_game_page', fake_fetch)
+    from src.metadata import get_game_popularity
+
+    url = 'https://vimm.net/vault/7818'
+    assert get_game_popularity(url, pages=dl.game_page) == (8.6, 9)
+    assert dl.get_download_url(url, '7818') == 'https://dl3.vimm.net/?mediaId=6590'
+    assert dl.game_page(url)['title'] == "Vimm's Lair: Mario Kart DS"
+    assert fetched == [url]
+
+
+class _GamePageHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        body = GAME_HTML.encode('utf-8')
+        self.send_response(304 if self.headers.get('If-None-Match') == '"p1"' else 200)
+        # The download servers check this cookie
+        self.send_header('Set-Cookie', 'visited=6590; Path=/')
+        self.send_header('ETag', '"p1"')
+        if self.headers.get('If-None-Match') == '"p1"':
+            self.end_headers()
+            return
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_download_url_always_comes_from_a_page_visit(tmp_path):
+    _GamePageHandler.requests_seen = []
+    httpd = HTTPServer(('127.0.0.1', 0), _GamePageHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{httpd.server_port}/vault/7818'
+    try:
+        first = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False, project_root=str(tmp_path))
+        first.session = requests.Session()
+        assert first.get_download_url(url, '7818') == 'https://dl3.vimm.net/?mediaId=6590'
+
+        # A later run: the page is fresh in the on-disk cache, but the new
+        # session has no cookies yet, so the page is still requested
+        first.game_pages.invalidate()
+        later = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False, project_root=str(tmp_path))
+        later.session = requests.Session()
+        assert later.get_download_url(url, '7818') == 'https://dl3.vimm.net/?mediaId=6590'
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert len(_GamePageHandler.requests_seen) == 2
+    assert _GamePageHandler.requests_seen[1].get('If-None-Match') == '"p1"'
+    assert later.session.cookies.get('visited') == '6590'
+    assert later.http_cache.stats == {'hits': 0, 'revalidated': 1, 'fetched': 0}
+
+
+def test_kept_records_outlive_the_ttl_until_used():
+    cache = GamePageCache(ttl=0.05)
+    cache.get('1', lambda: {'n': 1}, keep=True)
+    time.sleep(0.1)
+
+    # Still there after the TTL; the first regular lookup uses it up
+    assert cache.get('1', lambda: {'n': 2}) == {'n': 1}
+    time.sleep(0.1)
+    assert cache.get('1', lambda: {'n': 3}) == {'n': 3}
+
+
+def test_rating_fallback_fetch_goes_through_the_downloader_budget(tmp_path, monkeypatch):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+    import webapp
+
+    calls = []
+
+    class Limiter:
+        def acquire(self):
+            calls.append('acquire')
+
+        def record(self, status, headers=None):
+            calls.append(('record', status))
+
+    class Session:
+        def get(self, url, timeout=None):
+            calls.append(('get', url))
+            return SimpleNamespace(status_code=200, headers={}, text=GAME_HTML, raise_for_status=lambda: None)
+
+    def game_page(url):
+        raise requests.ConnectionError('shared load failed')
+
+    folder = str(tmp_path)
+    dl = SimpleNamespace(session=Session(), rate_limiter=Limiter(), game_page=game_page,
+                         download_dir=tmp_path, logger=None)
+    monkeypatch.setattr(webapp, 'DL_INSTANCES', {folder: dl})
+
+    data = webapp.app.test_client().get('/api/game/7818', query_string={'folder': folder}).get_json()
+    assert data['popularity']['score'] == 8.6
+    assert calls == ['acquire', ('get', 'https://vimm.net/vault/7818'), ('record', 200)]
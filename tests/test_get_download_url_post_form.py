@@ -2,7 +2,7 @@ from download_vimms import VimmsDownloader
 from types import SimpleNamespace
 
 
-def test_get_download_url_handles_post_form(monkeypatch):
+def test_get_download_url_handles_post_form(tmp_path, monkeypatch):
     html = """
     <form action="//dl3.vimm.net/" method="POST" id="dl_form">
       <input type="hidden" name="mediaId" value="6590">
@@ -10,7 +10,7 @@ def test_get_download_url_handles_post_form(monkeypatch):
     </form>
     """
 
-    dl = VimmsDownloader(download_dir='.', system='GC')
+    dl = VimmsDownloader(download_dir=str(tmp_path), system='GC')
 
     # Mock session.get to return the HTML
     monkeypatch.setattr(dl, 'session', SimpleNamespace())
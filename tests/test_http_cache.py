@@ -0,0 +1,88 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from downloader_lib.http_cache import CacheMiss, HttpCache
+
+BODY = '<html><body>Café list</body></html>'.encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    httpd = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}/vault/?p=list&section=A&page=1'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fresh_entries_are_served_without_a_request(tmp_path, server):
+    cache = HttpCache(tmp_path, ttl=3600)
+    session = requests.Session()
+
+    first = cache.get(session, server)
+    second = cache.get(session, server)
+
+    assert len(_Handler.requests_seen) == 1
+    assert second.text == first.text == BODY.decode('utf-8')
+    assert cache.stats == {'hits': 1, 'revalidated': 0, 'fetched': 1}
+
+
+def test_stale_entries_are_revalidated_with_etag(tmp_path, server):
+    cache = HttpCache(tmp_path, ttl=0)
+    session = requests.Session()
+
+    cache.get(session, server)
+    again = cache.get(session, server)
+
+    assert len(_Handler.requests_seen) == 2
+    assert _Handler.requests_seen[1].get('If-None-Match') == '"v1"'
+    assert again.text == BODY.decode('utf-8')
+    assert cache.stats['revalidated'] == 1
+
+
+def test_cache_only_mode_never_uses_the_network(tmp_path, server):
+    HttpCache(tmp_path, ttl=0).get(requests.Session(), server)
+    offline = HttpCache(tmp_path, ttl=0, cache_only=True)
+
+    assert offline.get(None, server).text == BODY.decode('utf-8')
+    with pytest.raises(CacheMiss):
+        offline.get(None, server + '&page=2')
+    assert len(_Handler.requests_seen) == 1
+
+
+def test_revalidate_sends_a_conditional_request_for_fresh_entries(tmp_path, server):
+    cache = HttpCache(tmp_path, ttl=3600)
+    session = requests.Session()
+
+    cache.get(session, server)
+    again = cache.get(session, server, revalidate=True)
+
+    assert len(_Handler.requests_seen) == 2
+    assert _Handler.requests_seen[1].get('If-None-Match') == '"v1"'
+    assert again.text == BODY.decode('utf-8')
+    assert cache.stats == {'hits': 0, 'revalidated': 1, 'fetched': 1}
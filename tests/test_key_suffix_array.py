@@ -0,0 +1,12 @@
+from downloader_lib.matching import KeySuffixArray
+
+
+def test_containing_matches_substring_scan():
+    keys = ['super mario 64 ds', 'mario kart ds', 'new super mario bros', 'a', '',
+            'the legend of zelda phantom hourglass and a very long subtitle', 'zelda']
+    sa = KeySuffixArray(keys)
+    queries = ['mario', 'ds', 'a', 'z', 'super mario', 'o', 'legend of zelda phantom hourglass and a very',
+               'legend of zelda phantom hourglass and a verx', 'missing', 'mario kart ds ', 'zelda']
+    for q in queries:
+        assert sa.containing(q) == {i for i, k in enumerate(keys) if q in k}, q
+    assert sa.containing('') == set()
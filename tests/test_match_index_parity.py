@@ -0,0 +1,72 @@
+"""Parity test: `LocalMatchIndex` (containment lookups, length window) must not change match results."""
+import difflib
+import json
+from pathlib import Path
+
+import pytest
+
+from download_vimms import VimmsDownloader
+from downloader_lib.matching import LocalMatchIndex
+from downloader_lib.parse import parse_games_from_section
+
+REPO_ROOT = Path(__file__).parent.parent
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def _catalog_titles():
+    """Titles from the section fixtures plus a slice of the bundled webui index."""
+    titles = [g['name'] for g in parse_games_from_section((FIXTURES / 'section_page.html').read_text(), 'A')]
+    lib_fixture = REPO_ROOT / 'downloader_lib' / 'tests' / 'fixtures' / 'section.html'
+    titles += [g['name'] for g in parse_games_from_section(lib_fixture.read_text(), 'A')]
+    index = json.loads((REPO_ROOT / 'src' / 'webui_index.json').read_text(encoding='utf-8'))
+    ds = next(c for c in index['consoles'] if c['name'] == 'DS')
+    for entries in ds['sections'].values():
+        titles.extend(e['name'] for e in entries)
+    return titles
+
+
+def _linear_find_all(dl, game_name):
+    """Reference implementation: the original linear scan over every index key."""
+    target = dl._normalize_for_match(dl._clean_filename(game_name))
+    matches = []
+    for key in dl._local_index_keys:
+        if target in key or key in target:
+            matches.extend(dl.local_index[key])
+    for key in dl._local_index_keys:
+        if difflib.SequenceMatcher(None, target, key).ratio() >= dl.match_threshold:
+            matches.extend(dl.local_index[key])
+    return matches
+
+
+@pytest.mark.parametrize('threshold', [0.65, 0.75])
+def test_indexed_matching_matches_linear_scan(tmp_path, threshold):
+    titles = _catalog_titles()
+    # Build a library from every 12th title, written the way users tend to store them
+    for i, title in enumerate(titles[::12]):
+        safe = ''.join(ch for ch in title if ch not in '<>:"/\\|?*')
+        name = f"{i:03d} {i:04d}__{safe.replace(' ', '_')}_(USA).nds" if i % 2 else f"{safe} (EU).nds"
+        (tmp_path / name).write_text('x')
+    (tmp_path / 'Zelda.nds').write_text('x')  # short key contained in many targets
+
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl.match_threshold = threshold
+    dl._build_local_index()
+    assert dl._match_index is not None
+
+    queries = titles[::5] + ['(USA)', 'Z', 'Mario']
+    for q in queries:
+        expected = _linear_find_all(dl, q)
+        assert dl.find_all_matching_files(q) == expected, q
+        assert dl.is_game_present(q) == (expected[0] if expected else None), q
+
+
+@pytest.mark.parametrize('target, key, threshold', [
+    ('v i p', 'vip', 0.75),           # 'V.I.P.' after normalization: no shared word or trigram
+    ('abzcdwef', 'abxcdyef', 0.75),
+    ('eragon', 'rango', 0.65),
+])
+def test_pairs_without_shared_words_or_trigrams_still_match(target, key, threshold):
+    assert difflib.SequenceMatcher(None, target, key).ratio() >= threshold
+    index = LocalMatchIndex(['zelda', key, 'a much longer unrelated title'])
+
+    assert index.fuzzy_matches(target, threshold) == [1]
@@ -0,0 +1,41 @@
+from download_vimms import VimmsDownloader
+
+
+def _make_library(tmp_path):
+    for name in ['Super Mario 64 DS (USA).nds', '005 4426__Advance_Wars_Days_of_Ruin_(USA).nds', 'Tetris DS.nds']:
+        (tmp_path / name).write_text('x')
+
+
+def test_match_titles_agrees_with_find_all_matching_files(tmp_path):
+    _make_library(tmp_path)
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl._build_local_index()
+
+    names = ['Super Mario 64 DS', 'Advance Wars: Days of Ruin', 'Mario Kart DS', 'Super Mario 64 DS']
+    result = dl.match_titles(names)
+
+    assert set(result) == set(names)
+    for name in names:
+        assert result[name] == dl.find_all_matching_files(name)
+    assert {p.name for p in result['Super Mario 64 DS']} == {'Super Mario 64 DS (USA).nds'}
+    assert result['Mario Kart DS'] == []
+
+
+def test_match_titles_without_index_lists_directory_once(tmp_path, monkeypatch):
+    _make_library(tmp_path)
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=False)
+
+    calls = []
+    original_iterdir = type(dl.download_dir).iterdir
+
+    def counting_iterdir(self):
+        calls.append(self)
+        return original_iterdir(self)
+
+    monkeypatch.setattr(type(dl.download_dir), 'iterdir', counting_iterdir)
+
+    result = dl.match_titles(['Tetris DS', 'Tetris DS (EU)', 'Advance Wars: Days of Ruin'])
+    assert len(calls) == 1
+    assert {p.name for p in result['Tetris DS']} == {'Tetris DS.nds'}
+    assert result['Tetris DS (EU)'] == result['Tetris DS']
+    assert {p.name for p in result['Advance Wars: Days of Ruin']} == {'005 4426__Advance_Wars_Days_of_Ruin_(USA).nds'}
@@ -16,3 +16,12 @@ def dl(tmp_path):
 ])
 def test_normalize_for_match(dl, input_str, expected):
     assert dl._normalize_for_match(input_str) == expected
+
+
+def test_match_key_is_memoized_composition(dl):
+    from utils.filenames import match_key, clean_filename, normalize_for_match
+    name = "005 4426__Advance_Wars_Days_of_Ruin_(USA).nds"
+    assert match_key(name) == normalize_for_match(clean_filename(name)) == dl._match_key(name)
+    hits = match_key.cache_info().hits
+    match_key(name)
+    assert match_key.cache_info().hits == hits + 1
@@ -0,0 +1,152 @@
+import json
+import multiprocessing
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import download_vimms
+from download_vimms import VimmsDownloader
+from downloader_lib.matching import match_targets_for_keys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+
+def _make_downloader(tmp_path):
+    for name in ['Super Mario 64 DS (USA).nds', '005 4426__Advance_Wars_Days_of_Ruin_(USA).nds', 'Tetris DS.nds']:
+        (tmp_path / name).write_text('x')
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl._build_local_index()
+    return dl
+
+
+def test_match_targets_for_keys_agrees_with_match_titles(tmp_path):
+    dl = _make_downloader(tmp_path)
+    names = ['Super Mario 64 DS', 'Advance Wars: Days of Ruin', 'Mario Kart DS', 'Tetris']
+    targets = [dl._match_key(n) for n in names]
+
+    positions = match_targets_for_keys(dl._local_index_keys, targets, dl.match_threshold)
+    expected = dl.match_titles(names)
+
+    for name, pos in zip(names, positions):
+        paths = {dl.local_index[dl._local_index_keys[p]][0] for p in pos}
+        assert paths == set(expected[name])
+
+
+def test_match_targets_for_keys_runs_in_spawned_worker(tmp_path):
+    dl = _make_downloader(tmp_path)
+    targets = [dl._match_key(n) for n in ['Tetris DS', 'Mario Kart DS']]
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        remote = pool.submit(match_targets_for_keys, dl._local_index_keys, targets, dl.match_threshold).result()
+
+    assert remote == match_targets_for_keys(dl._local_index_keys, targets, dl.match_threshold)
+    assert remote[0] and not remote[1]
+
+
+LOCAL_FILES = {
+    'DS': ['Super Mario 64 DS (USA).nds', '005 4426__Advance_Wars_Days_of_Ruin_(USA).nds', 'Tetris DS.nds'],
+    'GBA': ['Golden Sun (USA).gba'],
+}
+CATALOG = {
+    'DS': {'A': ['Advance Wars: Days of Ruin'], 'M': ['Mario Kart DS'], 'S': ['Super Mario 64 DS'], 'T': ['Tetris DS']},
+    'GBA': {'A': [], 'M': ['Metroid Fusion'], 'S': [], 'T': []},
+}
+
+
+class _BrokenPool:
+    """Accepts jobs but every worker fails (e.g. it died or could not import)."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(RuntimeError('worker died'))
+        return future
+
+
+def _webapp_worker_started():
+    # Runs in a spawned pool worker
+    import webapp
+    return webapp.worker_thread is not None
+
+
+def _build_fast_index(tmp_path, monkeypatch):
+    import webapp
+
+    workspace = tmp_path / 'games'
+    for console, names in LOCAL_FILES.items():
+        roms = workspace / console / 'ROMs'
+        roms.mkdir(parents=True)
+        for name in names:
+            (roms / name).write_text('x')
+    game_id = iter(range(1, 100))
+    catalog = {'consoles': {console: {'sections': {
+        section: [{'id': str(next(game_id)), 'name': name, 'url': ''} for name in names]
+        for section, names in sections.items()}} for console, sections in CATALOG.items()}}
+    (tmp_path / 'remote.json').write_text(json.dumps(catalog))
+
+    monkeypatch.chdir(tmp_path)  # no vimms_config.json: only the folders above
+    monkeypatch.setattr(webapp, 'REMOTE_CATALOG_FILE', tmp_path / 'remote.json')
+    monkeypatch.setattr(webapp, 'INDEX_FILE', tmp_path / 'index.json')
+    monkeypatch.setattr(webapp, 'SECTIONS', ['A', 'M', 'S', 'T'])
+    monkeypatch.setattr(webapp, 'CACHED_INDEX', None)
+    monkeypatch.setattr(webapp, 'DL_INSTANCES', {})
+    monkeypatch.setattr(download_vimms, 'CONSOLE_MAP', {'DS': 'DS', 'GBA': 'GBA'})
+
+    webapp.api_index_build_fast_internal(str(workspace))
+
+    index = json.loads((tmp_path / 'index.json').read_text())
+    flags = {c['name']: {g['name']: g['present'] for games in c['sections'].values() for g in games}
+             for c in index['consoles']}
+    streamed = [c['name'] for c in webapp.INDEX_PROGRESS['partial_consoles']]
+    return flags, streamed
+
+
+@pytest.mark.parametrize('failure', ['pool_unavailable', 'worker_failed'])
+def test_index_build_presence_is_the_same_with_and_without_the_pool(tmp_path, monkeypatch, failure):
+    import webapp
+
+    pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        monkeypatch.setattr(webapp, 'MATCH_POOL', pool)
+        pooled, streamed = _build_fast_index(tmp_path / 'pool', monkeypatch)
+        # Pool workers import the web app without starting its queue worker
+        assert pool.submit(_webapp_worker_started).result() is False
+    finally:
+        pool.shutdown()
+
+    if failure == 'pool_unavailable':
+        def no_pool():
+            raise RuntimeError('cannot start workers')
+        monkeypatch.setattr(webapp, '_get_match_pool', no_pool)
+    else:
+        monkeypatch.setattr(webapp, 'MATCH_POOL', _BrokenPool())
+    in_process, streamed_in_process = _build_fast_index(tmp_path / 'fallback', monkeypatch)
+
+    assert pooled == in_process
+    assert pooled['DS'] == {'Advance Wars: Days of Ruin': True, 'Mario Kart DS': False,
+                            'Super Mario 64 DS': True, 'Tetris DS': True}
+    assert pooled['GBA'] == {'Metroid Fusion': False}
+    # Every console reaches the progressive UI once its matching finished
+    assert sorted(streamed) == sorted(streamed_in_process) == ['DS', 'GBA']
+
+
+def test_finish_presence_jobs_publishes_finished_jobs_and_keeps_the_rest():
+    import webapp
+
+    class Job:
+        def __init__(self, finished):
+            self.finished = finished
+
+        def done(self):
+            return self.finished
+
+    published = []
+    pending = [(Job(False), 'DS'), (Job(True), 'GBA'), (Job(False), 'PSP')]
+
+    remaining = webapp._finish_presence_jobs(pending, lambda job, name: published.append(name))
+    assert published == ['GBA']
+    assert [name for _, name in remaining] == ['DS', 'PSP']
+
+    assert webapp._finish_presence_jobs(remaining, lambda job, name: published.append(name), wait=True) == []
+    assert published == ['GBA', 'DS', 'PSP']
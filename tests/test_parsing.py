@@ -1,5 +1,5 @@
 from pathlib import Path
-from downloader_lib.parse import parse_games_from_section, resolve_download_form
+from downloader_lib.parse import parse_games_from_section, parse_section_page, resolve_download_form
 import requests
 from types import SimpleNamespace
 
@@ -26,3 +26,12 @@ def test_resolve_download_form_post():
 
     url = resolve_download_form(html, session, 'http://example.com', '123', logger=None)
     assert url == 'https://dl3.vimm.net/?mediaId=6590'
+
+def test_parse_section_page_returns_games_and_pager():
+    html = (FIXTURES / 'section_page.html').read_text()
+    games, has_next = parse_section_page(html, 'A')
+    assert games == parse_games_from_section(html, 'A')
+    assert has_next is True
+
+    last_page = html.replace('>Next<', '>Previous<')
+    assert parse_section_page(last_page, 'A') == (games, False)
@@ -0,0 +1,65 @@
+import os
+
+from download_vimms import VimmsDownloader
+from downloader_lib.local_index import LocalTreeScanner, CACHE_FILENAME
+
+OLD = 1_600_000_000  # a fixed mtime well in the past, so cached listings are trusted
+
+
+def _age(*paths):
+    for p in paths:
+        os.utime(p, (OLD, OLD))
+
+
+def _make_library(root):
+    (root / 'Mario Kart DS').mkdir()
+    (root / 'Mario Kart DS' / 'Mario Kart DS (USA).nds').write_text('x')
+    (root / 'Tetris DS (EU).nds').write_text('x')
+    (root / 'notes.txt').write_text('x')
+    _age(root / 'Mario Kart DS', root)
+
+
+def _scan(root):
+    scanner = LocalTreeScanner(root, ['.nds'], str.lower, cache_path=root / CACHE_FILENAME)
+    listing = [(str(d), dirs, files) for d, dirs, files in scanner.walk()]
+    scanner.save()
+    return scanner, listing
+
+
+def test_unchanged_folders_are_served_from_cache(tmp_path):
+    _make_library(tmp_path)
+    first, listing = _scan(tmp_path)
+    assert first.dirs_scanned == 2
+    _age(tmp_path)  # creating the cache file touched the root folder
+
+    second, cached_listing = _scan(tmp_path)
+    assert (second.dirs_scanned, second.dirs_reused) == (0, 2)
+    assert cached_listing == listing
+    assert [f for _, _, files in listing for f, _ in files] == ['Tetris DS (EU).nds', 'Mario Kart DS (USA).nds']
+
+
+def test_changed_folder_is_rescanned(tmp_path):
+    _make_library(tmp_path)
+    _scan(tmp_path)
+    _age(tmp_path)
+
+    (tmp_path / 'Mario Kart DS' / 'Mario Kart DS (EU).nds').write_text('x')
+    os.utime(tmp_path / 'Mario Kart DS', (OLD + 10, OLD + 10))
+
+    scanner, listing = _scan(tmp_path)
+    assert (scanner.dirs_scanned, scanner.dirs_reused) == (1, 1)
+    sub = dict((d, files) for d, _, files in listing)[str(tmp_path / 'Mario Kart DS')]
+    assert sorted(f for f, _ in sub) == ['Mario Kart DS (EU).nds', 'Mario Kart DS (USA).nds']
+
+
+def test_downloader_index_uses_cache(tmp_path):
+    _make_library(tmp_path)
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl._build_local_index()
+    assert (tmp_path / CACHE_FILENAME).exists()
+    before = dl.local_index
+
+    dl._build_local_index()
+    assert dl.local_index == before
+    assert dl.is_game_present('Mario Kart DS') is not None
+    assert dl.is_game_present('Tetris DS') == tmp_path / 'Tetris DS (EU).nds'
@@ -0,0 +1,160 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from download_vimms import VimmsDownloader
+from downloader_lib.rate_limit import AdaptiveTokenBucket, TokenBucket, retry_after_seconds, shared_limiter
+
+
+def test_token_bucket_enforces_rate_across_threads():
+    bucket = TokenBucket(rate=50, burst=2)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 20 requests with a burst of 2: at least 18 refills at 50/s
+    assert len(stamps) == 20
+    assert max(stamps) - start >= 18 / 50 * 0.9
+
+
+def test_shared_limiter_is_one_bucket():
+    a = shared_limiter(5, 1)
+    b = shared_limiter(7, 2)
+    assert a is b
+    assert (b.rate, b.burst) == (7, 2)
+
+
+def test_adaptive_bucket_increases_additively_and_halves_on_429(tmp_path):
+    bucket = AdaptiveTokenBucket(1.0, min_rate=0.2, max_rate=2.0, increase=0.1, cooldown=60)
+    for _ in range(5):
+        bucket.record(200)
+    assert abs(bucket.rate - 1.5) < 1e-9
+    bucket.record(429)
+    assert abs(bucket.rate - 0.75) < 1e-9
+    # Other 429s/5xx from the same burst don't compound the decrease
+    bucket.record(503)
+    assert abs(bucket.rate - 0.75) < 1e-9
+    # 404 says nothing about load
+    bucket.record(404)
+    assert abs(bucket.rate - 0.75) < 1e-9
+    for _ in range(50):
+        bucket.record(304)
+    assert bucket.rate == 2.0
+    assert bucket.stats == {'increases': 55, 'decreases': 1}
+
+
+def test_retry_after_pauses_every_request():
+    bucket = AdaptiveTokenBucket(100, burst=5)
+    assert bucket.record(429, {'Retry-After': '0.2'}) == 0.2
+    assert bucket.reserve() >= 0.19
+    assert retry_after_seconds({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0.0
+    assert retry_after_seconds({'Retry-After': 'soon'}) is None
+    assert retry_after_seconds({}) is None
+
+
+def test_learned_rate_persists_between_runs(tmp_path):
+    state = tmp_path / 'rate.json'
+    first = AdaptiveTokenBucket(1.0, max_rate=4.0, increase=0.5, state_path=state)
+    first.record(200)
+    first.record(200)
+    first.save()
+    assert AdaptiveTokenBucket(1.0, max_rate=4.0, state_path=state).rate == 2.0
+    # The saved rate is kept within the configured bounds
+    assert AdaptiveTokenBucket(1.0, max_rate=1.5, state_path=state).rate == 1.5
+
+
+def test_shared_adaptive_limiter_keeps_learned_rate(tmp_path):
+    adaptive = {'min_rate': 0.2, 'max_rate': 3.0}
+    bucket = shared_limiter(1.0, 2, adaptive=adaptive, state_path=tmp_path / 'rate.json')
+    assert isinstance(bucket, AdaptiveTokenBucket)
+    bucket.record(200)
+    learned = bucket.rate
+    assert learned > 1.0
+    # Another downloader with the same settings must not reset it
+    assert shared_limiter(1.0, 2, adaptive=adaptive).rate == learned
+
+
+def test_settings_change_keeps_learned_rate_within_new_bounds(tmp_path):
+    bucket = shared_limiter(1.0, 2, adaptive={'min_rate': 0.2, 'max_rate': 3.0}, state_path=tmp_path / 'rate.json')
+    for _ in range(10):
+        bucket.record(200)
+    learned = bucket.rate
+    assert learned > 1.0
+
+    # A reload with another starting rate and burst only changes the burst and bounds
+    again = shared_limiter(0.5, 5, adaptive={'min_rate': 0.2, 'max_rate': 3.0})
+    assert again is bucket
+    assert (again.rate, again.burst) == (learned, 5)
+    # Narrower bounds clamp the learned rate instead of resetting it
+    assert shared_limiter(0.5, 5, adaptive={'min_rate': 0.2, 'max_rate': 1.2}).rate == 1.2
+
+
+def test_iter_section_game_lists_keeps_section_order(tmp_path, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=False, pre_scan=False)
+    dl.fetch_workers = 3
+    delays = {'A': 0.05, 'B': 0.0, 'C': 0.02}
+    threads = set()
+
+    def fake_list(section):
+        threads.add(threading.get_ident())
+        time.sleep(delays[section])
+        return [{'name': f'{section} game', 'game_id': section}]
+
+    monkeypatch.setattr(dl, 'get_game_list_from_section', fake_list)
+    result = list(dl.iter_section_game_lists(['A', 'B', 'C']))
+
+    assert [s for s, _ in result] == ['A', 'B', 'C']
+    assert [g[0]['game_id'] for _, g in result] == ['A', 'B', 'C']
+    assert len(threads) > 1
+
+
+def _draw_tokens(path, start_at, count, out):
+    bucket = TokenBucket(rate=20, burst=1, shared_path=path)
+    time.sleep(max(0.0, start_at - time.time()))
+    stamps = []
+    for _ in range(count):
+        bucket.acquire()
+        stamps.append(time.time())
+    out.put(stamps)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork start method')
+def test_shared_budget_holds_rate_across_processes(tmp_path):
+    ctx = multiprocessing.get_context('fork')
+    out = ctx.Queue()
+    start_at = time.time() + 0.5
+    procs = [ctx.Process(target=_draw_tokens, args=(tmp_path / 'budget.json', start_at, 4, out)) for _ in range(3)]
+    for p in procs:
+        p.start()
+    stamps = sorted(s for _ in procs for s in out.get(timeout=30))
+    for p in procs:
+        p.join()
+
+    # 12 requests from 3 processes: no window may hold more than burst + rate * window
+    assert len(stamps) == 12
+    for i in range(len(stamps)):
+        for j in range(i + 1, len(stamps)):
+            assert j - i <= 1 + (stamps[j] - stamps[i]) * 20 + 1
+
+
+def test_shared_budget_pause_reaches_other_buckets(tmp_path):
+    a = TokenBucket(rate=1, burst=5, shared_path=tmp_path / 'budget.json')
+    b = TokenBucket(rate=1, burst=5, shared_path=tmp_path / 'budget.json')
+    a.pause(5)
+    # Only reserved, never slept: leaves seconds of slack for slow file locking
+    assert b.reserve() >= 4
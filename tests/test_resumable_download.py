@@ -0,0 +1,125 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from download_vimms import VimmsDownloader
+from downloader_lib.resumable import PartialDownload
+
+BODY = bytes(range(256)) * 1024  # 256 KiB
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests_seen = []
+    supports_ranges = True
+    etag = '"v1"'
+    cut_after = None  # bytes sent before dropping the connection on the next response
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests_seen.append(dict(self.headers))
+        start = 0
+        rng = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if cls.supports_ranges and rng and (if_range is None or if_range == cls.etag):
+            start = int(rng.split('=')[1].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(BODY) - 1}/{len(BODY)}')
+        else:
+            self.send_response(200)
+        body = BODY[start:]
+        self.send_header('Content-Type', 'application/x-7z-compressed')
+        self.send_header('Content-Disposition', 'attachment; filename="Some Game.7z"')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', cls.etag)
+        self.end_headers()
+        if cls.cut_after is not None:
+            self.wfile.write(body[:cls.cut_after])
+            cls.cut_after = None
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.requests_seen = []
+    _Handler.supports_ranges = True
+    _Handler.etag = '"v1"'
+    _Handler.cut_after = None
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}/?mediaId=42'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _downloader(tmp_path, url, monkeypatch):
+    dl = VimmsDownloader(str(tmp_path), system='PS2', detect_existing=False, pre_scan=False,
+                         extract_files=False, project_root=str(tmp_path))
+    dl.retry_delay = 0
+    dl.delay_between_downloads = (0, 0)
+    monkeypatch.setattr(dl, 'get_download_url', lambda page_url, game_id: url)
+    return dl
+
+
+GAME = {'game_id': '42', 'name': 'Some Game', 'page_url': 'https://vimm.net/vault/42', 'section': 'S'}
+
+
+def test_interrupted_download_resumes_with_range(tmp_path, server, monkeypatch):
+    dl = _downloader(tmp_path, server, monkeypatch)
+    _Handler.cut_after = 12 * 8192
+
+    assert dl.download_game(GAME)
+
+    assert (tmp_path / 'Some Game.7z').read_bytes() == BODY
+    assert len(_Handler.requests_seen) == 2
+    assert _Handler.requests_seen[1]['Range'] == 'bytes=98304-'
+    assert _Handler.requests_seen[1]['If-Range'] == '"v1"'
+    assert not (tmp_path / '42.part').exists() and not (tmp_path / '42.part.json').exists()
+
+
+def test_part_from_an_earlier_run_is_resumed(tmp_path, server, monkeypatch):
+    part = PartialDownload(tmp_path, '42')
+    part.path.write_bytes(BODY[:5000])
+    part.meta = {'url': server, 'filename': 'Some Game.7z', 'length': len(BODY), 'etag': '"v1"', 'last_modified': None}
+    part.save()
+
+    assert _downloader(tmp_path, server, monkeypatch).download_game(GAME)
+
+    assert _Handler.requests_seen[0]['Range'] == 'bytes=5000-'
+    assert (tmp_path / 'Some Game.7z').read_bytes() == BODY
+
+
+@pytest.mark.parametrize('change', ['no_ranges', 'new_etag'])
+def test_falls_back_to_a_full_download(tmp_path, server, monkeypatch, change):
+    part = PartialDownload(tmp_path, '42')
+    part.path.write_bytes(b'stale bytes')
+    part.meta = {'url': server, 'filename': 'Some Game.7z', 'length': len(BODY), 'etag': '"v1"', 'last_modified': None}
+    part.save()
+    if change == 'no_ranges':
+        _Handler.supports_ranges = False
+    else:
+        _Handler.etag = '"v2"'
+
+    assert _downloader(tmp_path, server, monkeypatch).download_game(GAME)
+
+    assert len(_Handler.requests_seen) == 1
+    assert (tmp_path / 'Some Game.7z').read_bytes() == BODY
+
+
+def test_short_part_is_not_renamed_into_place(tmp_path, server, monkeypatch):
+    dl = _downloader(tmp_path, server, monkeypatch)
+    dl.max_retries = 1
+    _Handler.cut_after = 12 * 8192
+
+    assert not dl.download_game(GAME)
+
+    assert not (tmp_path / 'Some Game.7z').exists()
+    assert (tmp_path / '42.part').stat().st_size == 12 * 8192
+    assert PartialDownload(tmp_path, '42').request_headers(server) == {'Range': 'bytes=98304-', 'If-Range': '"v1"'}
@@ -0,0 +1,185 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from download_vimms import VimmsDownloader
+from downloader_lib.rate_limit import TokenBucket
+from downloader_lib.segmented import plan_segments
+
+BODY = bytes(range(256)) * 4096  # 1 MiB
+PIECE = 64 * 1024
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    supports_ranges = True
+    requests_seen = 0
+    probes = 0
+    ranges_seen = []
+    active = 0
+    max_active = 0
+    cut_range = None  # first byte of a range whose response is dropped halfway
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        rng = self.headers.get('Range') if cls.supports_ranges else None
+        with cls.lock:
+            cls.requests_seen += 1
+        if rng is None:
+            start, end = 0, len(BODY) - 1
+            self.send_response(200)
+        else:
+            first, last = rng.split('=')[1].split('-')
+            start, end = int(first), int(last) if last else len(BODY) - 1
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(BODY)}')
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Disposition', 'attachment; filename="Disc Game.7z"')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('ETag', '"disc"')
+        self.end_headers()
+        body = BODY[start:end + 1]
+        if rng is None or rng == 'bytes=0-0':
+            if rng:
+                cls.probes += 1
+            self.wfile.write(body)
+            return
+
+        with cls.lock:
+            cls.ranges_seen.append((start, end))
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            if cls.cut_range == start:
+                cls.cut_range = None
+                self.wfile.write(body[:len(body) // 2 // PIECE * PIECE])
+                self.close_connection = True
+                return
+            for i in range(0, len(body), PIECE):
+                self.wfile.write(body[i:i + PIECE])
+                time.sleep(0.01)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _RangeHandler.supports_ranges = True
+    _RangeHandler.requests_seen = _RangeHandler.probes = 0
+    _RangeHandler.ranges_seen = []
+    _RangeHandler.active = _RangeHandler.max_active = 0
+    _RangeHandler.cut_range = None
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _RangeHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}/?mediaId=7'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+GAME = {'game_id': '7', 'name': 'Disc Game', 'page_url': 'https://vimm.net/vault/7', 'section': 'D'}
+
+
+class _CountingBucket(TokenBucket):
+    def __init__(self):
+        super().__init__(rate=1000, burst=100)
+        self.acquired = 0
+
+    def acquire(self):
+        with _RangeHandler.lock:
+            self.acquired += 1
+        return super().acquire()
+
+
+def _downloader(tmp_path, url, monkeypatch, system='PS2', segments=4, min_size_mb=0, connections=8):
+    (tmp_path / 'vimms_config.json').write_text(json.dumps({'network': {
+        'download_connections': connections,
+        'segmented_download': {'enabled': True, 'segments': segments, 'min_size_mb': min_size_mb},
+    }}))
+    dl = VimmsDownloader(str(tmp_path), system=system, detect_existing=False, pre_scan=False,
+                         extract_files=False, project_root=str(tmp_path))
+    dl.retry_delay = 0
+    dl.delay_between_downloads = (0, 0)
+    dl.rate_limiter = _CountingBucket()
+    monkeypatch.setattr(dl, 'get_download_url', lambda page_url, game_id: url)
+    return dl
+
+
+def test_plan_covers_the_file_in_contiguous_ranges():
+    assert plan_segments(10, 3) == [[0, 3, 0], [4, 6, 0], [7, 9, 0]]
+    assert plan_segments(2, 4) == [[0, 0, 0], [1, 1, 0]]
+
+
+def test_large_7z_is_fetched_in_parallel_ranges(tmp_path, server, monkeypatch):
+    dl = _downloader(tmp_path, server, monkeypatch)
+    assert dl.download_game(GAME)
+
+    assert (tmp_path / 'Disc Game.7z').read_bytes() == BODY
+    # One byte probed the size, then four ranges, each through the request budget
+    assert _RangeHandler.probes == 1
+    assert sorted(_RangeHandler.ranges_seen) == [(i * 262144, (i + 1) * 262144 - 1) for i in range(4)]
+    assert 1 < _RangeHandler.max_active <= 4
+    assert dl.rate_limiter.acquired == _RangeHandler.requests_seen == 5
+    assert not (tmp_path / '7.part').exists() and not (tmp_path / '7.part.json').exists()
+
+
+def test_segment_count_comes_from_the_config(tmp_path, server, monkeypatch):
+    dl = _downloader(tmp_path, server, monkeypatch, segments=6)
+    assert dl.download_game(GAME)
+
+    assert len(_RangeHandler.ranges_seen) == 6
+    assert _RangeHandler.max_active <= 6
+    assert dl.rate_limiter.acquired == 7
+
+
+def test_segments_stay_within_the_per_host_connection_budget(tmp_path, server, monkeypatch):
+    dl = _downloader(tmp_path, server, monkeypatch, segments=6, connections=3)
+    assert dl.download_segments == 3
+    assert dl.download_game(GAME)
+
+    assert len(_RangeHandler.ranges_seen) == 3
+    assert _RangeHandler.max_active <= 3
+
+
+def test_small_file_is_fetched_in_one_range(tmp_path, server, monkeypatch):
+    assert _downloader(tmp_path, server, monkeypatch, min_size_mb=256).download_game(GAME)
+
+    assert _RangeHandler.ranges_seen == [(0, len(BODY) - 1)]
+    assert (tmp_path / 'Disc Game.7z').read_bytes() == BODY
+
+
+def test_server_ignoring_the_probe_range_streams_its_reply(tmp_path, server, monkeypatch):
+    _RangeHandler.supports_ranges = False
+
+    assert _downloader(tmp_path, server, monkeypatch).download_game(GAME)
+
+    assert _RangeHandler.requests_seen == 1
+    assert (tmp_path / 'Disc Game.7z').read_bytes() == BODY
+
+
+def test_other_systems_stream_in_one_request(tmp_path, server, monkeypatch):
+    assert _downloader(tmp_path, server, monkeypatch, system='DS').download_game(GAME)
+
+    assert _RangeHandler.requests_seen == 1 and _RangeHandler.probes == 0
+    assert (tmp_path / 'Disc Game.7z').read_bytes() == BODY
+
+
+def test_interrupted_segment_is_continued_on_retry(tmp_path, server, monkeypatch):
+    _RangeHandler.cut_range = 262144
+
+    assert _downloader(tmp_path, server, monkeypatch).download_game(GAME)
+
+    assert (tmp_path / 'Disc Game.7z').read_bytes() == BODY
+    # Four segments, then (after a new probe) only the rest of the one that was cut off
+    assert _RangeHandler.probes == 2
+    assert len(_RangeHandler.ranges_seen) == 5
+    assert _RangeHandler.ranges_seen[-1] == (262144 + 131072, 2 * 262144 - 1)
@@ -0,0 +1,107 @@
+from download_vimms import VimmsDownloader
+from downloader_lib.session import DOWNLOAD_POOL_SIZE, VAULT_POOL_SIZE, new_session, shared_session
+
+
+def test_downloaders_share_one_session(tmp_path):
+    a = VimmsDownloader(str(tmp_path / 'a'), 'DS', project_root=str(tmp_path))
+    b = VimmsDownloader(str(tmp_path / 'b'), 'GBA', project_root=str(tmp_path))
+    assert a.session is b.session is shared_session()
+    # The adapters are built once; a later caller does not remount the live session
+    adapter = a.session.get_adapter('https://dl3.vimm.net/')
+    assert shared_session(DOWNLOAD_POOL_SIZE * 4).get_adapter('https://dl3.vimm.net/') is adapter
+
+
+def test_download_pool_holds_the_per_host_connection_budget():
+    assert new_session(download_connections=2).get_adapter('https://dl.vimm.net/')._pool_maxsize == 2
+
+
+def test_host_groups_get_their_own_pool_and_retry_policy():
+    session = new_session()
+    vault = session.get_adapter('https://vimm.net/vault/DS/A')
+    download = session.get_adapter('https://dl3.vimm.net/?mediaId=1')
+    assert vault is not download
+    assert vault._pool_maxsize == VAULT_POOL_SIZE
+    assert download._pool_maxsize == DOWNLOAD_POOL_SIZE
+
+    # Only transport errors are retried; statuses (429/5xx) go back to the rate limiter
+    assert vault.max_retries.connect > 0 and vault.max_retries.read > 0
+    assert vault.max_retries.status == 0
+    assert not vault.max_retries.status_forcelist
+    assert vault.max_retries.backoff_factor > 0
+    assert download.max_retries.connect > 0
+    assert not download.max_retries.status_forcelist
+    assert download.max_retries.read == 0
+
+    # Unknown hosts (other mirrors) fall back to the download policy
+    assert session.get_adapter('https://dl9.vimm.net/') is download
+
+
+def test_vault_statuses_reach_the_caller_without_replays():
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    hits = []
+
+    class Unavailable(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = HTTPServer(('127.0.0.1', 0), Unavailable)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    session = new_session()
+    url = f'http://127.0.0.1:{httpd.server_port}/vault/DS'
+    session.mount(url, session.get_adapter('https://vimm.net/vault/DS'))
+    try:
+        assert session.get(url).status_code == 503
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    # One request: the limiter sees the 503 and decides about retrying
+    assert hits == ['/vault/DS']
+
+
+def test_page_fetches_retry_statuses_through_the_limiter(monkeypatch):
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    from downloader_lib import fetch
+    from downloader_lib.rate_limit import TokenBucket
+
+    statuses = [503, 200]
+
+    class Flaky(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(statuses.pop(0))
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args):
+            pass
+
+    class Recording(TokenBucket):
+        seen = []
+
+        def record(self, status, headers=None):
+            self.seen.append(status)
+            return super().record(status, headers)
+
+    monkeypatch.setattr(fetch, 'RETRY_BACKOFF', 0)
+    httpd = HTTPServer(('127.0.0.1', 0), Flaky)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    limiter = Recording(rate=1000, burst=10)
+    try:
+        response = fetch.fetch_game_page(new_session(), f'http://127.0.0.1:{httpd.server_port}/vault/1', limiter=limiter)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert response.text == 'ok'
+    assert limiter.seen == [503, 200]
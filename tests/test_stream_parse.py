@@ -0,0 +1,57 @@
+"""The streaming parsers must match the BeautifulSoup ones (parse.py) on the fixtures."""
+from pathlib import Path
+
+import pytest
+
+from downloader_lib import parse, stream_parse
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+SECTION_PAGES = [
+    (FIXTURES / 'section_page.html').read_text(),
+    (Path(__file__).parent.parent / 'downloader_lib' / 'tests' / 'fixtures' / 'section.html').read_text(encoding='utf-8'),
+    '''<div><a href="/x">Menu</a></div>
+    <table class="other"><tr><td><a href="/vault/1">Not a game</a></td></tr></table>
+    <table class="rounded  centered cellpadding1 hovertable striped">
+      <tr><th>Title</th><th>Region</th></tr>
+      <tr><td><a href="/vault/18376">Ace Attorney &amp; Co <b>(USA)</b></a> <i>x</i></td>
+          <td>USA</td><td>1</td><td>EN</td><td> 8.4 </td></tr>
+      <tr><td><a href="/vault/18378">No Rating</a></td><td>USA</td><td>1</td><td>EN</td><td>none</td></tr>
+      <tr><td>No link</td><td>1</td></tr>
+      <tr><td><a>No href</a></td></tr>
+      <tr><td><a href="/vault/5">Short row</a></td><td>EU</td></tr>
+    </table>
+    <a href="?page=3">&laquo; Previous</a>''',
+]
+GAME_PAGES = [
+    (FIXTURES / 'game_page_post.html').read_text(),
+    '<form id="dl_form" action="/download/?x=1" method="GET"><input name="mediaId" value="42"><input name="alt" value="1"></form>',
+    '<form id="dl_form" method="POST" action="//dl3.vimm.net/"><input name="MEDIAID" value="7"><input name="alt" value="2"></form>',
+    '<p>Size: 12.5 MB (.nds)</p><a href="/dl?mediaId=99">Download</a>',
+    '<input name="mediaid" value="55"><div class="game-rating"><img src="/star.png"><div><img src="star2.png"></div></div>',
+    '<div class="score">none</div><p>8.5 out of 10</p>',
+    '<p>Rated 7/10</p>',
+]
+
+
+@pytest.mark.parametrize('html', SECTION_PAGES)
+def test_section_pages_match(html):
+    assert stream_parse.parse_section_page(html, 'A') == parse.parse_section_page(html, 'A')
+
+
+def test_section_fixture_contents():
+    games, has_next = stream_parse.parse_section_page(SECTION_PAGES[0], 'A')
+    assert [(g['name'], g['game_id']) for g in games] == [('Game 1', '1'), ('Game 2', '2')]
+    assert has_next is True
+    assert stream_parse.parse_games_from_section(SECTION_PAGES[2], 'A')[0]['rating'] == 8.4
+
+
+@pytest.mark.parametrize('html', GAME_PAGES)
+def test_game_pages_match(html):
+    assert stream_parse.parse_game_details(html) == parse.parse_game_details(html)
+    assert (stream_parse.resolve_download_form(html, None, 'https://vimm.net/vault/1', '1', None)
+            == parse.resolve_download_form(html, None, 'https://vimm.net/vault/1', '1', None))
+
+
+def test_post_form_fixture_resolves():
+    url = stream_parse.resolve_download_form(GAME_PAGES[0], None, 'https://vimm.net/vault/7818', '6590', None)
+    assert url == 'https://dl3.vimm.net/?mediaId=6590'
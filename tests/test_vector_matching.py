@@ -0,0 +1,40 @@
+import pytest
+
+from download_vimms import VimmsDownloader
+from downloader_lib import vector_matching
+from test_match_index_parity import _catalog_titles
+
+
+def _library(tmp_path, titles):
+    for i, title in enumerate(titles[::12]):
+        safe = ''.join(ch for ch in title if ch not in '<>:"/\\|?*')
+        (tmp_path / f"{safe} ({i}).nds").write_text('x')
+
+
+def test_vector_backend_agrees_with_index(tmp_path):
+    pytest.importorskip('numpy')
+    titles = _catalog_titles()
+    _library(tmp_path, titles)
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl._build_local_index()
+
+    queries = titles[::3]
+    expected = dl.match_titles(queries)
+    dl.match_backend = 'vector'
+    got = dl.match_titles(queries)
+    assert dl._vector_index is not None
+
+    differing = [q for q in queries if set(got[q]) != set(expected[q])]
+    # Candidates are confirmed with difflib, so the backend can only drop matches
+    assert all(set(got[q]) <= set(expected[q]) for q in queries)
+    assert len(differing) <= len(queries) // 100
+
+
+def test_vector_backend_falls_back_without_numpy(tmp_path, monkeypatch):
+    (tmp_path / 'Tetris DS.nds').write_text('x')
+    dl = VimmsDownloader(str(tmp_path), system='DS', detect_existing=True, pre_scan=True)
+    dl._build_local_index()
+    dl.match_backend = 'vector'
+    monkeypatch.setattr(vector_matching, 'np', None)
+    assert {p.name for p in dl.find_all_matching_files('Tetris DS')} == {'Tetris DS.nds'}
+    assert dl.match_backend == 'index'
@@ -1,5 +1,5 @@
 # Utilities package for vimms-downloader
-from .filenames import clean_filename, normalize_for_match
+from .filenames import clean_filename, normalize_for_match, match_key
 from .constants import ROM_EXTENSIONS, ARCHIVE_EXTENSIONS, USER_AGENTS
 
-__all__ = ["clean_filename", "normalize_for_match", "ROM_EXTENSIONS", "ARCHIVE_EXTENSIONS", "USER_AGENTS"]
\ No newline at end of file
+__all__ = ["clean_filename", "normalize_for_match", "match_key", "ROM_EXTENSIONS", "ARCHIVE_EXTENSIONS", "USER_AGENTS"]
\ No newline at end of file
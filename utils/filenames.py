@@ -1,5 +1,24 @@
 import os
 import re
+from functools import lru_cache
+
+# Patterns used by clean_filename
+_NUMERIC_PREFIX_RE = re.compile(r'^\d{3}\s*\d{4}[_\s-]*')
+_PAREN_TAG_SPACED_RE = re.compile(r'\s*\([^)]*\)\s*')
+_BRACKET_TAG_SPACED_RE = re.compile(r"\s*\[[^\]]*\]\s*")
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Patterns used by normalize_for_match
+_EXTENSION_RE = re.compile(r"\.[a-z0-9]{1,5}$", re.IGNORECASE)
+_PAREN_TAG_RE = re.compile(r"\([^)]*\)")
+_BRACKET_TAG_RE = re.compile(r"\[[^\]]*\]")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9 ]+")
+
+_UPPER_WORDS = {'LEGO', 'USA', 'EU', 'UK', 'DS', 'III', 'II', 'I', 'NES', 'SNES', 'GBA', 'GBC', 'PSP', 'PS1', 'PS2', 'PS3', 'N64', 'GC'}
+_LOWER_WORDS = {'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'on'}
+
+# Upper bound on memoized match keys (a few MB; larger than any single console library)
+MATCH_KEY_CACHE_SIZE = 65536
 
 
 def clean_filename(filename: str) -> str:
@@ -10,25 +29,25 @@ def clean_filename(filename: str) -> str:
     name, ext = os.path.splitext(filename)
 
     # Remove leading numeric prefix like '### ####' (may be followed by underscores/spaces)
-    name = re.sub(r'^\d{3}\s*\d{4}[_\s-]*', '', name)
+    name = _NUMERIC_PREFIX_RE.sub('', name)
 
     # Replace underscores with spaces
     name = name.replace('_', ' ')
 
     # Remove region/language tags in parentheses or brackets
-    name = re.sub(r'\s*\([^)]*\)\s*', ' ', name)
-    name = re.sub(r"\s*\[[^\]]*\]\s*", ' ', name)
+    name = _PAREN_TAG_SPACED_RE.sub(' ', name)
+    name = _BRACKET_TAG_SPACED_RE.sub(' ', name)
 
     # Clean up extra whitespace
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WHITESPACE_RE.sub(' ', name).strip()
 
     # Fix common title casing heuristics
     words = name.split()
     cleaned = []
     for i, w in enumerate(words):
-        if w.upper() in ['LEGO', 'USA', 'EU', 'UK', 'DS', 'III', 'II', 'I', 'NES', 'SNES', 'GBA', 'GBC', 'PSP', 'PS1', 'PS2', 'PS3', 'N64', 'GC']:
+        if w.upper() in _UPPER_WORDS:
             cleaned.append(w.upper())
-        elif i > 0 and w.lower() in ['the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'on']:
+        elif i > 0 and w.lower() in _LOWER_WORDS:
             cleaned.append(w.lower())
         elif w.isupper() and len(w) > 3:
             cleaned.append(w.title())
@@ -44,12 +63,24 @@ def clean_filename(filename: str) -> str:
 def normalize_for_match(s: str) -> str:
     """Normalize strings for fuzzy matching: strip extension, remove tags, punctuation, and lowercase."""
     # Remove trailing extension
-    s = re.sub(r"\.[a-z0-9]{1,5}$", "", s, flags=re.IGNORECASE)
+    s = _EXTENSION_RE.sub("", s)
     # Strip parenthesized/bracketed tags
-    s = re.sub(r"\([^)]*\)", "", s)
-    s = re.sub(r"\[[^\]]*\]", "", s)
+    s = _PAREN_TAG_RE.sub("", s)
+    s = _BRACKET_TAG_RE.sub("", s)
     # Replace non-alphanumeric with space
-    s = re.sub(r"[^A-Za-z0-9 ]+", " ", s)
+    s = _NON_ALNUM_RE.sub(" ", s)
     s = s.lower().strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
\ No newline at end of file
+    s = _WHITESPACE_RE.sub(" ", s)
+    return s
+
+
+@lru_cache(maxsize=MATCH_KEY_CACHE_SIZE)
+def match_key(name: str) -> str:
+    """Return `normalize_for_match(clean_filename(name))`, memoized.
+
+    This is the key every local-matching path compares on (remote titles and local
+    filenames alike). The same names are normalized over and over (each index
+    build, each section scan, duplicate scoring), so results are cached in a
+    bounded LRU.
+    """
+    return normalize_for_match(clean_filename(name))